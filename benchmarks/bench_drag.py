@@ -0,0 +1,422 @@
+'''
+Headless drag & drop benchmarks.
+
+Drives synthetic drags through ``KXDraggableBehavior``, ``KXDroppableBehavior`` and ``KXReorderableBehavior`` and
+reports the per-move latency percentiles, the drag-start cost, the drop resolution cost and the allocations of each
+scenario as JSON.
+
+.. code-block:: console
+
+    $ python ./benchmarks/bench_drag.py --output result.json
+    $ python ./benchmarks/bench_drag.py --quick --compare baseline.json
+    $ python ./benchmarks/bench_drag.py --filter simultaneous --check-scaling
+
+``--check-scaling`` fails if the cost of a frame in the ``simultaneous`` scenario grows faster than linearly with the
+number of drags, which is one of the goals of the library (see "Many simultaneous drags" in the README).
+
+A window is required. On a machine without a display, run it under Xvfb (``xvfb-run python ...``).
+'''
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KCFG_GRAPHICS_MAXFPS', '0')  # Don't let the Clock sleep between frames.
+
+from kivy.base import EventLoop
+from kivy.factory import Factory as F
+from kivy.input.motionevent import MotionEvent
+import asynckivy
+import kivy
+
+import kivy_garden.draggable
+from kivy_garden.draggable import KXDraggableBehavior, KXDroppableBehavior, KXReorderableBehavior
+
+perf_counter = time.perf_counter
+
+
+class Item(KXDraggableBehavior, F.Widget):
+    pass
+
+
+class Reorderable(KXReorderableBehavior, F.BoxLayout):
+    pass
+
+
+class Droppable(KXDroppableBehavior, F.Widget):
+    pass
+
+
+class BenchTouch(MotionEvent):
+    '''A MotionEvent that is dispatched through the same path as the ones from the input providers.'''
+
+    _next_id = 0
+
+    def __init__(self, x, y):
+        win = EventLoop.window
+        BenchTouch._next_id += 1
+        super().__init__('BenchTouch', BenchTouch._next_id, self._to_args(win, x, y), is_touch=True, type_id='touch')
+        self.profile = ['pos']
+
+    @staticmethod
+    def _to_args(win, x, y):
+        return {'x': x / (win.width - 1.), 'y': y / (win.height - 1.)}
+
+    def depack(self, args):
+        self.sx = args['x']
+        self.sy = args['y']
+        super().depack(args)
+
+    def touch_down(self):
+        EventLoop.post_dispatch_input('begin', self)
+
+    def touch_move(self, x, y):
+        self.move(self._to_args(EventLoop.window, x, y))
+        EventLoop.post_dispatch_input('update', self)
+
+    def touch_up(self):
+        EventLoop.post_dispatch_input('end', self)
+
+
+def frame():
+    EventLoop.idle()
+
+
+def percentiles(samples) -> dict:
+    if not samples:
+        return {}
+    s = sorted(samples)
+    n = len(s)
+
+    def p(q):
+        return s[min(n - 1, int(q * n))] * 1000.
+    return {
+        'p50': p(.50), 'p90': p(.90), 'p99': p(.99), 'max': s[-1] * 1000.,
+        'mean': statistics.fmean(s) * 1000., 'n': n,
+    }
+
+
+@contextmanager
+def fresh_window():
+    win = EventLoop.window
+    for c in win.children[:]:
+        win.remove_widget(c)
+    try:
+        yield win
+    finally:
+        for c in win.children[:]:
+            win.remove_widget(c)
+        for __ in range(3):
+            frame()
+
+
+def run_drags(paths, *, n_frames_per_move=1, trace_allocations=False) -> dict:
+    '''
+    Performs drags simultaneously. ``paths`` is a list of lists of window coordinates, each of which is the path of a
+    single touch. The first point is where the touch goes down, and the last one is where it goes up.
+    '''
+    touches = [BenchTouch(*path[0]) for path in paths]
+    draggables_ended = []
+
+    t0 = perf_counter()
+    for t in touches:
+        t.touch_down()
+    frame()
+    drag_start = perf_counter() - t0
+    drags = [t.ud.get('kivyx_draggable') for t in touches]
+    for d in drags:
+        if d is not None:
+            d.fbind('on_drag_end', lambda *args: draggables_ended.append(None))
+
+    if trace_allocations:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+    dispatch_times = []
+    frame_times = []
+    n_moves = max(len(p) for p in paths) - 1
+    for i in range(1, n_moves + 1):
+        t0 = perf_counter()
+        for t, path in zip(touches, paths):
+            if i < len(path):
+                t.touch_move(*path[i])
+        t1 = perf_counter()
+        for __ in range(n_frames_per_move):
+            frame()
+        t2 = perf_counter()
+        dispatch_times.append(t1 - t0)
+        frame_times.append(t2 - t1)
+    if trace_allocations:
+        mem_after, mem_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    t0 = perf_counter()
+    for t in touches:
+        t.touch_up()
+    n_expected = sum(d is not None for d in drags)
+    for __ in range(100):
+        if len(draggables_ended) >= n_expected:
+            break
+        frame()
+    drop = perf_counter() - t0
+
+    result = {
+        'n_drags_started': n_expected,
+        'drag_start_ms': drag_start * 1000.,
+        'move_dispatch_ms': percentiles(dispatch_times),
+        'move_frame_ms': percentiles(frame_times),
+        'move_total_ms': percentiles([a + b for a, b in zip(dispatch_times, frame_times)]),
+        'drop_ms': drop * 1000.,
+    }
+    if trace_allocations:
+        result['alloc'] = {
+            'peak_kib': (mem_peak - mem_before) / 1024.,
+            'net_kib': (mem_after - mem_before) / 1024.,
+        }
+    return result
+
+
+def line(p0, p1, n_steps):
+    (x0, y0), (x1, y1) = p0, p1
+    return [(x0 + (x1 - x0) * i / n_steps, y0 + (y1 - y0) * i / n_steps) for i in range(n_steps + 1)]
+
+
+def run_twice(build, make_paths, **kwargs) -> dict:
+    '''Runs a scenario once for the timings and once more for the allocations.'''
+    with fresh_window() as win:
+        paths = make_paths(build(win))
+        result = run_drags(paths, **kwargs)
+    with fresh_window() as win:
+        paths = make_paths(build(win))
+        result['alloc'] = run_drags(paths, trace_allocations=True, **kwargs)['alloc']
+    return result
+
+
+# ---------------------------------------------------------------------------
+# scenarios
+# ---------------------------------------------------------------------------
+
+def scenario_reorder(n_children, n_moves):
+    '''Reorders an item within a single vertical reorderable.'''
+    def build(win):
+        r = Reorderable(
+            orientation='vertical', drag_classes=['item'], size_hint=(None, None),
+            width=200, pos=(0, 0), spacing=2, padding=2,
+        )
+        for __ in range(n_children):
+            r.add_widget(Item(drag_cls='item', drag_timeout=0, size_hint_y=None, height=20))
+        r.height = r.minimum_height
+        r.top = win.height
+        win.add_widget(r)
+        frame()
+        frame()
+        return r
+
+    def make_paths(r):
+        src = r.children[-1]
+        x, y = src.to_window(*src.center)
+        return [line((x, y), (x + 20, max(y - 500, r.y + 5)), n_moves)]
+    return run_twice(build, make_paths)
+
+
+def scenario_nested(n_columns, n_children, n_moves):
+    '''Moves an item between vertical reorderables that are children of a horizontal reorderable.'''
+    def build(win):
+        outer = Reorderable(drag_classes=['column'], size=win.size, spacing=4)
+        for __ in range(n_columns):
+            col = Reorderable(orientation='vertical', drag_classes=['item'], spacing=2)
+            for __ in range(n_children):
+                col.add_widget(Item(drag_cls='item', drag_timeout=0))
+            outer.add_widget(col)
+        win.add_widget(outer)
+        frame()
+        frame()
+        return outer
+
+    def make_paths(outer):
+        src = outer.children[-1].children[-1]
+        dst = outer.children[0]
+        return [line(src.to_window(*src.center), dst.to_window(*dst.center), n_moves)]
+    return run_twice(build, make_paths)
+
+
+def scenario_simultaneous(n_touches, n_children, n_moves):
+    '''
+    Performs N drags at the same time, each of which goes from the left reorderable to the right one. Reports the
+    cost of a frame per drag as well.
+    '''
+    def build(win):
+        root = F.BoxLayout(size=win.size)
+        left = Reorderable(orientation='vertical', drag_classes=['item'])
+        right = Reorderable(orientation='vertical', drag_classes=['item'])
+        for __ in range(n_children):
+            left.add_widget(Item(drag_cls='item', drag_timeout=0))
+        root.add_widget(left)
+        root.add_widget(right)
+        win.add_widget(root)
+        frame()
+        frame()
+        return root
+
+    def make_paths(root):
+        left, right = root.children[1], root.children[0]
+        paths = []
+        for src in left.children[:n_touches]:
+            x, y = src.to_window(*src.center)
+            paths.append(line((x, y), (right.center_x, y), n_moves))
+        return paths
+    result = run_twice(build, make_paths)
+    result['move_total_ms_per_drag'] = result['move_total_ms']['p50'] / n_touches
+    return result
+
+
+def scenario_drop_resolution(n_droppables, n_moves):
+    '''Drops an item onto one of many droppables.'''
+    def build(win):
+        root = F.GridLayout(size=win.size, cols=int(n_droppables ** .5) or 1)
+        for __ in range(n_droppables):
+            root.add_widget(Droppable(drag_classes=['item']))
+        win.add_widget(root)
+        item = Item(drag_cls='item', drag_timeout=0, size_hint=(None, None), size=(20, 20), pos=(0, 0))
+        win.add_widget(item)
+        frame()
+        frame()
+        return (root, item)
+
+    def make_paths(args):
+        root, item = args
+        return [line(item.center, root.center, n_moves)]
+    return run_twice(build, make_paths)
+
+
+def get_scenarios(quick):
+    sizes = (10, 100) if quick else (10, 1000, 10000)
+    n_moves = 20 if quick else 100
+    yield ('reorder', {'n_children': 10}, lambda: scenario_reorder(10, n_moves))
+    for n in sizes[1:]:
+        yield ('reorder', {'n_children': n}, lambda n=n: scenario_reorder(n, n_moves))
+    yield ('nested', {'n_columns': 4, 'n_children': 10}, lambda: scenario_nested(4, 10, n_moves))
+    # The number of children has to be large enough for the largest number of touches.
+    for k in ((1, 4, 16) if quick else (1, 5, 20, 40)):
+        yield ('simultaneous', {'n_touches': k, 'n_children': 40},
+               lambda k=k: scenario_simultaneous(k, 40, n_moves))
+    for n in ((10, 100) if quick else (10, 100, 1000)):
+        yield ('drop_resolution', {'n_droppables': n}, lambda n=n: scenario_drop_resolution(n, n_moves))
+
+
+def metadata() -> dict:
+    try:
+        from importlib.metadata import version
+        pkg_version = version('kivy-garden-draggable')
+    except Exception:
+        pkg_version = None
+    return {
+        'kivy_garden.draggable': pkg_version,
+        'kivy': kivy.__version__,
+        'asynckivy': getattr(asynckivy, '__version__', None),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    '''Prints the ratio of the p50 move latency and the drop cost against the baseline. Returns False on regression.'''
+    def key(r):
+        return (r['scenario'], json.dumps(r['params'], sort_keys=True))
+    base = {key(r): r for r in baseline['results']}
+    ok = True
+    print(f"{'scenario':<40} {'move p50':>10} {'drop':>10}")
+    for r in current['results']:
+        b = base.get(key(r))
+        if b is None:
+            continue
+        ratios = (
+            r['move_total_ms']['p50'] / max(b['move_total_ms']['p50'], 1e-9),
+            r['drop_ms'] / max(b['drop_ms'], 1e-9),
+        )
+        mark = ''
+        if any(v > threshold for v in ratios):
+            ok = False
+            mark = '  <-- regression'
+        name = r['scenario'] + ' ' + ','.join(f'{k}={v}' for k, v in r['params'].items())
+        print(f"{name:<40} {ratios[0]:>9.2f}x {ratios[1]:>9.2f}x{mark}")
+    return ok
+
+
+def check_scaling(report: dict, tolerance: float) -> bool:
+    '''
+    Prints the cost of a frame per drag in the ``simultaneous`` scenario. Returns False if the one with the most drags
+    exceeds the one with the fewest (but more than one) drags by more than ``tolerance`` times, which means the cost of
+    a frame grows faster than linearly. A single drag is left out as it doesn't move the other drags' spacers, thus is
+    much cheaper than the rest.
+    '''
+    results = sorted(
+        (r['params']['n_touches'], r['move_total_ms_per_drag'], )
+        for r in report['results'] if r['scenario'] == 'simultaneous' and r['params']['n_touches'] > 1
+    )
+    if len(results) < 2:
+        print('not enough results to check the scaling', file=sys.stderr)
+        return True
+    print(f"{'n_touches':>10} {'ms/drag':>10}")
+    for n, cost in results:
+        print(f"{n:>10} {cost:>10.3f}")
+    ratio = results[-1][1] / max(results[0][1], 1e-9)
+    ok = ratio <= tolerance
+    print(f"per-drag cost ratio: {ratio:.2f}x (tolerance: {tolerance:.2f}x){'' if ok else '  <-- superlinear'}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--output', '-o', help='path of the JSON file to write. (default: stdout)')
+    parser.add_argument('--quick', action='store_true', help='run smaller scenarios')
+    parser.add_argument('--filter', '-k', default='', help='run only the scenarios whose name contains this')
+    parser.add_argument('--compare', help='path of a JSON file produced by a previous run')
+    parser.add_argument(
+        '--check-scaling', action='store_true',
+        help='fail if the cost of a frame grows faster than linearly with the number of simultaneous drags')
+    parser.add_argument(
+        '--scaling-tolerance', type=float, default=1.5,
+        help='allowed ratio of the per-drag costs for --check-scaling. (default: 1.5)')
+    parser.add_argument(
+        '--threshold', type=float, default=1.2,
+        help='ratio against the baseline regarded as a regression. (default: 1.2)')
+    args = parser.parse_args(argv)
+
+    EventLoop.ensure_window()
+    results = []
+    for name, params, run in get_scenarios(args.quick):
+        if args.filter not in name:
+            continue
+        print(f"running {name} {params} ...", file=sys.stderr)
+        results.append({'scenario': name, 'params': params, **run()})
+    report = {'meta': metadata(), 'results': results}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(baseline, report, args.threshold):
+            return 1
+    if args.check_scaling and not check_scaling(report, args.scaling_tolerance):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,8 @@
-from functools import cached_property
-from kivy.properties import NumericProperty
 from kivy.app import App
 from kivy.lang import Builder
 from kivy.uix.label import Label
-import asynckivy as ak
 
 from kivy_garden.draggable import KXDraggableBehavior, KXDroppableBehavior
-from kivy_garden.draggable._impl import _rest_of_touch_events
 
 KV_CODE = '''
 <MyDroppable>:
@@ -15,7 +11,7 @@ KV_CODE = '''
     color: 1, .2, 1, .8
     canvas.before:
         Color:
-            rgba: 1, 1, 1, self.n_ongoing_drags_inside * 0.12
+            rgba: 1, 1, 1, self.n_drags_inside * 0.12
         Rectangle:
             pos: self.pos
             size: self.size
@@ -84,68 +80,11 @@ class MyDraggable(KXDraggableBehavior, Label):
         self.parent.remove_widget(self)
 
 
-class ReactiveDroppableBehavior(KXDroppableBehavior):
-    '''
-    ``KXDroppableBehavior`` + leaving/entering events.
-
-    .. note::
-
-        This class probably deserves to be an official component. But not now
-        because I'm not sure the word 'reactive' is appropriate to describe
-        its behavior.
-    '''
-    __events__ = ('on_drag_enter', 'on_drag_leave', )
-
-    @cached_property
-    def __ud_key(self):
-        return 'ReactiveDroppableBehavior.' + str(self.uid)
-
-    def on_touch_move(self, touch):
-        ud_key = self.__ud_key
-        touch_ud = touch.ud
-        if ud_key not in touch_ud and self.collide_point(*touch.pos):
-            drag_cls = touch_ud.get('kivyx_drag_cls', None)
-            if drag_cls is not None:
-                touch_ud[ud_key] = None
-                if drag_cls in self.drag_classes:
-                    ak.managed_start(ak.wait_any(
-                        self._watch_touch(touch),
-                        ak.event(touch.ud['kivyx_draggable'], 'on_drag_end'),
-                    ))
-        return super().on_touch_move(touch)
-
-    async def _watch_touch(self, touch):
-        draggable = touch.ud['kivyx_draggable']
-        ctx = touch.ud['kivyx_drag_ctx']
-        collide_point = self.collide_point
-
-        self.dispatch('on_drag_enter', touch, ctx, draggable)
-        try:
-            async with _rest_of_touch_events(self, touch) as on_touch_move:
-                while True:
-                    await on_touch_move()
-                    if not collide_point(*touch.pos):
-                        return
-        finally:
-            self.dispatch('on_drag_leave', touch, ctx, draggable)
-            del touch.ud[self.__ud_key]
-
-    def on_drag_enter(self, touch, ctx, draggable):
-        pass
-
-    def on_drag_leave(self, touch, ctx, draggable):
-        pass
-
-
-class MyDroppable(ReactiveDroppableBehavior, Label):
-    n_ongoing_drags_inside = NumericProperty(0)
-
+class MyDroppable(KXDroppableBehavior, Label):
     def on_drag_enter(self, touch, ctx, draggable):
-        self.n_ongoing_drags_inside += 1
         print(f"{draggable.text} entered {self.text}.")
 
     def on_drag_leave(self, touch, ctx, draggable):
-        self.n_ongoing_drags_inside -= 1
         print(f"{draggable.text} left {self.text}.")
 
 
@@ -0,0 +1,51 @@
+'''
+A RecycleView with 100,000 reorderable rows. Only the visible rows exist as widgets, and the spacer is a gap in the
+``data``, not a widget added to the layout.
+'''
+
+from kivy.app import App
+from kivy.lang import Builder
+import kivy_garden.draggable
+
+KV_CODE = '''
+<Row@KXDraggableBehavior+Label>:
+    drag_cls: 'row'
+    drag_timeout: 0
+    opacity: .5 if self.is_being_dragged else 1.
+    canvas.after:
+        Color:
+            rgba: 1, 1, 1, .3
+        Line:
+            rectangle: [*self.pos, *self.size, ]
+
+<ReorderableRecycleView@KXRecycleReorderableBehavior+RecycleView>:
+    drag_classes: ['row', ]
+    viewclass: 'Row'
+    RecycleBoxLayout:
+        orientation: 'vertical'
+        default_size: None, dp(50)
+        default_size_hint: 1, None
+        size_hint_y: None
+        height: self.minimum_height
+
+BoxLayout:
+    spacing: 10
+    ReorderableRecycleView:
+        id: left
+    ReorderableRecycleView:
+        id: right
+'''
+
+
+class SampleApp(App):
+    def build(self):
+        return Builder.load_string(KV_CODE)
+
+    def on_start(self):
+        ids = self.root.ids
+        ids.left.data = [{'text': f'L{i}'} for i in range(100_000)]
+        ids.right.data = [{'text': f'R{i}'} for i in range(100_000)]
+
+
+if __name__ == '__main__':
+    SampleApp().run()
@@ -17,7 +17,7 @@ from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.factory import Factory as F
 import asynckivy as ak
-from kivy_garden.draggable import KXDraggableBehavior, ongoing_drags
+from kivy_garden.draggable import KXDraggableBehavior, cancel_drags
 
 try:
     from kivy_garden import posani
@@ -171,8 +171,7 @@ class ShoppingApp(App):
         self.root.main(db_path=__file__ + r".sqlite3")
 
     def cancel_ongoing_drags(self):
-        for draggable in ongoing_drags():
-            draggable.drag_cancel()
+        cancel_drags()
 
 
 def _reload_texture(BytesIO, CoreImage, image_data: bytes, image_type: str, texture):
@@ -1,10 +1,19 @@
 __all__ = (
     'DragContext',
-    'KXDraggableBehavior', 'KXDroppableBehavior', 'KXReorderableBehavior',
+    'KXDraggableBehavior', 'KXDroppableBehavior', 'KXReorderableBehavior', 'KXRecycleReorderableBehavior',
     'save_widget_state', 'restore_widget_state',
-    'save_widget_location', 'restore_widget_location', 'ongoing_drags',
+    'save_widget_location', 'restore_widget_location', 'ongoing_drags', 'cancel_drags',
+    'DragStats', 'DragMetrics', 'drag_metrics', 'ProxyTextureCache', 'proxy_texture_cache',
+    'SpacerPool', 'spacer_pool', 'fly',
 )
 
-from ._impl import KXDraggableBehavior, KXDroppableBehavior, KXReorderableBehavior, ongoing_drags, DragContext
+from ._impl import (
+    KXDraggableBehavior, KXDroppableBehavior, KXReorderableBehavior, ongoing_drags, cancel_drags, DragContext,
+)
+from ._recycle import KXRecycleReorderableBehavior
 from ._utils import save_widget_state, restore_widget_state
 from ._utils import save_widget_location, restore_widget_location
+from ._metrics import DragStats, DragMetrics, drag_metrics
+from ._proxy import ProxyTextureCache, proxy_texture_cache
+from ._spacer_pool import SpacerPool, spacer_pool
+from ._animator import fly
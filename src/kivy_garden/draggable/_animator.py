@@ -0,0 +1,85 @@
+'''
+(internal)
+Flies widgets to their destinations, such as the draggables going back after failed drags.
+'''
+
+__all__ = ('fly', )
+
+from kivy.clock import Clock
+from kivy.animation import AnimationTransition
+import asynckivy as ak
+
+_flights = {}
+'''widget -> _Flight'''
+
+_clock_event = None
+
+
+class _Flight:
+    __slots__ = (
+        'widget', 'start_time', 'duration', 'transition',
+        'from_pos', 'to_pos', 'from_size', 'to_size', 'on_end',
+    )
+
+
+async def fly(widget, *, pos, size=None, duration, transition='linear'):
+    '''
+    Moves the widget to the ``pos``, and resizes it to the ``size`` if it's given, taking ``duration`` seconds.
+    ``transition`` is the name of a function in ``kivy.animation.AnimationTransition``, or a function. A flight of
+    the same widget that is already in progress ends where it is.
+
+    All the flights are advanced together once per frame, and each of them sets ``pos`` (and ``size``) of its widget
+    at once, rather than ``x`` and ``y`` separately. Cancelling the flight leaves the widget where it is.
+    '''
+    global _clock_event
+    widget = widget.__self__
+    if (old := _flights.pop(widget, None)) is not None:
+        old.on_end.fire()
+    if duration <= 0:
+        widget.pos = pos
+        if size is not None:
+            widget.size = size
+        return
+    f = _Flight()
+    f.widget = widget
+    f.start_time = Clock.get_time()
+    f.duration = duration
+    f.transition = getattr(AnimationTransition, transition) if isinstance(transition, str) else transition
+    f.from_pos = tuple(widget.pos)
+    f.to_pos = tuple(pos)
+    f.from_size = None if size is None else tuple(widget.size)
+    f.to_size = None if size is None else tuple(size)
+    f.on_end = ak.ExclusiveEvent()
+    _flights[widget] = f
+    if _clock_event is None:
+        _clock_event = Clock.schedule_interval(_on_frame, 0)
+    try:
+        await f.on_end.wait()
+    finally:
+        if _flights.get(widget) is f:
+            del _flights[widget]
+
+
+def _on_frame(dt):
+    global _clock_event
+    now = Clock.get_time()
+    finished = []
+    for f in _flights.values():
+        p = (now - f.start_time) / f.duration
+        if p >= 1.:
+            p = 1.
+            finished.append(f)
+        k = f.transition(p)
+        (x1, y1), (x2, y2) = f.from_pos, f.to_pos
+        f.widget.pos = (x1 + (x2 - x1) * k, y1 + (y2 - y1) * k, )
+        if f.to_size is not None:
+            (w1, h1), (w2, h2) = f.from_size, f.to_size
+            f.widget.size = (w1 + (w2 - w1) * k, h1 + (h2 - h1) * k, )
+    for f in finished:
+        del _flights[f.widget]
+    if not _flights:
+        _clock_event.cancel()
+        _clock_event = None
+    # Resuming the tasks may start other flights, thus this has to be done last.
+    for f in finished:
+        f.on_end.fire()
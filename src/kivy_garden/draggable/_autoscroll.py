@@ -0,0 +1,153 @@
+'''
+(internal)
+Scrolls the ScrollViews holding droppables while a drag is near their edges. The speed depends on the elapsed time, not
+on how often the touch moves, so a stationary finger keeps scrolling.
+'''
+
+__all__ = ('start_autoscroll', 'stop_autoscroll', )
+
+from kivy.clock import Clock
+from kivy.uix.scrollview import ScrollView
+
+from ._registry import iter_droppables, get_scroll_path, tree_version, _calc_window_bounds
+from ._dispatcher import request_update
+
+_drags = {}
+'''draggable -> _OngoingDrag'''
+
+_clock_event = None
+
+_paths = {}
+'''(drag_cls, window) -> the return value of :func:`_collect_paths`, which stays valid while the
+:func:`tree_version` stays the same.'''
+
+_paths_version = None
+
+_any_paths = False
+'''Whether any of the ``_paths`` is non-empty.'''
+
+
+def start_autoscroll(drag):
+    '''Starts auto-scrolling for an ``_OngoingDrag``.'''
+    global _clock_event, _paths_version
+    _drags[drag.draggable] = drag
+    _paths_version = None
+    if _clock_event is None:
+        _clock_event = Clock.schedule_interval(_on_frame, 0)
+
+
+def stop_autoscroll(draggable):
+    global _clock_event
+    _drags.pop(draggable, None)
+    if not _drags and _clock_event is not None:
+        _clock_event.cancel()
+        _clock_event = None
+        _paths.clear()
+
+
+def _on_frame(dt):
+    global _paths_version, _any_paths
+    version = tree_version()
+    if version != _paths_version:
+        _paths_version = version
+        _paths.clear()
+        for drag in _drags.values():
+            key = (drag.drag_cls, drag.window, )
+            if key not in _paths:
+                _paths[key] = _collect_paths(*key)
+        _any_paths = any(_paths.values())
+    if not _any_paths:
+        return
+    for draggable, drag in tuple(_drags.items()):
+        margin = draggable.drag_autoscroll_margin
+        speed = draggable.drag_autoscroll_speed
+        if margin <= 0 or speed <= 0:
+            continue
+        paths = _paths[(drag.drag_cls, drag.window, )]
+        if not paths:
+            continue
+        x, y = drag.pos
+        distance = speed * dt
+        scrolled = False
+        for sv in _find_scrollviews(paths, draggable):
+            if _scroll(sv, x, y, margin, distance):
+                scrolled = True
+        if scrolled:
+            # The content has moved under the drag.
+            request_update(drag)
+
+
+def _collect_paths(drag_cls, window) -> list:
+    '''
+    Returns a list of ``(ancestors, scrollviews)`` for each droppable on the window that accepts the ``drag_cls``.
+    ``ancestors`` is a set of the droppable and its ancestors, and ``scrollviews`` is a list of the ScrollViews among
+    them, innermost first.
+    '''
+    paths = []
+    for droppable in iter_droppables(drag_cls):
+        path = get_scroll_path(droppable)
+        if path is not None and path[0] is window:
+            paths.append(path[1:])
+    return paths
+
+
+def _find_scrollviews(paths, draggable) -> dict:
+    '''
+    Returns the ScrollViews among the ``paths`` (the ones :func:`_collect_paths` returned), excluding the droppables
+    inside the draggable, innermost first.
+    '''
+    scrollviews = {}
+    for ancestors, found in paths:
+        if draggable not in ancestors:
+            scrollviews.update(dict.fromkeys(found))
+    return scrollviews
+
+
+def _depth(distance_from_edge, margin) -> float:
+    '''How deep a position is in an edge band, from 0 (outside the band) to 1 (at the edge).'''
+    if distance_from_edge >= margin:
+        return 0.
+    return 1. - max(distance_from_edge, 0.) / margin
+
+
+def _scroll(sv: ScrollView, x, y, margin, distance) -> bool:
+    '''
+    Scrolls the ScrollView if the position (window coordinates) is in one of its edge bands. ``distance`` is how many
+    pixels it scrolls when the position is at the very edge. Returns whether it actually scrolled.
+    '''
+    vp = sv._viewport
+    if vp is None:
+        return False
+    bounds = _calc_window_bounds(sv)
+    if bounds is None:
+        return False
+    x1, y1, x2, y2 = bounds
+    if not (x1 <= x <= x2 and y1 <= y <= y2):
+        return False
+    scrolled = False
+    if sv.do_scroll_x:
+        scrollable = vp.width - sv.width
+        if scrollable > 0:
+            m = min(margin, (x2 - x1) / 2.)
+            depth = _depth(x - x1, m) - _depth(x2 - x, m)
+            if depth:
+                old = sv.scroll_x
+                new = min(max(old - depth * distance / scrollable, 0.), 1.)
+                if new != old:
+                    sv.scroll_x = new
+                    scrolled = True
+    if sv.do_scroll_y:
+        scrollable = vp.height - sv.height
+        if scrollable > 0:
+            m = min(margin, (y2 - y1) / 2.)
+            depth = _depth(y - y1, m) - _depth(y2 - y, m)
+            if depth:
+                old = sv.scroll_y
+                new = min(max(old - depth * distance / scrollable, 0.), 1.)
+                if new != old:
+                    sv.scroll_y = new
+                    scrolled = True
+    if scrolled:
+        # Move the content now rather than in the next frame, so that the spacers can be placed right away.
+        sv.update_from_scroll()
+    return scrolled
@@ -0,0 +1,199 @@
+'''
+(internal)
+A position index of a layout's children, used to speed up hit-testing during drags.
+'''
+
+__all__ = ('ChildrenIndex', )
+
+from bisect import bisect_right
+from math import floor
+
+_MAX_CELLS_PER_WIDGET = 64
+
+
+class ChildrenIndex:
+    '''
+    An immutable snapshot of the children's geometry in the parent's local coordinates.
+
+    * If the children are lined up along a single axis (BoxLayout), the lookup is a bisection over the sorted edges.
+    * Otherwise (StackLayout, GridLayout, etc.), the children are put into a uniform grid of buckets.
+
+    The index has to be rebuilt whenever the children or their geometry changes.
+    '''
+    __slots__ = (
+        '_children', '_axis', '_starts', '_ends', '_order',
+        '_cell_w', '_cell_h', '_buckets', '_large', '_bounds',
+    )
+
+    def __init__(self, layout):
+        self._children = children = layout.children[:]
+        self._axis = None
+        self._buckets = None
+        if not children:
+            return
+        axis = {'horizontal': 0, 'vertical': 1}.get(getattr(layout, 'orientation', None), None)
+        if axis is not None and self._build_axis_index(axis):
+            return
+        self._build_grid_index()
+
+    def _build_axis_index(self, axis) -> bool:
+        children = self._children
+        if axis == 0:
+            spans = [(c.x, c.right) for c in children]
+        else:
+            spans = [(c.y, c.top) for c in children]
+        order = sorted(range(len(children)), key=lambda i: spans[i][0])
+        starts = [spans[i][0] for i in order]
+        ends = [spans[i][1] for i in order]
+
+        # The bisection only works if the children don't overlap each other.
+        prev_end = starts[0]
+        for start, end in zip(starts, ends):
+            if start < prev_end:
+                return False
+            prev_end = end
+
+        self._axis = axis
+        self._starts = starts
+        self._ends = ends
+        self._order = order
+        return True
+
+    def _build_grid_index(self):
+        children = self._children
+        n = len(children)
+        self._cell_w = cell_w = max(sum(c.width for c in children) / n, 1.)
+        self._cell_h = cell_h = max(sum(c.height for c in children) / n, 1.)
+        self._buckets = buckets = {}
+        self._large = large = []
+        min_cx = min_cy = float('inf')
+        max_cx = max_cy = -float('inf')
+        for index, c in enumerate(children):
+            cx0 = floor(c.x / cell_w)
+            cy0 = floor(c.y / cell_h)
+            cx1 = floor(c.right / cell_w)
+            cy1 = floor(c.top / cell_h)
+            min_cx = min(min_cx, cx0)
+            min_cy = min(min_cy, cy0)
+            max_cx = max(max_cx, cx1)
+            max_cy = max(max_cy, cy1)
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > _MAX_CELLS_PER_WIDGET:
+                large.append(index)
+                continue
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    key = (cx, cy)
+                    bucket = buckets.get(key)
+                    if bucket is None:
+                        buckets[key] = [index]
+                    else:
+                        bucket.append(index)
+        self._bounds = (min_cx, min_cy, max_cx, max_cy, )
+
+    def widget_at(self, x, y):
+        '''
+        Returns a tuple of the child under the given position (local coordinates) and its index.
+        Returns (None, None) if there is no child under that position.
+        If multiple children are under that position, the one that has the smallest index will be returned.
+        '''
+        children = self._children
+        if not children:
+            return (None, None)
+        if self._axis is not None:
+            k = bisect_right(self._starts, (x, y)[self._axis]) - 1
+            found = None
+            # Adjacent children share an edge when there is no spacing, and 'collide_point()' is inclusive on both
+            # sides, so the preceding child needs to be checked as well.
+            for k in (k, k - 1):
+                if k < 0:
+                    break
+                index = self._order[k]
+                if children[index].collide_point(x, y) and (found is None or index < found):
+                    found = index
+            return (None, None) if found is None else (children[found], found)
+
+        cell_w = self._cell_w
+        cell_h = self._cell_h
+        candidates = self._buckets.get((floor(x / cell_w), floor(y / cell_h)), ())
+        for index in sorted((*candidates, *self._large)):
+            c = children[index]
+            if c.collide_point(x, y):
+                return (c, index)
+        return (None, None)
+
+    def nearest_to(self, x, y):
+        '''
+        Returns a tuple of the child nearest to the given position (local coordinates) and its index.
+        Returns (None, None) if there are no children.
+        '''
+        children = self._children
+        if not children:
+            return (None, None)
+        widget, index = self.widget_at(x, y)
+        if widget is not None:
+            return (widget, index)
+        if self._axis is not None:
+            return self._nearest_along_axis(x, y)
+        return self._nearest_in_grid(x, y)
+
+    def _nearest_along_axis(self, x, y):
+        c = (x, y)[self._axis]
+        starts = self._starts
+        ends = self._ends
+        k = bisect_right(starts, c) - 1
+        if k < 0:
+            k = 0
+        elif k + 1 < len(starts) and (starts[k + 1] - c) < (c - ends[k]):
+            k += 1
+        index = self._order[k]
+        return (self._children[index], index)
+
+    def _nearest_in_grid(self, x, y):
+        children = self._children
+        cell_w = self._cell_w
+        cell_h = self._cell_h
+        px = floor(x / cell_w)
+        py = floor(y / cell_h)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        max_radius = max(abs(px - min_cx), abs(px - max_cx), abs(py - min_cy), abs(py - max_cy))
+        buckets = self._buckets
+
+        best_index = None
+        best_d = float('inf')
+        for index in self._large:
+            d = _distance_sq(children[index], x, y)
+            if d < best_d:
+                best_index, best_d = index, d
+
+        # Search the buckets ring by ring until no child in the remaining rings can be nearer than the one found.
+        min_cell = min(cell_w, cell_h)
+        for radius in range(max_radius + 1):
+            lower_bound = (radius - 1) * min_cell
+            if lower_bound > 0. and lower_bound * lower_bound > best_d:
+                break
+            for key in _ring(px, py, radius):
+                for index in buckets.get(key, ()):
+                    d = _distance_sq(children[index], x, y)
+                    if d < best_d or (d == best_d and index < best_index):
+                        best_index, best_d = index, d
+        if best_index is None:
+            return (None, None)
+        return (children[best_index], best_index)
+
+
+def _ring(cx, cy, radius):
+    if radius == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-radius, radius + 1):
+        yield (cx + dx, cy - radius)
+        yield (cx + dx, cy + radius)
+    for dy in range(-radius + 1, radius):
+        yield (cx - radius, cy + dy)
+        yield (cx + radius, cy + dy)
+
+
+def _distance_sq(widget, x, y):
+    dx = max(widget.x - x, 0., x - widget.right)
+    dy = max(widget.y - y, 0., y - widget.top)
+    return dx * dx + dy * dy
@@ -0,0 +1,148 @@
+'''
+(internal)
+Routes the ongoing drags to the droppables under them.
+
+Each window has a single dispatcher. It looks up the droppable under each of its drags through the registry at most
+once per frame, right before the frame gets drawn, and notifies only that droppable. Thus the droppables neither
+watch ``on_touch_move`` nor grab the touches. The lookup examines only the droppables near the drag, unless some of
+them have moved since the last lookup, in which case the registry rebuilds its index of all of them first.
+
+The droppable under a drag gets ``on_drag_enter`` when the drag enters it, and ``on_drag_leave`` when the drag leaves
+it or ends. Its ``n_drags_inside`` counts the drags between the two. A droppable that follows the drags over it also
+implements an async method named ``_visit_drag``, which the dispatcher starts right after ``on_drag_enter``, and
+cancels right before ``on_drag_leave``.
+
+.. code-block::
+
+    async def _visit_drag(self, drag):
+        while await drag.next_move():
+            x, y = drag.pos  # window coordinates
+            ...
+        # The touch has been released over this droppable.
+'''
+
+__all__ = ('add_drag', 'remove_drag', 'request_update', 'release_drag', 'set_target', )
+
+from kivy.clock import Clock
+import asynckivy as ak
+
+from ._registry import find_droppable
+
+_dispatchers = {}
+'''window -> _Dispatcher'''
+
+
+def add_drag(drag):
+    '''Starts routing an ``_OngoingDrag``. Its target gets looked up in the next frame.'''
+    window = drag.window
+    dispatcher = _dispatchers.get(window)
+    if dispatcher is None:
+        _dispatchers[window] = dispatcher = _Dispatcher(window)
+    dispatcher.drags.add(drag)
+    drag.dispatcher = dispatcher
+    dispatcher.request_update(drag)
+
+
+def remove_drag(drag):
+    '''Stops routing the drag, and cancels the visit to its target if there is one.'''
+    _detach(drag)
+    _leave(drag)
+
+
+def request_update(drag):
+    '''Lets the dispatcher look up the target of the drag in this frame, because it has moved.'''
+    dispatcher = drag.dispatcher
+    if dispatcher is not None:
+        dispatcher.request_update(drag)
+
+
+def release_drag(drag):
+    '''
+    Tells the target of the drag that the touch has been released. If the drag has moved since the last lookup, the
+    target gets looked up right now instead of in the next frame.
+    '''
+    dispatcher = drag.dispatcher
+    if dispatcher is None:
+        return
+    if drag in dispatcher.dirty:
+        dispatcher.update(drag)
+    _detach(drag)
+    drag._on_move.fire(False)
+
+
+def set_target(drag, droppable):
+    '''
+    Makes the droppable the target of the drag without looking it up. This is for a droppable the drag started from,
+    which has already reserved a place for it.
+    '''
+    if drag.target is not droppable:
+        _enter(drag, droppable)
+
+
+def _detach(drag):
+    dispatcher = drag.dispatcher
+    if dispatcher is None:
+        return
+    drag.dispatcher = None
+    dispatcher.drags.discard(drag)
+    dispatcher.dirty.pop(drag, None)
+    if not dispatcher.drags:
+        dispatcher.trigger.cancel()
+        del _dispatchers[dispatcher.window]
+
+
+def _enter(drag, droppable):
+    _leave(drag)
+    drag.target = droppable
+    droppable.n_drags_inside += 1
+    touch = drag.touch
+    droppable.dispatch('on_drag_enter', touch, touch.ud['kivyx_drag_ctx'], drag.draggable)
+    visit = getattr(droppable, '_visit_drag', None)
+    if visit is not None and drag.target is droppable:
+        drag._visit = ak.managed_start(visit(drag))
+
+
+def _leave(drag):
+    droppable = drag.target
+    if droppable is None:
+        return
+    drag.target = None
+    visit = drag._visit
+    drag._visit = ak.dummy_task
+    visit.cancel()
+    droppable.n_drags_inside -= 1
+    touch = drag.touch
+    droppable.dispatch('on_drag_leave', touch, touch.ud['kivyx_drag_ctx'], drag.draggable)
+
+
+class _Dispatcher:
+    __slots__ = ('window', 'drags', 'dirty', 'trigger', '__weakref__', )
+
+    def __init__(self, window):
+        self.window = window
+        self.drags = set()
+        self.dirty = {}
+        '''The drags that have moved since the last frame. A dict is used as an ordered set.'''
+        self.trigger = Clock.create_trigger(self._on_frame, -1)
+
+    def request_update(self, drag):
+        self.dirty[drag] = None
+        self.trigger()
+
+    def _on_frame(self, dt):
+        dirty = self.dirty
+        self.dirty = {}
+        update = self.update
+        for drag in dirty:
+            if drag.dispatcher is self:
+                update(drag)
+
+    def update(self, drag):
+        x, y = drag.pos
+        target = find_droppable(drag.drag_cls, x, y, excluding=drag.draggable, window=self.window)
+        if target is not drag.target:
+            if target is None:
+                _leave(drag)
+            else:
+                _enter(drag, target)
+        drag._on_move.fire(True)
@@ -0,0 +1,67 @@
+'''
+(internal)
+Tells whether the touches that went down on draggables are dragging gestures. A touch is one if it stays within
+``drag_distance`` pixels for ``drag_timeout`` milliseconds, and is a normal touch if it travels further than that, or is
+released before that.
+'''
+
+__all__ = ('start_classifying', 'is_pending', )
+
+from kivy.clock import Clock
+
+_pending = {}
+'''touch -> _PendingTouch'''
+
+_clock_event = None
+
+
+class _PendingTouch:
+    __slots__ = ('draggable', 'distance', 'deadline', )
+
+    def __init__(self, draggable, distance, deadline):
+        self.draggable = draggable
+        self.distance = distance
+        self.deadline = deadline
+
+
+def start_classifying(draggable, touch):
+    '''
+    Starts examining a touch that went down on the draggable. The draggable's ``_on_touch_classified()`` will be
+    called with one of ``'held'``, ``'moved'`` or ``'released'``.
+    '''
+    global _clock_event
+    touch.grab(draggable)
+    _pending[touch] = _PendingTouch(
+        draggable, draggable.drag_distance, Clock.get_time() + draggable.drag_timeout / 1000.)
+    if _clock_event is None:
+        _clock_event = Clock.schedule_interval(_on_frame, 0)
+
+
+def is_pending(touch) -> bool:
+    return touch in _pending
+
+
+def _on_frame(dt):
+    global _clock_event
+    now = Clock.get_time()
+    classified = []
+    for touch, p in _pending.items():
+        # Outside the touch dispatching, the positions of a touch are in window coordinates.
+        if touch.time_end != -1:
+            # This comes first because the touch must be released in the simulated normal touch too.
+            result = 'released'
+        elif abs(touch.x - touch.ox) > p.distance or abs(touch.y - touch.oy) > p.distance:
+            result = 'moved'
+        elif now >= p.deadline:
+            result = 'held'
+        else:
+            continue
+        classified.append((touch, p.draggable, result, ))
+    for touch, draggable, __ in classified:
+        del _pending[touch]
+        touch.ungrab(draggable)
+    if not _pending:
+        _clock_event.cancel()
+        _clock_event = None
+    for touch, draggable, result in classified:
+        draggable._on_touch_classified(touch, result)
@@ -1,26 +1,42 @@
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Sequence
+from math import hypot
 from inspect import isawaitable
+from time import perf_counter
+from collections import deque
 from dataclasses import dataclass
+from functools import partial
 from contextlib import nullcontext, asynccontextmanager
 
 from kivy.properties import (
-    BooleanProperty, ListProperty, StringProperty, NumericProperty, OptionProperty, AliasProperty,
+    BooleanProperty, ListProperty, StringProperty, NumericProperty, OptionProperty, AliasProperty, ObjectProperty,
 )
 from kivy.clock import Clock
 from kivy.factory import Factory
-import kivy.core.window
 from kivy.uix.widget import Widget
 from kivy.uix.scrollview import ScrollView
 import asynckivy as ak
 
 from ._utils import (
-    temp_transform, _create_spacer,
+    temp_transform,
     save_widget_state, restore_widget_state,
 )
+from ._children_index import ChildrenIndex
+from ._registry import (
+    update_registration, find_droppable, get_window_bounds, window_to_parent, window_to_local,
+)
+from ._metrics import DragStats, drag_metrics, timed, counted
+from ._autoscroll import start_autoscroll, stop_autoscroll
+from ._dispatcher import add_drag, remove_drag, request_update, release_drag
+from ._proxy import create_drag_proxy
+from ._shift import SiblingShifter
+from ._animator import fly
+from ._layer import get_drag_layer
+from ._gesture import start_classifying, is_pending
+from ._spacer_pool import spacer_pool
 
 
 @asynccontextmanager
-async def _rest_of_touch_events(widget, touch):
+async def _rest_of_touch_events(widget, touch, *, coalesce=False, history: list = None):
     '''
     A variant of asynckivy.rest_of_touch_events, recommended over the original when Kivy runs in async mode.
 
@@ -30,16 +46,40 @@ async def _rest_of_touch_events(widget, touch):
             while True:
                 await on_touch_move()
                 ...
+
+    If ``coalesce`` is True, ``on_touch_move()`` wakes up at most once per frame no matter how many
+    ``on_touch_move`` events occurred during that frame. In that case, ``(touch.time_update, touch.x, touch.y)`` of
+    every event will be appended to ``history`` if it's given.
     '''
     touch.grab(widget)
     try:
         def filter(w, t, touch=touch):
             return t is touch and t.grab_current is w
-        async with (
-            ak.move_on_when(ak.event(widget, 'on_touch_up', filter=filter, stop_dispatching=True)),
-            ak.event_freq(widget, 'on_touch_move', filter=filter, stop_dispatching=True) as on_touch_move,
-        ):
-            yield on_touch_move
+        if not coalesce:
+            async with (
+                ak.move_on_when(ak.event(widget, 'on_touch_up', filter=filter, stop_dispatching=True)),
+                ak.event_freq(widget, 'on_touch_move', filter=filter, stop_dispatching=True) as on_touch_move,
+            ):
+                yield on_touch_move
+            return
+
+        on_frame = ak.ExclusiveEvent()
+        trigger = Clock.create_trigger(lambda dt: on_frame.fire(dt), 0)
+
+        def on_touch_move(w, t, touch=touch, history_append=None if history is None else history.append):
+            if t is touch and t.grab_current is w:
+                if history_append is not None:
+                    history_append((t.time_update, t.x, t.y, ))
+                trigger()
+                return True
+
+        bind_uid = widget.fbind('on_touch_move', on_touch_move)
+        try:
+            async with ak.move_on_when(ak.event(widget, 'on_touch_up', filter=filter, stop_dispatching=True)):
+                yield on_frame.wait
+        finally:
+            widget.unbind_uid('on_touch_move', bind_uid)
+            trigger.cancel()
     finally:
         touch.ungrab(widget)
 
@@ -61,6 +101,55 @@ class DragContext:
     '''(read-only) The widget where the draggable dropped to. This is always None on_drag_start/on_drag_cancel, and is
     always a widget on_drag_succeed, and can be either on_drag_fail/on_drag_end.'''
 
+    touch_history: list = None
+    '''(read-only) A list of ``(time, x, y)`` of every ``on_touch_move`` event the drag received, in window
+    coordinates. This is available only when :attr:`KXDraggableBehavior.drag_coalesce_moves` is True, otherwise None.
+    '''
+
+    stats: DragStats = None
+    '''(read-only) The performance statistics of the drag. This is available only when ``drag_metrics.enabled`` was
+    True at the time the drag started, otherwise None.
+    '''
+
+    proxy: Widget = None
+    '''(read-only) The widget that follows the finger in place of the draggable. This is available only when
+    :attr:`KXDraggableBehavior.drag_use_proxy` was True at the time the drag started or when this is a group drag,
+    otherwise None. It gets removed from the window right before ``on_drag_end``.
+    '''
+
+    group: tuple = ()
+    '''(read-only) The other draggables dragged together with the draggable, in the order they are going to be placed
+    after it. Empty unless :meth:`KXDraggableBehavior.get_drag_group` returned some.
+    '''
+
+    velocity_samples: deque = None
+    '''(read-only) The ``(time, x, y)`` of the most recent moves of the drag, oldest first, in window coordinates. The
+    release of the touch is the last one once the drag has ended. This is a ring buffer whose size is
+    :attr:`KXDraggableBehavior.drag_velocity_samples`, and is available only when velocity tracking was enabled at the
+    time the drag started, otherwise None.
+    '''
+
+    fling_pos: tuple = None
+    '''(read-only) Where the drag was thrown to, in window coordinates. The droppable and the drop index were looked up
+    there instead of where the touch was released. None unless the drag was flung.
+    '''
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        '''
+        (read-only) The average velocity over :attr:`velocity_samples`, in pixels per second. ``(0, 0)`` if the
+        velocity isn't tracked or there aren't enough samples yet.
+        '''
+        samples = self.velocity_samples
+        if not samples or len(samples) < 2:
+            return (0., 0., )
+        t0, x0, y0 = samples[0]
+        t1, x1, y1 = samples[-1]
+        dt = t1 - t0
+        if dt <= 0.:
+            return (0., 0., )
+        return ((x1 - x0) / dt, (y1 - y0) / dt, )
+
     @property
     def original_location(self) -> dict:
         '''
@@ -94,12 +183,103 @@ class KXDraggableBehavior:
     is_being_dragged = AliasProperty(lambda self: self.drag_state is not None, bind=('drag_state', ), cache=True)
     '''(read-only)'''
 
+    drag_coalesce_moves = BooleanProperty(False)
+    '''If True, the position of the draggable is updated at most once per
+    frame, no matter how many ``on_touch_move`` events occur during that
+    frame. Every event is still recorded in :attr:`DragContext.touch_history`.
+    Changing this doesn't affect ongoing drag.
+
+    The spacers of the reorderables under the drag are updated at most once
+    per frame regardless of this.
+    '''
+
+    drag_autoscroll_margin = NumericProperty('40dp')
+    '''The width of the bands along the edges of a ScrollView. While this is
+    being dragged inside one of those bands, the ScrollView scrolls toward
+    that edge. Only the ScrollViews holding a droppable that accepts this
+    draggable do so. 0 disables the auto-scrolling.
+    '''
+
+    drag_autoscroll_speed = NumericProperty('1000dp')
+    '''How many pixels per second a ScrollView auto-scrolls when the drag is
+    at its very edge. The speed decreases linearly to 0 toward the inner side
+    of the band.
+    '''
+
+    drag_use_proxy = BooleanProperty(False)
+    '''If True, the draggable stays where it is, invisible, during a drag,
+    and a snapshot of it follows the finger instead. This avoids the
+    relayouting of the container the draggable belongs to, and the rebuilding
+    of the draggable's graphics, both of which occur when the draggable gets
+    moved under the window. The snapshots are kept in
+    ``proxy_texture_cache``. Changing this doesn't affect ongoing drag.
+    '''
+
+    drag_return_duration = NumericProperty(.1)
+    '''How many seconds the draggable takes to go back to where it came from
+    when a drag fails. 0 makes it go back instantly. This is used by the
+    default handler of ``on_drag_fail``.
+    '''
+
+    drag_settle_duration = NumericProperty(0)
+    '''If positive, when a drag succeeds, the draggable flies from where it
+    was dropped to its place in the droppable, taking this many seconds, and
+    the members of a group drag fly along with it. This is used by the default
+    handler of ``on_drag_succeed``, which returns an awaitable when this is
+    positive. Droppables that don't make the draggable their child, such as
+    the RecycleViews, don't get the flight.
+    '''
+
+    drag_anim_transition = ObjectProperty('linear')
+    '''The transition of the animations of :attr:`drag_return_duration` and
+    :attr:`drag_settle_duration`. The name of a function in
+    ``kivy.animation.AnimationTransition``, or a function.
+    '''
+
+    drag_velocity_samples = NumericProperty(0)
+    '''How many of the most recent moves of a drag are kept to estimate its
+    velocity, :attr:`DragContext.velocity`. 0 disables the tracking unless
+    :attr:`drag_fling_time` is positive. Changing this doesn't affect ongoing
+    drag.
+    '''
+
+    drag_fling_time = NumericProperty(0)
+    '''If positive, a drag released at :attr:`drag_fling_min_speed` or faster
+    is thrown: it drops where it would be after moving at its release velocity
+    for this many seconds, instead of where the touch was released. If nothing
+    accepts it there, it drops at the farthest point on the way that does. The
+    velocity gets tracked with at least a few samples while this is positive.
+    Changing this doesn't affect ongoing drag.
+    '''
+
+    drag_fling_min_speed = NumericProperty('1000dp')
+    '''The speed, in pixels per second, at which a released drag counts as a
+    throw. See :attr:`drag_fling_time`.
+    '''
+
     def drag_cancel(self):
         '''
         If the draggable is currently being dragged, cancel it.
+
+        If the drag has already succeeded, and :meth:`on_drag_succeed` is still running (an async one, or the settle
+        animation of the default one), this cuts it short without undoing the drop, and ``on_drag_cancel`` doesn't
+        occur.
         '''
         self._drag_task.cancel()
 
+    def get_drag_group(self, touch) -> Sequence['KXDraggableBehavior']:
+        '''
+        Returns the other draggables to be dragged together with this one by the ``touch``, such as the ones
+        selected along with it. This is called right before a drag starts. The default implementation returns an
+        empty list.
+
+        The ones that cannot be dragged at that moment are left out. A group drag always uses a proxy, which shows the
+        members piled up, regardless of :attr:`drag_use_proxy`, and the members stay where they are, invisible, until
+        the drag ends. When it succeeds, they are placed as a contiguous block in the droppable. The members cannot be
+        the views of a RecycleView.
+        '''
+        return []
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._drag_task = ak.dummy_task
@@ -119,7 +299,7 @@ class KXDraggableBehavior:
         if self._is_a_touch_potentially_a_dragging_gesture(touch) and self._can_be_dragged:
             touch.ud[self.__ud_key] = None
             if self.drag_timeout:
-                ak.managed_start(self._see_if_a_touch_actually_is_a_dragging_gesture(touch))
+                start_classifying(self, touch)
             else:
                 ak.managed_start(self._treat_a_touch_as_a_drag(touch))
             return True
@@ -127,32 +307,27 @@ class KXDraggableBehavior:
             touch.ud[self.__ud_key] = None
             return super().on_touch_down(touch)
 
-    async def _see_if_a_touch_actually_is_a_dragging_gesture(self, touch):
-        async with ak.move_on_after(self.drag_timeout / 1000.) as bg_task:
-            # LOAD_FAST
-            abs_ = abs
-            drag_distance = self.drag_distance
-            ox, oy = touch.opos
-
-            do_touch_up = True
-            async with _rest_of_touch_events(self, touch) as on_touch_move:
-                while True:
-                    await on_touch_move()
-                    dx = abs_(touch.x - ox)
-                    dy = abs_(touch.y - oy)
-                    if dy > drag_distance or dx > drag_distance:
-                        do_touch_up = False
-                        break
-
-        is_a_dragging_gesture = bg_task.finished
-        if is_a_dragging_gesture:
+    def on_touch_move(self, touch):
+        if touch.grab_current is self and is_pending(touch):
+            return True
+        return super().on_touch_move(touch)
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is self and is_pending(touch):
+            return True
+        return super().on_touch_up(touch)
+
+    def _on_touch_classified(self, touch, result):
+        '''Called when it turned out whether a touch is a dragging gesture. (called by the classifier)'''
+        if result == 'held':
             ak.managed_start(
                 self._treat_a_touch_as_a_drag(touch, do_transform=True)
                 if self._can_be_dragged else
                 self._simulate_a_normal_touch(touch, do_transform=True)
             )
         else:
-            ak.managed_start(self._simulate_a_normal_touch(touch, do_touch_up=do_touch_up))
+            ak.managed_start(self._simulate_a_normal_touch(
+                touch, do_transform=True, do_touch_up=(result == 'released')))
 
     def start_dragging_from_others_touch(self, receiver: Widget, touch):
         '''
@@ -171,7 +346,7 @@ class KXDraggableBehavior:
         try:
             if touch_receiver is None:
                 original_pos_win = self.to_window(*self.pos)
-                with temp_transform(touch, self.parent.to_widget) if do_transform else nullcontext():
+                with temp_transform(touch, partial(window_to_local, self.parent)) if do_transform else nullcontext():
                     offset_x = touch.ox - self.x
                     offset_y = touch.oy - self.y
             else:
@@ -187,21 +362,42 @@ class KXDraggableBehavior:
                 window = Window
             touch_ud = touch.ud
             original_state = save_widget_state(self)
+            coalesce = self.drag_coalesce_moves
+            fling_time = self.drag_fling_time
+            n_samples = int(self.drag_velocity_samples)
+            if fling_time > 0:
+                n_samples = max(n_samples, _MIN_FLING_SAMPLES)
+            samples = deque(((touch.time_update, touch.x, touch.y), ), maxlen=n_samples) if n_samples > 0 else None
+            group = self._collect_drag_group(touch)
             ctx = DragContext(
                 original_pos_win=original_pos_win,
                 original_state=original_state,
+                touch_history=[] if coalesce else None,
+                stats=DragStats(drag_cls=self.drag_cls) if drag_metrics.enabled else None,
+                proxy=create_drag_proxy(self, group) if (group or self.drag_use_proxy) else None,
+                group=group,
+                velocity_samples=samples,
             )
-
-            # move self under the Window
-            if self.parent is not None:
-                self.parent.remove_widget(self)
-            self.size_hint = (None, None, )
-            self.pos_hint = {}
-            self.pos = (
+            stats = ctx.stats
+
+            # move self, or the proxy, to the drag layer of the Window
+            if (mover := ctx.proxy) is None:
+                mover = self
+                if self.parent is not None:
+                    self.parent.remove_widget(self)
+                self.size_hint = (None, None, )
+                self.pos_hint = {}
+            else:
+                original_opacity = self.opacity
+                self.opacity = 0
+                group_opacities = [w.opacity for w in group]
+                for w in group:
+                    w.opacity = 0
+            mover.pos = (
                 original_pos_win[0] + touch.x - touch.ox,
                 original_pos_win[1] + touch.y - touch.oy,
             )
-            window.add_widget(self)
+            get_drag_layer(window).add_widget(mover)
 
             # mark the touch so that other widgets can react to this drag
             touch_ud['kivyx_drag_cls'] = self.drag_cls
@@ -210,35 +406,100 @@ class KXDraggableBehavior:
 
             # store the task instance so that the user can cancel it later
             self._drag_task.cancel()
-            self._drag_task = await ak.current_task()
+            self._drag_task = task = await ak.current_task()
+            for w in group:
+                w._drag_task = task
+                w.drag_state = 'started'
+            drag = _OngoingDrag(self, touch_ud['kivyx_drag_cls'], window, offset_x, offset_y, mover, touch, group)
+            _register_ongoing_drag(drag)
 
             # actual dragging process
             self.dispatch('on_drag_start', touch, ctx)
             self.drag_state = 'started'
-            async with _rest_of_touch_events(self, touch) as on_touch_move:
-                while True:
-                    await on_touch_move()
-                    self.x = touch.x - offset_x
-                    self.y = touch.y - offset_y
+            async with _rest_of_touch_events(
+                    mover, touch, coalesce=coalesce, history=ctx.touch_history) as on_touch_move:
+                if stats is None and samples is None:
+                    while True:
+                        await on_touch_move()
+                        mover.pos = (touch.x - offset_x, touch.y - offset_y, )
+                        request_update(drag)
+                elif stats is None:
+                    sample = samples.append
+                    while True:
+                        await on_touch_move()
+                        mover.pos = (touch.x - offset_x, touch.y - offset_y, )
+                        sample((touch.time_update, touch.x, touch.y, ))
+                        request_update(drag)
+                else:
+                    while True:
+                        await on_touch_move()
+                        t = perf_counter()
+                        mover.pos = (touch.x - offset_x, touch.y - offset_y, )
+                        if samples is not None:
+                            samples.append((touch.time_update, touch.x, touch.y, ))
+                        request_update(drag)
+                        stats.move_time += perf_counter() - t
+                        stats.n_moves += 1
+            if stats is not None:
+                touch_up_time = perf_counter()
+            if coalesce:
+                # The last event might not have been applied yet.
+                mover.pos = (touch.x - offset_x, touch.y - offset_y, )
+            if samples is not None:
+                samples.append((touch.time_update, touch.x, touch.y, ))
+                if fling_time > 0:
+                    vx, vy = ctx.velocity
+                    if hypot(vx, vy) >= self.drag_fling_min_speed:
+                        ctx.fling_pos = drag.fling_pos = _project_fling(drag, vx * fling_time, vy * fling_time)
+                        request_update(drag)
+
+            # Let the droppable under the final position know the drop, without waiting for the next frame.
+            stop_autoscroll(self)
+            release_drag(drag)
 
             # wait for other widgets to react to 'on_touch_up'
             await ak.sleep(-1)
 
-            ctx.droppable = droppable = touch_ud.get('kivyx_droppable', None)
+            ctx.droppable = droppable = self._find_droppable(touch)
+            if stats is not None:
+                stats.drop_latency = perf_counter() - touch_up_time
             if droppable is None or (not droppable.accepts_drag(touch, ctx, self)):
                 r = self.dispatch('on_drag_fail', touch, ctx)
                 self.drag_state = 'failed'
             else:
                 r = self.dispatch('on_drag_succeed', touch, ctx)
                 self.drag_state = 'succeeded'
+            for w in group:
+                w.drag_state = self.drag_state
             if isawaitable(r):
                 await r
             await ak.sleep(-1)  # This is necessary in order to work with Magnet iirc.
         except ak.Cancelled:
+            if self.drag_state == 'succeeded':
+                # The drop has already been made. Cancelling only cuts the rest of 'on_drag_succeed' short, such as
+                # the settle animation.
+                raise
             self.dispatch('on_drag_cancel', touch, ctx)
             self.drag_state = 'cancelled'
+            for w in group:
+                w.drag_state = 'cancelled'
             raise
         finally:
+            _unregister_ongoing_drag(self)
+            if (proxy := ctx.proxy) is not None:
+                if proxy.parent is not None:
+                    proxy.parent.remove_widget(proxy)
+                self.opacity = original_opacity
+                for w, opacity in zip(group, group_opacities):
+                    w.opacity = opacity
+                    w._drag_task = ak.dummy_task
+                    w.drag_state = None
+            if stats is not None:
+                if ctx.touch_history is not None:
+                    # Coalesced moves wake the loop up once per frame, but all of them get recorded.
+                    stats.n_moves = len(ctx.touch_history)
+                stats.result = self.drag_state
+                drag_metrics._add(stats)
             self.dispatch('on_drag_end', touch, ctx)
             self.drag_state = None
             touch_ud['kivyx_droppable'] = None
@@ -246,12 +507,43 @@ class KXDraggableBehavior:
             del touch_ud['kivyx_draggable']
             del touch_ud['kivyx_drag_ctx']
 
+    def _collect_drag_group(self, touch) -> tuple:
+        group = {}
+        for w in self.get_drag_group(touch):
+            w = w.__self__
+            if w is not self and w not in group and w._can_be_dragged:
+                group[w] = None
+        return tuple(group)
+
+    @staticmethod
+    def _find_droppable(touch):
+        touch_ud = touch.ud
+        x, y = touch.pos
+        draggable = touch_ud['kivyx_draggable']
+        drag = _ongoing_drags.get(draggable)
+        if drag is None:
+            droppable = find_droppable(
+                touch_ud['kivyx_drag_cls'], x, y, excluding=draggable, window=draggable.get_root_window())
+        else:
+            # The dispatcher has looked it up when the touch was released, where the drag was thrown to if it was.
+            droppable = drag.target
+            x, y = drag.pos
+        if droppable is None:
+            # Something other than the registered droppables might have set it.
+            return touch_ud.get('kivyx_droppable', None)
+        get_drop_index = getattr(droppable, '_get_drop_index', None)
+        if get_drop_index is not None and droppable is not touch_ud.get('kivyx_droppable', None):
+            # The drag hasn't reached the reorderable through the touch dispatching, thus there is no spacer in it.
+            touch_ud['kivyx_droppable_index'] = get_drop_index(x, y)
+        touch_ud['kivyx_droppable'] = droppable
+        return droppable
+
     async def _simulate_a_normal_touch(self, touch, *, do_transform=False, do_touch_up=False):
         # simulate 'on_touch_down'
         original = touch.grab_current
         try:
             touch.grab_current = None
-            with temp_transform(touch, self.parent.to_widget) if do_transform else nullcontext():
+            with temp_transform(touch, partial(window_to_local, self.parent)) if do_transform else nullcontext():
                 super().on_touch_down(touch)
         finally:
             touch.grab_current = original
@@ -261,7 +553,7 @@ class KXDraggableBehavior:
         await ak.sleep(.1)
 
         # simulate 'on_touch_up'
-        to_widget = self.to_widget if self.parent is None else self.parent.to_widget
+        to_widget = self.to_widget if self.parent is None else partial(window_to_local, self.parent)
         touch.grab_current = None
         with temp_transform(touch, to_widget):
             super().on_touch_up(touch)
@@ -273,7 +565,7 @@ class KXDraggableBehavior:
             if x is None:
                 continue
             touch.grab_current = x
-            with temp_transform(touch, x.parent.to_widget):
+            with temp_transform(touch, partial(window_to_local, x.parent)):
                 x.dispatch('on_touch_up', touch)
 
         touch.grab_current = None
@@ -287,149 +579,677 @@ class KXDraggableBehavior:
 
     def on_drag_succeed(self, touch, ctx: DragContext):
         original_state = ctx.original_state
-        self.parent.remove_widget(self)
+        droppable = ctx.droppable
+        index = touch.ud.get('kivyx_droppable_index', 0)
+        widgets = (self, *ctx.group)
+        duration = self.drag_settle_duration
+        window = droppable.get_root_window() if duration > 0 else None
+        if window is not None:
+            # The snapshots fly from where the drag was dropped.
+            proxy = ctx.proxy
+            pos = self.to_window(*self.pos) if proxy is None else tuple(proxy.pos)
+            proxies = [create_drag_proxy(w) for w in widgets]
+            for p in proxies:
+                p.pos = pos
+            if proxy is not None:
+                proxy.opacity = 0
+        # The ones that stayed in the droppable during the drag (proxy mode) were counted in the index.
+        index -= _count_children_before(droppable, widgets, index)
+        for w in widgets:
+            if w.parent is not None:
+                w.parent.remove_widget(w)
         self.size_hint_x = original_state['size_hint_x']
         self.size_hint_y = original_state['size_hint_y']
         self.pos_hint = original_state['pos_hint']
-        ctx.droppable.add_widget(self, index=touch.ud.get('kivyx_droppable_index', 0))
+        if len(widgets) == 1:
+            droppable.add_widget(self, index=index)
+        else:
+            _add_widgets_as_a_block(droppable, widgets, index)
+        if window is not None:
+            return _fly_widgets(window, widgets, proxies, duration, self.drag_anim_transition)
 
     async def on_drag_fail(self, touch, ctx: DragContext):
-        await ak.anim_attrs(
-            self, duration=.1,
-            x=ctx.original_pos_win[0],
-            y=ctx.original_pos_win[1],
+        proxy = ctx.proxy
+        await fly(
+            self if proxy is None else proxy,
+            pos=ctx.original_pos_win,
+            duration=self.drag_return_duration,
+            transition=self.drag_anim_transition,
         )
-        restore_widget_state(self, ctx.original_state)
+        if proxy is None:
+            restore_widget_state(self, ctx.original_state)
 
     def on_drag_cancel(self, touch, ctx: DragContext):
-        restore_widget_state(self, ctx.original_state)
+        if ctx.proxy is None:
+            restore_widget_state(self, ctx.original_state)
+
+
+def _count_children_before(parent, widgets, index) -> int:
+    '''Returns how many of the ``widgets`` are in ``parent.children[:index]``.'''
+    children = parent.children
+    if len(widgets) == 1:
+        w = widgets[0]
+        return 1 if w.parent is parent and children.index(w) < index else 0
+    widgets = {w for w in widgets if w.parent is parent}
+    if not widgets:
+        return 0
+    return sum(1 for c in children[:index] if c in widgets)
+
+
+def _add_widgets_as_a_block(droppable, widgets: Sequence[Widget], index=0):
+    '''
+    Adds the widgets to a droppable as a contiguous block, in the order they appear in the layout, starting at the
+    ``index`` (the same as the one of ``add_widget()``). The widgets must not have a parent.
+
+    The layout of the droppable runs only once, in the next frame, however many widgets are added.
+    '''
+    add_block = getattr(droppable, '_add_widgets', None)
+    if add_block is not None:
+        add_block(widgets, index)
+        return
+    add_widget = droppable.add_widget
+    # The layouts show the children in the reverse order.
+    for w in widgets:
+        add_widget(w, index=index)
+
+
+async def _fly_widgets(window, widgets, proxies, duration, transition='linear'):
+    '''
+    Animates the proxies from where they are to where the widgets are, while the widgets are invisible. The widgets
+    that aren't in the window after the layouts, such as the ones converted into the data of a RecycleView, are left
+    out.
+    '''
+    opacities = [w.opacity for w in widgets]
+    try:
+        layer = get_drag_layer(window)
+        for w, proxy in zip(widgets, proxies):
+            w.opacity = 0
+            layer.add_widget(proxy)
+        # wait for the layouts to place the widgets
+        await ak.sleep(0)
+        await ak.wait_all(*(
+            fly(proxy, pos=w.to_window(*w.pos), size=tuple(w.size), duration=duration, transition=transition)
+            for w, proxy in zip(widgets, proxies)
+            if w.get_root_window() is window
+        ))
+    finally:
+        for w, proxy, opacity in zip(widgets, proxies, opacities):
+            if proxy.parent is not None:
+                proxy.parent.remove_widget(proxy)
+            w.opacity = opacity
+
+
+class _OngoingDrag:
+    __slots__ = (
+        'draggable', 'drag_cls', 'window', 'offset_x', 'offset_y', 'mover', 'touch', 'group',
+        'dispatcher', 'target', 'fling_pos', '_visit', '_on_move',
+    )
+
+    def __init__(self, draggable, drag_cls, window, offset_x, offset_y, mover, touch, group=()):
+        self.draggable = draggable
+        self.drag_cls = drag_cls
+        self.window = window
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.mover = mover
+        '''The widget that follows the finger. Either the draggable or its proxy.'''
+        self.touch = touch
+        self.group = group
+        '''The members of the group drag, excluding the draggable.'''
+        self.dispatcher = None
+        self.target = None
+        '''The droppable under the drag, as of the last time the dispatcher looked it up.'''
+        self.fling_pos = None
+        '''Where the drag was thrown to when it was released. This overrides :attr:`pos` if it's not None.'''
+        self._visit = ak.dummy_task
+        self._on_move = ak.ExclusiveEvent()
+
+    @property
+    def pos(self) -> tuple:
+        '''The position of the drag in window coordinates.'''
+        if (fling_pos := self.fling_pos) is not None:
+            return fling_pos
+        mover = self.mover
+        return (mover.x + self.offset_x, mover.y + self.offset_y, )
+
+    async def next_move(self) -> bool:
+        '''
+        Waits for the dispatcher to route a move of the drag to its current target. Returns False if the touch has
+        been released instead.
+        '''
+        args, kwargs = await self._on_move.wait()
+        return args[0]
+
+    def is_over(self, droppable) -> bool:
+        if self.drag_cls not in droppable.drag_classes:
+            return False
+        bounds = get_window_bounds(droppable)
+        if bounds is None:
+            return False
+        x, y = self.pos
+        x1, y1, x2, y2 = bounds
+        return x1 <= x <= x2 and y1 <= y <= y2
+
+
+_MIN_FLING_SAMPLES = 4
+'''The number of samples the velocity of a drag gets tracked with at least, when it can be thrown.'''
+
+_N_FLING_STEPS = 8
+'''How many points on the way of a throw are examined to find the farthest droppable.'''
+
+_N_FLING_REFINEMENTS = 6
+'''How many times the farthest point found among them gets refined by bisection.'''
+
+
+def _project_fling(drag: _OngoingDrag, dx, dy) -> Union[tuple, None]:
+    '''
+    Returns the farthest point on the segment from the drag to ``(drag.pos + (dx, dy))`` that is over a droppable
+    accepting the drag, in window coordinates. Returns None if there is no such point. The segment gets examined at
+    :data:`_N_FLING_STEPS` points, then the boundary past the farthest one found gets narrowed down by bisection.
+    '''
+    x, y = drag.pos
+    drag_cls = drag.drag_cls
+    draggable = drag.draggable
+    window = drag.window
+
+    def hits(p) -> bool:
+        return find_droppable(drag_cls, x + dx * p, y + dy * p, excluding=draggable, window=window) is not None
+
+    n = _N_FLING_STEPS
+    for i in range(n, 0, -1):
+        if hits(i / n):
+            break
+    else:
+        return None
+    lo = i / n
+    if i < n:
+        hi = (i + 1) / n
+        for __ in range(_N_FLING_REFINEMENTS):
+            mid = (lo + hi) * .5
+            if hits(mid):
+                lo = mid
+            else:
+                hi = mid
+    return (x + dx * lo, y + dy * lo, )
+
+
+_ongoing_drags = {}
+'''draggable -> _OngoingDrag'''
+
+_ongoing_drags_by_cls = {}
+'''drag_cls -> {draggable -> _OngoingDrag}'''
+
+
+def _register_ongoing_drag(drag: _OngoingDrag):
+    _ongoing_drags[drag.draggable] = drag
+    drags = _ongoing_drags_by_cls.get(drag.drag_cls)
+    if drags is None:
+        _ongoing_drags_by_cls[drag.drag_cls] = {drag.draggable: drag}
+    else:
+        drags[drag.draggable] = drag
+    start_autoscroll(drag)
+    add_drag(drag)
+
+
+def _unregister_ongoing_drag(draggable):
+    drag = _ongoing_drags.pop(draggable, None)
+    if drag is None:
+        return
+    stop_autoscroll(draggable)
+    remove_drag(drag)
+    drags = _ongoing_drags_by_cls[drag.drag_cls]
+    del drags[draggable]
+    if not drags:
+        del _ongoing_drags_by_cls[drag.drag_cls]
+
+
+def _iter_ongoing_drags(window, drag_cls, droppable):
+    drags = _ongoing_drags if drag_cls is None else _ongoing_drags_by_cls.get(drag_cls, {})
+    for drag in drags.values():
+        if window is not None and drag.window is not window:
+            continue
+        if droppable is not None and not drag.is_over(droppable):
+            continue
+        yield drag
 
 
-def ongoing_drags(*, window=kivy.core.window.Window) -> List[KXDraggableBehavior]:
-    '''Returns a list of draggables currently being dragged'''
-    return [
-        c for c in window.children
-        # maybe it's better not to check the type, like:
-        # getattr(c, 'is_being_dragged', False)
-        if isinstance(c, KXDraggableBehavior) and c.is_being_dragged
-    ]
+def ongoing_drags(*, window=None, drag_cls=None, droppable=None) -> List[KXDraggableBehavior]:
+    '''Returns a list of draggables currently being dragged.
+
+    Arguments
+    ---------
+
+    * ``window`` ... If given, only the drags on this window are returned.
+    * ``drag_cls`` ... If given, only the drags of this ``drag_cls`` are returned.
+    * ``droppable`` ... If given, only the drags currently over this droppable, and acceptable for it, are returned.
+
+    The members of a group drag are included, each right after its leader (the draggable the touch started on).
+
+    This doesn't traverse the widget tree. The cost depends only on the number of ongoing drags and their members.
+    '''
+    draggables = []
+    append = draggables.append
+    extend = draggables.extend
+    for drag in _iter_ongoing_drags(window, drag_cls, droppable):
+        append(drag.draggable)
+        if drag.group:
+            extend(drag.group)
+    return draggables
+
+
+def cancel_drags(*, window=None, drag_cls=None, droppable=None):
+    '''Cancels the ongoing drags. The arguments are the same as :func:`ongoing_drags`'s.
+
+    .. code-block::
+
+        # cancel all ongoing drags
+        cancel_drags()
+
+        # cancel the ongoing drags of a specific 'drag_cls'
+        cancel_drags(drag_cls='card')
+    '''
+    # Cancelling the leader of a group drag cancels the members as well.
+    for drag in tuple(_iter_ongoing_drags(window, drag_cls, droppable)):
+        drag.draggable.drag_cancel()
 
 
 class KXDroppableBehavior:
+    __events__ = ('on_drag_enter', 'on_drag_leave', )
+
     drag_classes = ListProperty([])
     '''Same as drag_n_drop's '''
 
-    def on_touch_up(self, touch):
-        r = super().on_touch_up(touch)
-        touch_ud = touch.ud
-        if touch_ud.get('kivyx_drag_cls', None) in self.drag_classes:
-            if self.collide_point(*touch.pos):
-                touch_ud.setdefault('kivyx_droppable', self)
-        return r
+    n_drags_inside = NumericProperty(0)
+    '''(read-only) The number of the ongoing drags currently over this
+    droppable. This is incremented right before ``on_drag_enter``, and
+    decremented right before ``on_drag_leave``.
+    '''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fbind('drag_classes', update_registration)
+        update_registration(self, self.drag_classes)
 
     def accepts_drag(self, touch, ctx: DragContext, draggable: KXDraggableBehavior) -> bool:
         '''Determines whether the droppable is willing to accept the drag'''
         return True
 
+    def on_drag_enter(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''
+        Called when a drag whose ``drag_cls`` is listed in the :attr:`drag_classes` has entered this droppable. Only
+        the topmost droppable under a drag gets this.
+        '''
+
+    def on_drag_leave(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''
+        Called when a drag has left this droppable, or has ended over it. In the latter case, this comes right
+        after the drag's ``on_drag_succeed``, ``on_drag_fail`` or ``on_drag_cancel`` has been processed, and before
+        its ``on_drag_end``.
+        '''
+
 
 class KXReorderableBehavior:
+    __events__ = ('on_drag_enter', 'on_drag_leave', )
+
     drag_classes = ListProperty([])
     '''Same as drag_n_drop's '''
 
+    n_drags_inside = NumericProperty(0)
+    '''(read-only) Same as :attr:`KXDroppableBehavior.n_drags_inside`.'''
+
     spacer_widgets = ListProperty([])
-    '''A list of spacer widgets. The number of them will be the
-    maximum number of simultaneous drags ``KXReorderableBehavior`` can handle.
+    '''The spacers of this reorderable, for customizing their look. A drag
+    over the reorderable uses one of them, or one from the shared
+    ``spacer_pool`` if all of them are in use, thus any number of drags can be
+    over it at the same time. Leave this empty to use only the shared ones.
 
     This property can be changed only when there is no ongoing drag.
     '''
 
+    spacer_placement = OptionProperty('under', options=('under', 'midpoint'))
+    '''How the spacer follows a drag.
+
+    * ``'under'`` ... The spacer moves to the index of the child under the
+      drag as soon as the drag goes over it.
+    * ``'midpoint'`` ... The spacer moves to the index of a child only after
+      the drag has crossed its midpoint, coming from the spacer's side.
+
+    If the children have different sizes, moving the spacer can put another
+    child under the drag, and with ``'under'``, the spacer may flip between
+    two indices every frame. ``'midpoint'`` doesn't have that problem.
+    Changing this doesn't affect ongoing drags.
+    '''
+
+    spacer_min_travel = NumericProperty(0)
+    '''The distance in pixels a drag has to travel, since the spacer last
+    moved, before the spacer moves again. Changing this doesn't affect ongoing
+    drags.
+    '''
+
+    spacer_min_dwell = NumericProperty(0)
+    '''The time in seconds a new index has to remain the spacer's destination
+    before the spacer actually moves there. The spacer moves once the time has
+    passed even if the drag stays still. Changing this doesn't affect ongoing
+    drags.
+    '''
+
+    spacer_anim_duration = NumericProperty(0)
+    '''If positive, the children pushed aside by the spacer slide to their new
+    positions, taking this many seconds, instead of jumping there.
+
+    The layout still runs only once per spacer move, and the children's
+    ``pos`` is set to the new positions right away. Only their drawing is
+    offset, by a ``Translate`` in their ``canvas.before``, which shrinks to
+    zero over the duration. Thus it's cheap even with hundreds of children.
+    Changing this doesn't affect ongoing drags.
+    '''
+
     def __init__(self, **kwargs):
         self._active_spacers = []
-        self._inactive_spacers = None
-        Clock.schedule_once(self._init_spacers)
+        self._inactive_spacers = []
+        '''the spacers in 'spacer_widgets' that are not in use'''
+        self._children_index = None
+        self._drag_stats = []
+        self._shifter = None
         super().__init__(**kwargs)
-        self.__ud_key = 'KXReorderableBehavior.' + str(self.uid)
+        self.fbind('children', self._invalidate_children_index)
+        self.fbind('drag_classes', update_registration)
+        update_registration(self, self.drag_classes)
+
+    def _invalidate_children_index(self, *args):
+        self._children_index = None
+        if self._shifter is not None:
+            self._shifter.prune()
+
+    def do_layout(self, *args, **kwargs):
+        super().do_layout(*args, **kwargs)
+        self._children_index = None
+        if self._shifter is not None:
+            self._shifter.on_layout(self.children)
+        for stats in self._drag_stats:
+            stats.n_layouts += 1
+
+    def _get_children_index(self) -> ChildrenIndex:
+        index = self._children_index
+        if index is None:
+            self._children_index = index = ChildrenIndex(self)
+        return index
+
+    def _get_shifter(self) -> Union[SiblingShifter, None]:
+        duration = self.spacer_anim_duration
+        if duration <= 0:
+            return None
+        shifter = self._shifter
+        if shifter is None:
+            self._shifter = shifter = SiblingShifter(self)
+        shifter.duration = duration
+        return shifter
 
     def accepts_drag(self, touch, ctx: DragContext, draggable: KXDraggableBehavior) -> bool:
         '''Determines whether the reorderable is willing to accept the drag'''
         return True
 
-    def _init_spacers(self, dt):
-        if self._inactive_spacers is None:
-            self.spacer_widgets.append(_create_spacer())
+    def on_drag_enter(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''Same as :meth:`KXDroppableBehavior.on_drag_enter`. The spacer gets placed right after this.'''
+
+    def on_drag_leave(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''Same as :meth:`KXDroppableBehavior.on_drag_leave`. The spacer has already been removed.'''
 
     def on_spacer_widgets(self, __, spacer_widgets):
         if self._active_spacers:
             raise Exception("Do not change the 'spacer_widgets' when there is an ongoing drag.")
         self._inactive_spacers = [w.__self__ for w in spacer_widgets]
 
+    def transfer_widgets(self, widgets: Sequence[Widget], index=0, *, anim_duration=0., anim_transition='linear'):
+        '''Moves the widgets from wherever they are to this reorderable as a
+        contiguous block, in the order they appear in the layout, starting at
+        the ``index`` (the same as the one of ``add_widget()``). The widgets
+        can be children of any containers, including this one, or have no
+        parent. The ones being dragged get their drags cancelled first.
+
+        .. code-block::
+
+            cart.transfer_widgets(shelf.children[::-1], anim_duration=.3)
+
+        However many widgets are moved, each container lays out only once, in
+        the next frame. If ``anim_duration`` is positive, the snapshots of the
+        widgets fly from their old positions to the new ones, taking that many
+        seconds, while the widgets themselves are invisible. ``anim_transition``
+        is the same as :attr:`KXDraggableBehavior.drag_anim_transition`.
+        Returns the asynckivy task doing it, which can be cancelled to end the
+        animation immediately, or None if there is no animation.
+        '''
+        widgets = [w.__self__ for w in widgets]
+        for w in widgets:
+            if getattr(w, 'is_being_dragged', False):
+                w.drag_cancel()
+        window = self.get_root_window() if anim_duration > 0 else None
+        if window is not None:
+            proxies = []
+            for w in widgets:
+                proxy = create_drag_proxy(w)
+                if w.get_root_window() is window:
+                    proxy.pos = w.to_window(*w.pos)
+                else:
+                    proxy.center = self.to_window(*self.center)
+                proxies.append(proxy)
+        index -= _count_children_before(self, widgets, index)
+        for w in widgets:
+            if w.parent is not None:
+                w.parent.remove_widget(w)
+        _add_widgets_as_a_block(self, widgets, index)
+        if window is None:
+            return None
+        return ak.managed_start(_fly_widgets(window, widgets, proxies, anim_duration, anim_transition))
+
+    def move_widget(self, widget, index):
+        '''Moves a child to the given index.
+
+        This is equivalent to ``self.remove_widget(widget)`` followed by
+        ``self.add_widget(widget, index=index)``, except that the order of
+        the children and the drawing order get changed in one step, which
+        means the ``children`` property fires only once and the layout runs
+        only once.
+        '''
+        self._move_widget(widget, index)
+
+    def _move_widget(self, widget, index, old_index=None):
+        children = self.children
+        if old_index is None or children[old_index] is not widget:
+            old_index = children.index(widget)
+        index = min(index, len(children) - 1)
+        if index == old_index:
+            return
+        canvas = self.canvas
+        w_canvas = widget.canvas
+        if canvas.indexof(w_canvas) == -1:
+            # The child was added to 'canvas.before' or 'canvas.after'.
+            self.remove_widget(widget)
+            self.add_widget(widget, index=index)
+            return
+
+        # update the drawing order in the same way as 'Widget.add_widget()' does
+        canvas.remove(w_canvas)
+        if index == 0:
+            canvas.add(w_canvas)
+        else:
+            if index == len(children) - 1:
+                next_index = canvas.indexof(children[-1].canvas)
+            else:
+                next_child = children[index if index < old_index else index + 1]
+                next_index = canvas.indexof(next_child.canvas)
+                next_index = canvas.length() if next_index == -1 else next_index + 1
+            if next_index == 0 and canvas.has_before:
+                next_index = 1
+            canvas.insert(next_index, w_canvas)
+
+        # update the order of the children in one step
+        if old_index < index:
+            children[old_index:index + 1] = [*children[old_index + 1:index + 1], widget]
+        else:
+            children[index:old_index + 1] = [widget, *children[index:old_index]]
+
     def get_widget_under_drag(self, x, y) -> Tuple[Widget, int]:
         """Returns a tuple of the widget in children that is under the
         given position and its index. Returns (None, None) if there is no
         widget under that position.
         """
-        x, y = self.to_local(x, y)
-        for index, widget in enumerate(self.children):
-            if widget.collide_point(x, y):
-                return (widget, index)
-        return (None, None)
-
-    def on_touch_move(self, touch):
-        ud_key = self.__ud_key
-        touch_ud = touch.ud
-        if ud_key not in touch_ud and self._inactive_spacers and self.collide_point(*touch.pos):
-            drag_cls = touch_ud.get('kivyx_drag_cls', None)
-            if drag_cls is not None:
-                touch_ud[ud_key] = None
-                if drag_cls in self.drag_classes:
-                    ak.managed_start(ak.wait_any(
-                        self._place_a_spacer_widget_under_the_drag(touch),
-                        ak.event(touch.ud['kivyx_draggable'], 'on_drag_end'),
-                    ))
-        return super().on_touch_move(touch)
-
-    async def _place_a_spacer_widget_under_the_drag(self, touch):
-        spacer = self._inactive_spacers.pop()
+        return self._get_children_index().widget_at(*self.to_local(x, y))
+
+    def get_nearest_widget_to_drag(self, x, y) -> Tuple[Widget, int]:
+        """Returns a tuple of the widget in children that is nearest to the
+        given position and its index. Unlike :meth:`get_widget_under_drag`,
+        this one returns a widget even if the position is over the padding or
+        the spacing of the layout. Returns (None, None) if there are no
+        children.
+        """
+        return self._get_children_index().nearest_to(*self.to_local(x, y))
+
+    def _get_drop_index(self, x, y) -> int:
+        '''Returns the index the drag at the given position (window coordinates) would be dropped at.'''
+        parent = self.parent
+        widget, idx = self.get_nearest_widget_to_drag(*window_to_parent(self, x, y)) if parent else (None, None)
+        return 0 if widget is None else idx
+
+    async def _visit_drag(self, drag):
+        '''Places a spacer under the drag, and keeps it there until the drag leaves. (called by the dispatcher)'''
+        own_spacers = self._inactive_spacers
+        spacer = own_spacers.pop() if own_spacers else None
+        shared = spacer is None
+        if shared:
+            spacer = spacer_pool.acquire()
         self._active_spacers.append(spacer)
 
         # LOAD_FAST
-        collide_point = self.collide_point
         get_widget_under_drag = self.get_widget_under_drag
-        remove_widget = self.remove_widget
-        add_widget = self.add_widget
-        touch_ud = touch.ud
+        get_nearest_widget_to_drag = self.get_nearest_widget_to_drag
+        move_widget = self._move_widget
+        to_local = self.to_local
+        get_time = Clock.get_time
+        hypot_ = hypot
+        touch_ud = drag.touch.ud
+        midpoint = self.spacer_placement == 'midpoint'
+        min_travel = self.spacer_min_travel
+        min_dwell = self.spacer_min_dwell
+        shifter = self._get_shifter()
+        children = self.children
+        spacer_idx = 0
+        dropped = False
+        last_x = last_y = 0.
+        '''where the drag was when the spacer last moved'''
+        pending_idx = None
+        pending_since = 0.
+        '''the index waiting for 'min_dwell' to pass, and since when'''
+
+        def find_destination(x, y) -> Tuple[Widget, int]:
+            widget, idx = get_widget_under_drag(x, y)
+            if widget is None:
+                # The touch is over the padding or the spacing.
+                widget, idx = get_nearest_widget_to_drag(x, y)
+            return (None, 0) if widget is None else (widget, idx)
+
+        def place_spacer(x, y):
+            '''(x, y) is in the parent's coordinates.'''
+            nonlocal spacer_idx, last_x, last_y, pending_idx, pending_since
+            widget, idx = find_destination(x, y)
+            if widget is spacer:
+                pending_idx = None
+                return
+            if midpoint and widget is not None and not _has_crossed_the_midpoint(widget, spacer, *to_local(x, y)):
+                pending_idx = None
+                return
+            if min_travel and hypot_(x - last_x, y - last_y) < min_travel:
+                return
+            if min_dwell:
+                now = get_time()
+                if idx != pending_idx:
+                    pending_idx = idx
+                    pending_since = now
+                    return
+                if now - pending_since < min_dwell:
+                    return
+                pending_idx = None
+            last_x = x
+            last_y = y
+            if shifter is not None:
+                shifter.capture(children)
+            move_widget(spacer, idx, spacer_idx)
+            spacer_idx = idx
+
+        stats = touch_ud['kivyx_drag_ctx'].stats
+        if stats is not None:
+            get_widget_under_drag = timed(get_widget_under_drag, stats, 'hit_test_time')
+            get_nearest_widget_to_drag = timed(get_nearest_widget_to_drag, stats, 'hit_test_time')
+            move_widget = counted(move_widget, stats, 'n_spacer_moves')
+            place_spacer = timed(place_spacer, stats, 'move_time')
+            self._drag_stats.append(stats)
 
         try:
+            # The moves are routed outside of the touch dispatching, thus the positions are in window coordinates.
+            to_parent = partial(window_to_parent, self)
+            next_move = drag.next_move
+            if not await next_move():
+                return
+
+            # Put the spacer where the drag entered. Looking it up before the spacer gets added is accurate, as the
+            # spacer's geometry is meaningless until the next layout.
+            last_x, last_y = to_parent(*drag.pos)
+            __, spacer_idx = find_destination(last_x, last_y)
             restore_widget_state(
                 spacer,
                 touch_ud['kivyx_drag_ctx'].original_state,
                 ignore_parent=True)
-            add_widget(spacer)
-            async with _rest_of_touch_events(self, touch) as on_touch_move:
-                while True:
-                    await on_touch_move()
-                    x, y = touch.pos
-                    if collide_point(x, y):
-                        widget, idx = get_widget_under_drag(x, y)
-                        if widget is spacer:
-                            continue
-                        if widget is None:
-                            if self.children:
-                                continue
-                            else:
-                                idx = 0
-                        remove_widget(spacer)
-                        add_widget(spacer, index=idx)
-                    else:
-                        del touch_ud[self.__ud_key]
-                        return
+            if shifter is not None:
+                shifter.capture(children)
+            self.add_widget(spacer, index=spacer_idx)
+
+            while True:
+                if pending_idx is None:
+                    moved = await next_move()
+                else:
+                    # Re-examine the destination once the dwell time has passed, even if the drag stays still.
+                    moved = True
+                    async with ak.move_on_after(max(min_dwell - (get_time() - pending_since), 0.)):
+                        moved = await next_move()
+                if not moved:
+                    break
+                place_spacer(*to_parent(*drag.pos))
+            if drag.fling_pos is not None and (x_y := to_parent(*drag.pos)) != (last_x, last_y):
+                # A throw picks the slot where it lands, regardless of the placement policy.
+                widget, idx = find_destination(*x_y)
+                if widget is not None and widget is not spacer:
+                    if shifter is not None:
+                        shifter.capture(children)
+                    move_widget(spacer, idx, spacer_idx)
+                    spacer_idx = idx
             if 'kivyx_droppable' not in touch_ud:
+                dropped = True
                 touch_ud['kivyx_droppable'] = self
                 touch_ud['kivyx_droppable_index'] = self.children.index(spacer)
+                # Keep the spacer until the drop gets processed, so that the removal of the spacer and the addition of
+                # the draggable are done in the same layout pass.
+                draggable = drag.draggable
+                if draggable.drag_state == 'started':
+                    await ak.event(draggable, 'drag_state')
         finally:
+            if stats is not None:
+                self._drag_stats.remove(stats)
+            if shifter is not None and not dropped and spacer.parent is self:
+                # The children close the gap. (If dropped, the draggable takes the place of the spacer.)
+                shifter.capture(children)
             self.remove_widget(spacer)
-            self._inactive_spacers.append(spacer)
             self._active_spacers.remove(spacer)
+            if shared:
+                spacer_pool.release(spacer)
+            else:
+                own_spacers.append(spacer)
+
+
+def _has_crossed_the_midpoint(widget, spacer, x, y) -> bool:
+    '''Whether the position (local coordinates) is beyond the center of the widget, seen from the spacer.'''
+    cx, cy = widget.center
+    sx, sy = spacer.center
+    return (x - cx) * (cx - sx) + (y - cy) * (cy - sy) >= 0.
 
 
 r = Factory.register
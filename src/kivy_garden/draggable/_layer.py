@@ -0,0 +1,48 @@
+'''
+(internal)
+A widget at the top of each window that holds all the widgets following the fingers, such as the draggables being
+dragged and their proxies.
+
+Putting them into a single child of the window, rather than into the window itself, keeps the window from binding to
+and resizing each of them, and lets the touch events of the ongoing drags skip them. They receive their own touches
+through grabs, so dispatching the moves and the releases of the dragged touches to them is pure overhead, which grows
+quadratically with the number of simultaneous drags.
+'''
+
+__all__ = ('get_drag_layer', )
+
+from weakref import WeakKeyDictionary
+
+from kivy.uix.widget import Widget
+
+_layers = WeakKeyDictionary()
+'''window -> _DragLayer'''
+
+
+class _DragLayer(Widget):
+    '''
+    Its children are in window coordinates, as it sits at the origin of the window and doesn't transform them.
+    '''
+
+    def on_touch_move(self, touch):
+        if 'kivyx_draggable' in touch.ud:
+            return False
+        return super().on_touch_move(touch)
+
+    def on_touch_up(self, touch):
+        if 'kivyx_draggable' in touch.ud:
+            return False
+        return super().on_touch_up(touch)
+
+
+def get_drag_layer(window) -> Widget:
+    '''Returns the drag layer of the window, putting it above everything else on the window if it isn't there.'''
+    layer = _layers.get(window)
+    if layer is None:
+        _layers[window] = layer = _DragLayer(size_hint=(None, None), size=(0, 0), pos=(0, 0))
+    children = window.children
+    if not children or children[0] is not layer:
+        if layer.parent is not None:
+            layer.parent.remove_widget(layer)
+        window.add_widget(layer)
+    return layer
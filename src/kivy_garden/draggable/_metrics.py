@@ -0,0 +1,111 @@
+__all__ = ('DragStats', 'DragMetrics', 'drag_metrics', )
+
+from dataclasses import dataclass, fields
+from time import perf_counter
+
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, NumericProperty, ObjectProperty
+
+
+@dataclass
+class DragStats:
+    '''Performance statistics of a single drag. All the times are in seconds.'''
+
+    drag_cls: str = ''
+
+    result: str = None
+    '''``'succeeded'``, ``'failed'`` or ``'cancelled'``.'''
+
+    n_moves: int = 0
+    '''The number of ``on_touch_move`` events the draggable processed, including the ones coalesced when
+    :attr:`KXDraggableBehavior.drag_coalesce_moves` is True.'''
+
+    move_time: float = 0.
+    '''Time spent in processing ``on_touch_move`` events, by both the draggable and the reorderables.'''
+
+    hit_test_time: float = 0.
+    '''Time spent in :meth:`KXReorderableBehavior.get_widget_under_drag` and
+    :meth:`KXReorderableBehavior.get_nearest_widget_to_drag`.'''
+
+    n_spacer_moves: int = 0
+    '''The number of times the spacers got repositioned.'''
+
+    n_layouts: int = 0
+    '''The number of layout passes the reorderables did while hosting the spacer of the drag.'''
+
+    drop_latency: float = None
+    '''Time from the touch-up to the dispatch of ``on_drag_succeed`` or ``on_drag_fail``. None if the drag was
+    cancelled before that.'''
+
+
+class DragMetrics(EventDispatcher):
+    '''
+    Collects :class:`DragStats` of every drag while :attr:`enabled` is True.
+
+    .. code-block::
+
+        from kivy_garden.draggable import drag_metrics
+
+        drag_metrics.enabled = True
+        drag_metrics.bind(on_drag_stats=lambda __, stats: print(stats))
+        ...
+        print(drag_metrics.n_drags, drag_metrics.totals.move_time)
+    '''
+    __events__ = ('on_drag_stats', )
+
+    enabled = BooleanProperty(False)
+    '''Whether to collect the statistics. Changing this doesn't affect ongoing drags. When disabled, the cost of this
+    feature is a single attribute lookup per drag.'''
+
+    n_drags = NumericProperty(0)
+    '''(read-only) The number of drags collected since the last :meth:`reset`.'''
+
+    totals = ObjectProperty(None)
+    '''(read-only) A :class:`DragStats` holding the sum of the statistics of the drags collected since the last
+    :meth:`reset`. Its ``drag_cls`` and ``result`` are always None, and its ``drop_latency`` is the sum of the non-None
+    ones.'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.totals = DragStats(drag_cls=None)
+
+    def reset(self):
+        self.totals = DragStats(drag_cls=None)
+        self.n_drags = 0
+
+    def _add(self, stats: DragStats):
+        totals = self.totals
+        for name in _SUMMABLE_FIELDS:
+            value = getattr(stats, name)
+            if value is not None:
+                setattr(totals, name, (getattr(totals, name) or 0) + value)
+        self.n_drags += 1
+        self.dispatch('on_drag_stats', stats)
+
+    def on_drag_stats(self, stats: DragStats):
+        '''Fired when a drag ends, with its statistics.'''
+
+
+_SUMMABLE_FIELDS = tuple(f.name for f in fields(DragStats) if f.name not in ('drag_cls', 'result', ))
+
+drag_metrics = DragMetrics()
+'''The :class:`DragMetrics` instance this library reports to.'''
+
+
+def timed(func, stats: DragStats, attr_name):
+    '''(internal) Wraps a function so that the time spent in it is added to the ``stats.<attr_name>``.'''
+    def timed_func(*args, **kwargs):
+        t = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            setattr(stats, attr_name, getattr(stats, attr_name) + perf_counter() - t)
+    return timed_func
+
+
+def counted(func, stats: DragStats, attr_name):
+    '''(internal) Wraps a function so that the ``stats.<attr_name>`` is incremented on each call.'''
+    def counted_func(*args, **kwargs):
+        setattr(stats, attr_name, getattr(stats, attr_name) + 1)
+        return func(*args, **kwargs)
+    return counted_func
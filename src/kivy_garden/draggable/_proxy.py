@@ -0,0 +1,169 @@
+__all__ = ('ProxyTextureCache', 'proxy_texture_cache', 'create_drag_proxy', )
+
+from collections import OrderedDict
+from weakref import ref
+
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Translate, Color, Rectangle, Ellipse
+from kivy.metrics import dp
+from kivy.uix.widget import Widget
+
+
+class ProxyTextureCache:
+    '''
+    The snapshots of the draggables dragged through proxies, which are the ones whose
+    :attr:`KXDraggableBehavior.drag_use_proxy` is True and the members of group drags. A snapshot is taken
+    the first time a widget of a certain size gets dragged, and is reused by its subsequent drags until it gets
+    evicted. The least recently used one is evicted first.
+
+    .. code-block::
+
+        from kivy_garden.draggable import proxy_texture_cache
+
+        proxy_texture_cache.max_entries = 100
+
+        # The appearance of the card has changed. Its next drag needs a new snapshot.
+        proxy_texture_cache.discard(card)
+    '''
+
+    def __init__(self, max_entries=32):
+        self._textures = OrderedDict()
+        '''(weakref to a widget, width, height) -> texture'''
+        self.max_entries = max_entries
+
+    @property
+    def max_entries(self) -> int:
+        '''The maximum number of textures to keep. 0 disables caching.'''
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value):
+        if value < 0:
+            raise ValueError(f"'max_entries' must be zero or positive. (was {value})")
+        self._max_entries = value
+        self._evict()
+
+    def __len__(self):
+        return len(self._textures)
+
+    def get(self, widget):
+        '''Returns the snapshot of the widget in its current size, taking it if there isn't one in the cache.'''
+        w = widget.__self__
+        key = (ref(w), int(w.width), int(w.height), )
+        textures = self._textures
+        texture = textures.get(key)
+        if texture is None:
+            texture = _take_snapshot(w)
+            if self._max_entries:
+                textures[key] = texture
+                self._evict()
+        else:
+            textures.move_to_end(key)
+        return texture
+
+    def discard(self, widget):
+        '''Discards the snapshots of the widget, in all sizes.'''
+        w = widget.__self__
+        textures = self._textures
+        for key in [key for key in textures if key[0]() is w]:
+            del textures[key]
+
+    def clear(self):
+        self._textures.clear()
+
+    def _evict(self):
+        textures = self._textures
+        # The snapshots of the widgets that no longer exist go first.
+        for key in [key for key in textures if key[0]() is None]:
+            del textures[key]
+        max_entries = self._max_entries
+        while len(textures) > max_entries:
+            textures.popitem(last=False)
+
+
+proxy_texture_cache = ProxyTextureCache()
+'''The :class:`ProxyTextureCache` instance this library uses.'''
+
+
+def _take_snapshot(widget):
+    '''Renders the widget into a texture, in the same way as ``Widget.export_as_image()`` does.'''
+    width = max(int(widget.width), 1)
+    height = max(int(widget.height), 1)
+    canvas = widget.canvas
+    parent = widget.parent
+    parent_canvas = None if parent is None else parent.canvas
+    idx = -1 if parent_canvas is None else parent_canvas.indexof(canvas)
+    if idx > -1:
+        parent_canvas.remove(canvas)
+    try:
+        fbo = Fbo(size=(width, height), with_stencilbuffer=True)
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Translate(-widget.x, -widget.y, 0)
+        fbo.add(canvas)
+        fbo.draw()
+        fbo.remove(canvas)
+    finally:
+        if idx > -1:
+            parent_canvas.insert(idx, canvas)
+    return fbo.texture
+
+
+_MAX_PILE_LAYERS = 3
+'''The maximum number of the other members of a group drag whose snapshots are shown beneath the one being dragged.'''
+
+
+class _DragProxy(Widget):
+    '''
+    A textured quad that follows the finger in place of the draggable. In a group drag, the snapshots of the other
+    members are piled beneath it, and a badge shows the number of the members.
+    '''
+
+    def __init__(self, texture, pile=(), n_members=1, **kwargs):
+        super().__init__(**kwargs)
+        self.texture = texture
+        offset = dp(4)
+        rects = []
+        with self.canvas:
+            Color()
+            for i in range(len(pile), 0, -1):
+                rects.append((Rectangle(texture=pile[i - 1], size=self.size), offset * i, -offset * i, ))
+            rects.append((Rectangle(texture=texture, size=self.size), 0, 0, ))
+            if n_members > 1:
+                from kivy.core.text import Label as CoreLabel
+                label = CoreLabel(text=str(n_members), font_size=dp(14), bold=True)
+                label.refresh()
+                label_texture = label.texture
+                diameter = max(label_texture.width, label_texture.height) + dp(8)
+                Color(.9, .2, .2)
+                badge = Ellipse(size=(diameter, diameter))
+                Color()
+                badge_text = Rectangle(texture=label_texture, size=label_texture.size)
+            else:
+                badge = None
+
+        def update_rects(__, value):
+            x, y = self.pos
+            w, h = self.size
+            for rect, dx, dy in rects:
+                rect.pos = (x + dx, y + dy)
+                rect.size = (w, h)
+            if badge is not None:
+                d = badge.size[0]
+                badge.pos = (x + w - d * .75, y + h - d * .25)
+                tw, th = badge_text.size
+                badge_text.pos = (badge.pos[0] + (d - tw) / 2., badge.pos[1] + (d - th) / 2.)
+        self.fbind('pos', update_rects)
+        self.fbind('size', update_rects)
+        update_rects(None, None)
+
+
+def create_drag_proxy(widget, group=()) -> Widget:
+    '''(internal) Creates a widget that looks the same as the given one, or a pile of the group if it's given.'''
+    get = proxy_texture_cache.get
+    return _DragProxy(
+        get(widget),
+        pile=[get(w) for w in group[:_MAX_PILE_LAYERS]],
+        n_members=len(group) + 1,
+        size_hint=(None, None), size=widget.size,
+    )
@@ -0,0 +1,322 @@
+'''
+(internal)
+The reorderable for RecycleView. Unlike :class:`KXReorderableBehavior`, it works on the data list instead of the
+children, thus only the visible rows exist as widgets.
+'''
+
+__all__ = ('KXRecycleReorderableBehavior', 'KXRecycleSpacer', )
+
+from bisect import bisect_left, bisect_right
+from functools import partial
+from weakref import WeakKeyDictionary, WeakSet
+
+from kivy.properties import ListProperty, StringProperty, NumericProperty
+from kivy.factory import Factory
+from kivy.graphics import Color, Rectangle
+from kivy.uix.widget import Widget
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataAdapter
+import asynckivy as ak
+
+from ._impl import KXDraggableBehavior, DragContext, _ongoing_drags
+from ._registry import update_registration, window_to_parent
+from ._dispatcher import set_target
+from ._metrics import timed, counted
+
+_detached_data = WeakKeyDictionary()
+'''view that has left a RecycleView by being dragged -> the data item it was displaying'''
+
+_watched_views = WeakSet()
+'''views whose 'on_drag_start' is bound to '_on_view_drag_start' '''
+
+
+class KXRecycleSpacer(Widget):
+    '''The default view class of the gaps. It looks the same as the default spacer of
+    :class:`KXReorderableBehavior`.'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self.canvas:
+            Color(.2, .2, .2, .7)
+            rect = Rectangle(pos=self.pos, size=self.size)
+        self.fbind('pos', lambda __, value: setattr(rect, 'pos', value))
+        self.fbind('size', lambda __, value: setattr(rect, 'size', value))
+
+
+class _RecycleDataAdapter(RecycleDataAdapter):
+    def get_view(self, index, data_item, viewclass):
+        view = super().get_view(index, data_item, viewclass)
+        if view is not None and view not in _watched_views and isinstance(view, KXDraggableBehavior):
+            # The views are shared among RecycleViews through the global cache, so the binding is done only once per
+            # view and the owner is looked up when a drag starts.
+            _watched_views.add(view)
+            view.fbind('on_drag_start', _on_view_drag_start)
+        return view
+
+
+def _on_view_drag_start(view, touch, ctx: DragContext):
+    layout_manager = ctx.original_state['parent']
+    rv = getattr(layout_manager, 'recycleview', None)
+    if isinstance(rv, KXRecycleReorderableBehavior):
+        rv._detach_view(view, touch, ctx)
+
+
+def _vertical_key(opt):
+    return -opt['pos'][1]
+
+
+def _horizontal_key(opt):
+    return opt['pos'][0]
+
+
+class KXRecycleReorderableBehavior:
+    '''
+    A mix-in class for RecycleView that makes its data reorderable by drag & drop.
+
+    .. code-block::
+
+        class ReorderableRecycleView(KXRecycleReorderableBehavior, RecycleView):
+            pass
+
+    The ``viewclass`` has to be a :class:`KXDraggableBehavior` subclass for the rows to be draggable. When a row gets
+    dragged, its view is detached from the RecycleView and its item in the ``data`` is replaced with a gap, an item
+    whose view class is :attr:`spacer_viewclass`. The gap follows the drag, and gets replaced with the dragged item
+    when the drag is dropped. If the drag fails or gets cancelled, the item is put back to where it was.
+
+    Everything is done through the ``data``, so only the visible rows exist as widgets no matter how many items the
+    ``data`` has, and finding the index under a drag takes ``O(log n)`` time with ``RecycleBoxLayout``.
+    '''
+
+    __events__ = ('on_drag_enter', 'on_drag_leave', )
+
+    drag_classes = ListProperty([])
+    '''Same as drag_n_drop's '''
+
+    n_drags_inside = NumericProperty(0)
+    '''(read-only) Same as :attr:`KXDroppableBehavior.n_drags_inside`.'''
+
+    spacer_viewclass = StringProperty('KXRecycleSpacer')
+    '''The name of the view class of the gaps, which is looked up from ``kivy.factory.Factory``. Each gap gets the
+    ``size`` and ``size_hint`` of the draggable at the time the drag started.
+
+    If the ``key_viewclass`` of the RecycleView is None when the first gap is created, it will be set to
+    ``'viewclass'``.
+    '''
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('view_adapter', _RecycleDataAdapter())
+        self._gaps = {}
+        self._detached_indices = {}
+        self._layout_is_stale = True
+        super().__init__(**kwargs)
+        self.fbind('drag_classes', update_registration)
+        update_registration(self, self.drag_classes)
+
+    def refresh_from_data(self, *args, **kwargs):
+        self._layout_is_stale = True
+        super().refresh_from_data(*args, **kwargs)
+
+    def refresh_views(self, *args):
+        super().refresh_views(*args)
+        self._layout_is_stale = False
+
+    def accepts_drag(self, touch, ctx: DragContext, draggable: KXDraggableBehavior) -> bool:
+        '''Determines whether the reorderable is willing to accept the drag'''
+        return True
+
+    def on_drag_enter(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''Same as :meth:`KXDroppableBehavior.on_drag_enter`. The gap gets placed right after this.'''
+
+    def on_drag_leave(self, touch, ctx: DragContext, draggable: KXDraggableBehavior):
+        '''Same as :meth:`KXDroppableBehavior.on_drag_leave`. The gap has already been removed.'''
+
+    def widget_to_datum(self, widget) -> dict:
+        '''
+        Converts a widget dropped to this RecycleView into an item of the ``data``. The default implementation only
+        knows the widgets that came from a :class:`KXRecycleReorderableBehavior`. Override this if you want to accept
+        other widgets.
+        '''
+        try:
+            return _detached_data.pop(widget)
+        except KeyError:
+            raise ValueError(
+                f"Don't know how to convert {widget!r} into an item of the data. "
+                f"Override {self.__class__.__name__}.widget_to_datum().") from None
+
+    def add_widget(self, widget, *args, **kwargs):
+        '''
+        Adding a :class:`KXDraggableBehavior` inserts an item converted from it by :meth:`widget_to_datum` into the
+        ``data`` at the given ``index``, which is the index of the data, not the children. This is what happens when
+        a drag is dropped to this RecycleView.
+        '''
+        if not isinstance(widget, KXDraggableBehavior):
+            return super().add_widget(widget, *args, **kwargs)
+        self._add_widgets((widget, ), kwargs.get('index', args[0] if args else 0))
+
+    def _add_widgets(self, widgets, index):
+        '''
+        Inserts the items converted from the draggables into the ``data`` as a contiguous block, in one step so that
+        the RecycleView refreshes only once. If the first one has a gap in this RecycleView, the block replaces it.
+        '''
+        datums = [self.widget_to_datum(w) for w in widgets]
+        data = self.data
+        gap = self._gaps.pop(widgets[0], None)
+        idx = None if gap is None else self._index_of_gap(gap, index)
+        if idx is None:
+            index = min(index, len(data))
+            data[index:index] = datums
+        else:
+            data[idx:idx + 1] = datums
+
+    def get_data_index_under_drag(self, x, y) -> int:
+        '''
+        Returns the index of the item of the ``data`` that is under the given position (parent coordinates), or the
+        nearest one if there is none under it. Returns None if the layout is not up-to-date with the ``data``.
+        '''
+        lm = self.layout_manager
+        if lm is None or self._layout_is_stale:
+            return None
+        opts = lm.view_opts
+        n = len(opts)
+        if not n:
+            return 0
+        x, y = self.to_local(x, y)
+        if isinstance(lm, RecycleBoxLayout):
+            if lm.orientation == 'vertical':
+                # the first item whose bottom is below the position
+                i = bisect_left(opts, -y, key=_vertical_key)
+            else:
+                # the last item whose left is left of the position
+                i = bisect_right(opts, x, key=_horizontal_key) - 1
+            return max(0, min(i, n - 1))
+        return lm.get_view_index_at((x, y))
+
+    def _get_drop_index(self, x, y) -> int:
+        '''Returns the index of the data the drag at the given position (window coordinates) would be dropped at.'''
+        parent = self.parent
+        idx = self.get_data_index_under_drag(*window_to_parent(self, x, y)) if parent else None
+        return len(self.data) if idx is None else idx
+
+    def _index_of_gap(self, gap, hint):
+        data = self.data
+        if 0 <= hint < len(data) and data[hint] is gap:
+            return hint
+        for i, datum in enumerate(data):
+            if datum is gap:
+                return i
+        return None
+
+    def _create_gap(self, ctx: DragContext) -> dict:
+        key = self.key_viewclass
+        if key is None:
+            self.key_viewclass = key = 'viewclass'
+        state = ctx.original_state
+        return {
+            key: self.spacer_viewclass,
+            'size': [state['width'], state['height']],
+            'size_hint': [state['size_hint_x'], state['size_hint_y']],
+        }
+
+    def _remove_gap(self, draggable, hint=0):
+        gap = self._gaps.pop(draggable, None)
+        if gap is None:
+            return
+        idx = self._index_of_gap(gap, hint)
+        if idx is not None:
+            del self.data[idx]
+
+    def _detach_view(self, view, touch, ctx: DragContext):
+        '''Called when one of the views started being dragged.'''
+        lm = self.layout_manager
+        index = lm.view_indices.pop(view, None)
+        if index is None:
+            return
+        views = self.view_adapter.views
+        if views.get(index) is view:
+            del views[index]
+        # The view no longer belongs to the layout, so it shouldn't go back there when the drag fails.
+        ctx.original_state['parent'] = None
+        if ctx.proxy is not None and view.parent is not None:
+            # The gap takes the place of the view instead.
+            view.parent.remove_widget(view)
+        data = self.data
+        _detached_data[view] = datum = data[index]
+        self._gaps[view] = gap = self._create_gap(ctx)
+        data[index] = gap
+        ak.managed_start(self._put_back_the_datum_if_the_drag_fails(view, datum, index))
+        drag = _ongoing_drags.get(view)
+        if drag is not None and drag.drag_cls in self.drag_classes:
+            self._detached_indices[view] = index
+            set_target(drag, self)
+        else:
+            self._remove_gap(view, index)
+
+    async def _put_back_the_datum_if_the_drag_fails(self, view, datum, index):
+        await ak.event(view, 'on_drag_end')
+        if _detached_data.pop(view, None) is None or view.drag_state == 'succeeded':
+            return
+        self._remove_gap(view, index)
+        data = self.data
+        data.insert(min(index, len(data)), datum)
+
+    async def _visit_drag(self, drag):
+        '''Places a gap under the drag, and keeps it there until the drag leaves. (called by the dispatcher)'''
+        draggable = drag.draggable
+        touch_ud = drag.touch.ud
+        ctx = touch_ud['kivyx_drag_ctx']
+        gap = self._gaps.get(draggable)
+        if gap is None:
+            self._gaps[draggable] = gap = self._create_gap(ctx)
+            gap_idx = None
+        else:
+            # The drag started from this RecycleView, and the gap is where the view was.
+            gap_idx = self._index_of_gap(gap, self._detached_indices.pop(draggable, 0))
+
+        # LOAD_FAST
+        get_data_index_under_drag = self.get_data_index_under_drag
+        index_of_gap = self._index_of_gap
+        data = self.data
+
+        def move_gap(idx):
+            nonlocal gap_idx
+            if gap_idx is None:
+                data.insert(idx, gap)
+            else:
+                cur = index_of_gap(gap, gap_idx)
+                # update the data in one step so that the RecycleView refreshes only once
+                if cur < idx:
+                    data[cur:idx + 1] = [*data[cur + 1:idx + 1], gap]
+                else:
+                    data[idx:cur + 1] = [gap, *data[idx:cur]]
+            gap_idx = idx
+
+        def place_gap(x, y):
+            '''(x, y) is in the parent's coordinates.'''
+            idx = get_data_index_under_drag(x, y)
+            if idx is None or idx == gap_idx:
+                # The layout hasn't caught up with the previous move yet, or the gap is already there.
+                return
+            move_gap(idx)
+
+        stats = ctx.stats
+        if stats is not None:
+            get_data_index_under_drag = timed(get_data_index_under_drag, stats, 'hit_test_time')
+            move_gap = counted(move_gap, stats, 'n_spacer_moves')
+            place_gap = timed(place_gap, stats, 'move_time')
+
+        try:
+            to_parent = partial(window_to_parent, self)
+            while await drag.next_move():
+                place_gap(*to_parent(*drag.pos))
+            if 'kivyx_droppable' not in touch_ud:
+                touch_ud['kivyx_droppable'] = self
+                touch_ud['kivyx_droppable_index'] = \
+                    len(data) if gap_idx is None else index_of_gap(gap, gap_idx)
+            # Keep the gap until the drop gets processed, so that the rows don't shift back and forth.
+            await ak.sleep_forever()
+        finally:
+            self._remove_gap(draggable, gap_idx or 0)
+
+
+Factory.register('KXRecycleReorderableBehavior', cls=KXRecycleReorderableBehavior)
+Factory.register('KXRecycleSpacer', cls=KXRecycleSpacer)
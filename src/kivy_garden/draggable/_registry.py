@@ -0,0 +1,432 @@
+'''
+(internal)
+A global registry of droppables and reorderables, keyed by their ``drag_classes``.
+It allows the drop target of a drag to be resolved without dispatching ``on_touch_up`` throughout the widget tree.
+'''
+
+__all__ = (
+    'update_registration', 'iter_droppables', 'find_droppable', 'get_window_bounds', 'is_drawn_above',
+    'window_to_parent', 'window_to_local', 'get_scroll_path', 'tree_version',
+)
+
+from collections import defaultdict
+from math import floor
+from weakref import WeakSet, WeakKeyDictionary, ref
+
+from kivy.uix.stencilview import StencilView
+from kivy.uix.scrollview import ScrollView
+
+_droppables_by_cls = defaultdict(WeakSet)
+'''drag_cls -> droppables that have the drag_cls in their drag_classes'''
+
+_registered_classes = WeakKeyDictionary()
+'''droppable -> the drag classes it's currently registered under'''
+
+_trackers = WeakKeyDictionary()
+'''droppable -> _BoundsTracker'''
+
+_tree_version = 0
+'''See :func:`tree_version`.'''
+
+_bounds_version = 0
+'''Incremented whenever the cached bounds of a droppable get invalidated, except by the scrolling of a ScrollView,
+which is detected by comparing its translation.'''
+
+_indexes = {}
+'''drag_cls -> _DroppableIndex. Cleared whenever the :func:`tree_version` changes.'''
+
+_MAX_CELLS_PER_DROPPABLE = 64
+
+_EXTRA_PROPERTIES_TO_WATCH = ('scroll_x', 'scroll_y', 'transform', )
+'''Properties of ancestors that affect the window coordinates of their descendants, besides 'pos'.'''
+
+
+def update_registration(droppable, drag_classes):
+    '''Registers the droppable under the given drag classes, and unregisters it from the others.'''
+    droppable = droppable.__self__
+    new = frozenset(drag_classes)
+    old = _registered_classes.get(droppable, frozenset())
+    if new != old:
+        _on_tree_changed()
+    for drag_cls in old - new:
+        _droppables_by_cls[drag_cls].discard(droppable)
+    for drag_cls in new - old:
+        _droppables_by_cls[drag_cls].add(droppable)
+    if new:
+        _registered_classes[droppable] = new
+        if droppable not in _trackers:
+            _trackers[droppable] = _BoundsTracker(droppable)
+    else:
+        _registered_classes.pop(droppable, None)
+        tracker = _trackers.pop(droppable, None)
+        if tracker is not None:
+            tracker.close()
+
+
+def iter_droppables(drag_cls):
+    '''Iterates over the droppables registered under the given drag class.'''
+    droppables = _droppables_by_cls.get(drag_cls)
+    return iter(()) if droppables is None else iter(tuple(droppables))
+
+
+def get_window_bounds(droppable):
+    '''
+    Returns the visible area of the droppable as ``(x, y, right, top)`` in window coordinates, or None if the
+    droppable is not on a window or not visible at all. The area is clipped by its StencilView ancestors, such as
+    ScrollView.
+    The result is cached until the droppable or any of its ancestors moves.
+    '''
+    tracker = _trackers.get(droppable)
+    if tracker is None:
+        return _calc_window_bounds(droppable)
+    return tracker.get_bounds()
+
+
+def window_to_parent(widget, x, y) -> tuple:
+    '''
+    Converts a position in window coordinates to the coordinates of the widget's parent, the same as
+    ``widget.parent.to_widget(x, y)`` does. If the widget is a registered droppable, the transformation is cached until
+    the widget or any of its ancestors moves, so this doesn't walk up the widget tree.
+    '''
+    tracker = _trackers.get(widget)
+    if tracker is None:
+        return widget.parent.to_widget(x, y)
+    return tracker.window_to_parent(x, y)
+
+
+def window_to_local(widget, x, y) -> tuple:
+    '''
+    Converts a position in window coordinates to the local coordinates of the widget, the same as
+    ``widget.to_widget(x, y)`` does. The transformation is cached in the same way as :func:`window_to_parent`.
+    '''
+    tracker = _trackers.get(widget)
+    if tracker is None:
+        return widget.to_widget(x, y)
+    return widget.to_local(*tracker.window_to_parent(x, y))
+
+
+def get_scroll_path(droppable):
+    '''
+    Returns ``(window, ancestors, scrollviews)`` of the droppable, or None if it's not on a window or has no ScrollView
+    among itself and its ancestors. ``ancestors`` is a set of the droppable and its ancestors, and ``scrollviews`` is a
+    list of the ScrollViews among them, innermost first.
+    The result is cached until :func:`tree_version` changes.
+    '''
+    tracker = _trackers.get(droppable)
+    if tracker is None:
+        return None
+    return tracker.get_scroll_path()
+
+
+def _on_tree_changed():
+    global _tree_version
+    _tree_version += 1
+    _indexes.clear()
+
+
+def tree_version() -> int:
+    '''
+    A number that changes whenever a droppable gets registered or unregistered, or a registered droppable or any of its
+    ancestors changes its parent.
+    '''
+    return _tree_version
+
+
+def find_droppable(drag_cls, x, y, *, excluding=None, window=None):
+    '''
+    Returns the droppable that is topmost among the ones accepting the ``drag_cls`` and containing the given position
+    (window coordinates). Returns None if there is no such droppable.
+    The ``excluding`` widget and its descendants are not taken into account. If ``window`` is given, the droppables on
+    the other windows are not taken into account either.
+    Only the droppables in the same cell of a grid index as the position are examined. The index gets rebuilt when any
+    of the droppables moves.
+    '''
+    index = _indexes.get(drag_cls)
+    if index is None or not index.is_valid():
+        if drag_cls not in _droppables_by_cls:
+            return None
+        _indexes[drag_cls] = index = _DroppableIndex(drag_cls)
+    found = None
+    for droppable, (x1, y1, x2, y2) in index.candidates(x, y):
+        if not (x1 <= x <= x2 and y1 <= y <= y2):
+            continue
+        if excluding is not None and _is_descendant_or_self(droppable, excluding):
+            continue
+        if window is not None and _path_from_root(droppable)[0] is not window:
+            continue
+        if found is None or is_drawn_above(droppable, found):
+            found = droppable
+    return found
+
+
+def is_drawn_above(a, b) -> bool:
+    '''
+    Whether the widget ``a`` is drawn above the widget ``b``. A widget is regarded as being drawn above its ancestors,
+    in the same way as touch events are dispatched to descendants first.
+    '''
+    path_a = _path_from_root(a)
+    path_b = _path_from_root(b)
+    if path_a[0] is not path_b[0]:
+        return False
+    for i, (wa, wb) in enumerate(zip(path_a, path_b)):
+        if wa is not wb:
+            children = path_a[i - 1].children
+            return children.index(wa) < children.index(wb)
+    return len(path_a) > len(path_b)
+
+
+def _path_from_root(widget) -> list:
+    path = []
+    while widget is not None:
+        path.append(widget)
+        parent = widget.parent
+        if parent is widget:  # Window
+            break
+        widget = parent
+    path.reverse()
+    return path
+
+
+def _is_descendant_or_self(widget, ancestor) -> bool:
+    while widget is not None:
+        if widget is ancestor:
+            return True
+        parent = widget.parent
+        if parent is widget:  # Window
+            return False
+        widget = parent
+    return False
+
+
+def _calc_window_bounds(widget):
+    x1, y1, x2, y2 = _rect_in_window(widget)
+    parent = widget.parent
+    while parent is not None:
+        if parent.parent is parent:  # Window
+            break
+        if isinstance(parent, StencilView):
+            sx1, sy1, sx2, sy2 = _rect_in_window(parent)
+            x1 = max(x1, sx1)
+            y1 = max(y1, sy1)
+            x2 = min(x2, sx2)
+            y2 = min(y2, sy2)
+        parent = parent.parent
+    else:
+        # not on a window
+        return None
+    if x1 > x2 or y1 > y2:
+        return None
+    return (x1, y1, x2, y2, )
+
+
+def _rect_in_window(widget):
+    to_window = widget.to_window
+    x, y = widget.pos
+    r, t = widget.right, widget.top
+    xs, ys = zip(to_window(x, y), to_window(r, y), to_window(x, t), to_window(r, t))
+    return (min(xs), min(ys), max(xs), max(ys), )
+
+
+def _calc_window_to_parent(widget) -> tuple:
+    '''
+    Returns the transformation from window coordinates to the coordinates of the widget's parent as the coefficients
+    ``(a, b, c, d, e, f)`` of ``(a * x + b * y + e, c * x + d * y + f)``. Every transformation a widget can have in 2D
+    is affine, so it's determined by where three points go.
+    '''
+    to_widget = widget.parent.to_widget
+    e, f = to_widget(0., 0.)
+    ax, ay = to_widget(1., 0.)
+    bx, by = to_widget(0., 1.)
+    return (_snap(ax - e), _snap(bx - e), _snap(ay - f), _snap(by - f), e, f, )
+
+
+def _snap(v):
+    '''Cancels the rounding error of the subtractions above, which mostly yield 0 or 1.'''
+    r = round(v)
+    return float(r) if abs(v - r) < 1e-9 else v
+
+
+class _BoundsTracker:
+    '''
+    Caches the window bounds of a widget and the transformation from window coordinates to its parent's, and
+    invalidates them when the widget or any of its ancestors moves.
+    '''
+    __slots__ = (
+        '_widget_ref', '_bounds', '_to_parent', '_bindings', '_translates', '_translations', '_scroll_path',
+        '__weakref__',
+    )
+
+    def __init__(self, widget):
+        self._widget_ref = ref(widget)
+        self._bounds = None
+        self._to_parent = None
+        self._bindings = None
+        self._translates = ()
+        '''The 'g_translate' of the ScrollView ancestors. A ScrollView moves its content by changing it in a Clock
+        callback after its 'scroll_x' or 'scroll_y' has changed, thus watching those properties isn't enough.'''
+        self._translations = ()
+        '''The values of ``_translates`` the caches are based on.'''
+        self._scroll_path = None
+        '''See :func:`get_scroll_path`. False if there is none. Available while bound.'''
+
+    def get_bounds(self):
+        if self._translates:
+            self._check_translates()
+        bounds = self._bounds
+        if bounds is None:
+            widget = self._widget_ref()
+            if widget is None:
+                return None
+            if self._bindings is None:
+                self._bind(widget)
+            bounds = _calc_window_bounds(widget)
+            # 'False' means "not on a window", which is distinguished from "not calculated yet".
+            self._bounds = False if bounds is None else bounds
+            return bounds
+        return bounds or None
+
+    def window_to_parent(self, x, y) -> tuple:
+        if self._translates:
+            self._check_translates()
+        m = self._to_parent
+        if m is None:
+            widget = self._widget_ref()
+            if self._bindings is None:
+                self._bind(widget)
+            self._to_parent = m = _calc_window_to_parent(widget)
+        a, b, c, d, e, f = m
+        return (a * x + b * y + e, c * x + d * y + f, )
+
+    def get_scroll_path(self):
+        if self._bindings is None:
+            widget = self._widget_ref()
+            if widget is None:
+                return None
+            self._bind(widget)
+        return self._scroll_path or None
+
+    def invalidate(self, *args):
+        global _bounds_version
+        _bounds_version += 1
+        self._bounds = None
+        self._to_parent = None
+
+    def _check_translates(self):
+        translations = tuple([t.xy for t in self._translates])
+        if translations != self._translations:
+            self._translations = translations
+            self._bounds = None
+            self._to_parent = None
+
+    def _on_parent_changed(self, *args):
+        _on_tree_changed()
+        self.invalidate()
+        self._unbind()
+
+    def _bind(self, widget):
+        invalidate = self.invalidate
+        on_parent_changed = self._on_parent_changed
+        self._bindings = bindings = []
+        append = bindings.append
+        translates = []
+        ancestors = {widget, }
+        scrollviews = [widget] if isinstance(widget, ScrollView) else []
+        for name in ('pos', 'size', ):
+            append((widget, name, widget.fbind(name, invalidate)))
+        append((widget, 'parent', widget.fbind('parent', on_parent_changed)))
+        w = widget.parent
+        while w is not None and w.parent is not w:
+            ancestors.add(w)
+            append((w, 'pos', w.fbind('pos', invalidate)))
+            append((w, 'parent', w.fbind('parent', on_parent_changed)))
+            if isinstance(w, StencilView):
+                append((w, 'size', w.fbind('size', invalidate)))
+                if isinstance(w, ScrollView):
+                    translates.append(w.g_translate)
+                    scrollviews.append(w)
+            for name in _EXTRA_PROPERTIES_TO_WATCH:
+                if w.property(name, quiet=True) is not None:
+                    append((w, name, w.fbind(name, invalidate)))
+            w = w.parent
+        self._translates = translates = tuple(translates)
+        self._translations = tuple([t.xy for t in translates])
+        # 'w' is the window at this point, unless the widget is not on any.
+        self._scroll_path = (w, ancestors, scrollviews, ) if (w is not None and scrollviews) else False
+
+    def _unbind(self):
+        bindings = self._bindings
+        if bindings is None:
+            return
+        self._bindings = None
+        self._translates = ()
+        self._translations = ()
+        self._scroll_path = None
+        for w, name, uid in bindings:
+            w.unbind_uid(name, uid)
+
+    def close(self):
+        self._unbind()
+        self.invalidate()
+
+
+class _DroppableIndex:
+    '''
+    A uniform grid of buckets over the window bounds of the droppables of a drag class, in the same way as
+    :class:`ChildrenIndex` does for the children of a layout. The droppables that span too many cells are kept aside,
+    and examined for every position.
+    '''
+    __slots__ = ('_bounds_version', '_translates', '_translations', '_cell_w', '_cell_h', '_buckets', '_large', )
+
+    def __init__(self, drag_cls):
+        entries = []
+        translates = {}
+        for droppable in iter_droppables(drag_cls):
+            bounds = get_window_bounds(droppable)
+            if bounds is None:
+                continue
+            entries.append((droppable, bounds, ))
+            for t in _trackers[droppable]._translates:
+                translates[id(t)] = t
+        # The bounds above have just been calculated, so the version is the one they are based on.
+        self._bounds_version = _bounds_version
+        self._translates = translates = tuple(translates.values())
+        self._translations = tuple([t.xy for t in translates])
+        self._buckets = buckets = {}
+        self._large = large = []
+        n = len(entries)
+        if not n:
+            self._cell_w = self._cell_h = 1.
+            return
+        self._cell_w = cell_w = max(sum(b[2] - b[0] for __, b in entries) / n, 1.)
+        self._cell_h = cell_h = max(sum(b[3] - b[1] for __, b in entries) / n, 1.)
+        for entry in entries:
+            x1, y1, x2, y2 = entry[1]
+            cx0 = floor(x1 / cell_w)
+            cy0 = floor(y1 / cell_h)
+            cx1 = floor(x2 / cell_w)
+            cy1 = floor(y2 / cell_h)
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > _MAX_CELLS_PER_DROPPABLE:
+                large.append(entry)
+                continue
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    key = (cx, cy)
+                    bucket = buckets.get(key)
+                    if bucket is None:
+                        buckets[key] = [entry]
+                    else:
+                        bucket.append(entry)
+
+    def is_valid(self) -> bool:
+        if self._bounds_version != _bounds_version:
+            return False
+        translates = self._translates
+        return (not translates) or self._translations == tuple([t.xy for t in translates])
+
+    def candidates(self, x, y) -> list:
+        '''Returns the ``(droppable, bounds)`` pairs that may contain the given position (window coordinates).'''
+        bucket = self._buckets.get((floor(x / self._cell_w), floor(y / self._cell_h)), ())
+        large = self._large
+        if not large:
+            return bucket
+        return [*bucket, *large]
@@ -0,0 +1,166 @@
+'''
+(internal)
+Slides the children of a reorderable from their old positions to the new ones when its spacer moves. Each moved child
+gets a ``Translate`` in its canvas that cancels the move out and shrinks to zero, so no extra layout runs.
+The instructions a child adds to its canvas while sliding get drawn with the translation from the next frame on.
+'''
+
+__all__ = ('SiblingShifter', )
+
+from weakref import ref
+
+from kivy.clock import Clock
+from kivy.graphics import InstructionGroup, PushMatrix, PopMatrix, Translate
+
+
+class _Shift:
+    '''
+    ``head`` (a PushMatrix and the Translate) is kept at the front of the widget's ``canvas.before``, and ``tail`` (a
+    PopMatrix) at the end of its ``canvas.after``, so that they enclose the whole canvas of the widget.
+    '''
+    __slots__ = ('translate', 'head', 'tail', 'start_x', 'start_y', 'start_time', )
+
+    def __init__(self, widget):
+        self.translate = translate = Translate()
+        self.head = head = InstructionGroup()
+        head.add(PushMatrix())
+        head.add(translate)
+        self.tail = tail = InstructionGroup()
+        tail.add(PopMatrix())
+        widget.canvas.before.insert(0, head)
+        widget.canvas.after.add(tail)
+
+    def enclose(self, widget):
+        '''Puts the ``head`` and ``tail`` back in place if anything has been added to the canvas outside them.'''
+        canvas = widget.canvas
+        before = canvas.before
+        if before.indexof(self.head) != 0:
+            before.remove(self.head)
+            before.insert(0, self.head)
+        after = canvas.after
+        children = after.children
+        if not children or children[-1] is not self.tail:
+            after.remove(self.tail)
+            after.add(self.tail)
+
+    def detach(self, widget):
+        canvas = widget.canvas
+        canvas.before.remove(self.head)
+        canvas.after.remove(self.tail)
+
+
+class SiblingShifter:
+    '''
+    Call :meth:`capture` right before changing the children of the layout, and :meth:`on_layout` right after every
+    layout of it. The children moved by the layouts in that frame slide from where they were drawn when captured.
+    '''
+    __slots__ = ('_layout_ref', 'duration', '_snapshot', '_shifts', '_clock_event', '_enclose', '__weakref__', )
+
+    def __init__(self, layout, duration=.2):
+        self._layout_ref = ref(layout.__self__)
+        self.duration = duration
+        self._snapshot = None
+        '''child -> where it was drawn when captured, in the same coordinates as its pos'''
+        self._shifts = {}
+        '''child -> _Shift'''
+        self._clock_event = None
+        self._enclose = Clock.create_trigger(self._enclose_all, -1)
+
+    def capture(self, children):
+        '''Remembers where the children are drawn now. Only the first call in a frame counts.'''
+        if self._snapshot is not None:
+            return
+        shifts = self._shifts
+        snapshot = {}
+        for c in children:
+            s = shifts.get(c)
+            if s is None:
+                snapshot[c] = (c.x, c.y, )
+            else:
+                t = s.translate
+                snapshot[c] = (c.x + t.x, c.y + t.y, )
+        self._snapshot = snapshot
+        self._start_clock()
+
+    def on_layout(self, children):
+        '''Lets the children moved by a layout slide. This can be called several times in a frame.'''
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        shifts = self._shifts
+        now = Clock.get_time()
+        for c in children:
+            old_pos = snapshot.get(c)
+            if old_pos is None:
+                continue
+            dx = old_pos[0] - c.x
+            dy = old_pos[1] - c.y
+            s = shifts.get(c)
+            if s is None:
+                if -.5 < dx < .5 and -.5 < dy < .5:
+                    continue
+                shifts[c] = s = _Shift(c)
+            else:
+                t = s.translate
+                if t.x == dx and t.y == dy:
+                    # This child hasn't been moved. Let it keep sliding as it was.
+                    continue
+            s.enclose(c)
+            s.translate.xy = (dx, dy, )
+            s.start_x = dx
+            s.start_y = dy
+            s.start_time = now
+
+    def prune(self):
+        '''Ends the slides of the widgets that are no longer children of the layout.'''
+        layout = self._layout_ref()
+        shifts = self._shifts
+        for c in [c for c in shifts if c.parent is not layout]:
+            shifts.pop(c).detach(c)
+
+    def finish(self):
+        '''Ends all the slides immediately.'''
+        shifts = self._shifts
+        for c, s in shifts.items():
+            s.detach(c)
+        shifts.clear()
+        self._snapshot = None
+        self._stop_clock()
+
+    def _enclose_all(self, dt):
+        for c, s in self._shifts.items():
+            s.enclose(c)
+
+    def _start_clock(self):
+        if self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._on_frame, 0)
+
+    def _stop_clock(self):
+        if self._clock_event is not None:
+            self._clock_event.cancel()
+            self._clock_event = None
+        self._enclose.cancel()
+
+    def _on_frame(self, dt):
+        # The frame the snapshot was taken in is over.
+        self._snapshot = None
+        self.prune()
+        shifts = self._shifts
+        if not shifts:
+            self._stop_clock()
+            return
+        now = Clock.get_time()
+        duration = self.duration
+        finished = []
+        for c, s in shifts.items():
+            p = (now - s.start_time) / duration if duration > 0 else 1.
+            if p >= 1.:
+                finished.append(c)
+                continue
+            k = (1. - p) * (1. - p)  # out_quad
+            s.translate.xy = (s.start_x * k, s.start_y * k, )
+        for c in finished:
+            shifts.pop(c).detach(c)
+        if shifts:
+            # Right before the frame gets drawn, after the other callbacks have changed the canvases.
+            self._enclose()
@@ -0,0 +1,75 @@
+__all__ = ('SpacerPool', 'spacer_pool', )
+
+from typing import Callable
+
+from kivy.uix.widget import Widget
+
+from ._utils import _create_spacer
+
+
+class SpacerPool:
+    '''
+    The spacers shared by the reorderables, except the ones in their own
+    :attr:`KXReorderableBehavior.spacer_widgets`. A reorderable takes one from the pool when a drag enters it, and gives
+    it back when the drag leaves it. The pool creates a spacer only when it has none to lend, so no spacer exists
+    until the first drag, and a reorderable can hold any number of drags at the same time.
+
+    .. code-block::
+
+        from kivy_garden.draggable import spacer_pool
+
+        spacer_pool.max_idle = 16
+
+        # Every reorderable without its own spacers uses this look.
+        spacer_pool.factory = lambda: Factory.MySpacer()
+    '''
+
+    def __init__(self, max_idle=8, factory: Callable[[], Widget] = _create_spacer):
+        self._idle = []
+        self._factory = factory
+        self.max_idle = max_idle
+
+    @property
+    def max_idle(self) -> int:
+        '''The maximum number of spacers to keep for reuse. The ones given back beyond this are discarded.'''
+        return self._max_idle
+
+    @max_idle.setter
+    def max_idle(self, value):
+        if value < 0:
+            raise ValueError(f"'max_idle' must be zero or positive. (was {value})")
+        self._max_idle = value
+        del self._idle[value:]
+
+    @property
+    def factory(self) -> Callable[[], Widget]:
+        '''The function that creates a spacer. Changing this discards the idle spacers.'''
+        return self._factory
+
+    @factory.setter
+    def factory(self, value):
+        self._factory = value
+        self._idle.clear()
+
+    def __len__(self):
+        '''The number of idle spacers.'''
+        return len(self._idle)
+
+    def acquire(self) -> Widget:
+        '''Lends a spacer, creating it if there isn't an idle one.'''
+        idle = self._idle
+        return idle.pop() if idle else self._factory()
+
+    def release(self, spacer: Widget):
+        '''Takes back a spacer. It must have been removed from its parent.'''
+        idle = self._idle
+        if len(idle) < self._max_idle:
+            idle.append(spacer)
+
+    def clear(self):
+        '''Discards the idle spacers.'''
+        self._idle.clear()
+
+
+spacer_pool = SpacerPool()
+'''The :class:`SpacerPool` instance this library uses.'''
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from collections.abc import MutableMapping
 
 
 class temp_transform:
@@ -23,32 +24,139 @@ _shallow_copyable_property_names = (
     'size_hint_min_x', 'size_hint_min_y',
     'size_hint_max_x', 'size_hint_max_y',
 )
+_state_keys = (*_shallow_copyable_property_names, 'pos_hint', 'parent', 'index', )
+_state_key_set = frozenset(_state_keys)
+
+
+class WidgetState(MutableMapping):
+    '''
+    The return value of :func:`save_widget_state`. This is a dictionary-like object whose items are stored in slots,
+    which makes it faster to create and to read than a dictionary. It can hold arbitrary keys as well.
+    '''
+    __slots__ = (*_state_keys, '_extra', )
+
+    def __getitem__(self, key):
+        if key in _state_key_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key in _state_key_set:
+            setattr(self, key, value)
+            return
+        try:
+            self._extra[key] = value
+        except AttributeError:
+            self._extra = {key: value}
+
+    def __delitem__(self, key):
+        if key in _state_key_set:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            del self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        if key in _state_key_set:
+            return hasattr(self, key)
+        try:
+            return key in self._extra
+        except AttributeError:
+            return False
+
+    def __iter__(self):
+        hasattr_ = hasattr
+        for key in _state_keys:
+            if hasattr_(self, key):
+                yield key
+        try:
+            yield from self._extra
+        except AttributeError:
+            pass
+
+    def __len__(self):
+        return sum(1 for __ in self)
+
+    def __repr__(self):
+        return f"WidgetState({dict(self)!r})"
+
+
+def _copy_pos_hint(pos_hint) -> dict:
+    '''
+    Copies a ``pos_hint``. The common shapes, whose values are numbers or sequences of numbers, are copied without
+    relying on ``copy.deepcopy()``.
+    '''
+    copy = {}
+    for key, value in pos_hint.items():
+        t = type(value)
+        if t is float or t is int:
+            copy[key] = value
+        elif (t is list or t is tuple) and all(type(v) is float or type(v) is int for v in value):
+            copy[key] = t(value)
+        else:
+            return deepcopy(pos_hint)
+    return copy
 
 
-def save_widget_state(widget, *, ignore_parent=False) -> dict:
+def save_widget_state(widget, *, ignore_parent=False) -> WidgetState:
     w = widget.__self__
-    getattr_ = getattr
-    state = {name: getattr_(w, name) for name in _shallow_copyable_property_names}
-    state['pos_hint'] = deepcopy(w.pos_hint)
+    state = WidgetState()
+    state.x = w.x
+    state.y = w.y
+    state.width = w.width
+    state.height = w.height
+    state.size_hint_x = w.size_hint_x
+    state.size_hint_y = w.size_hint_y
+    state.size_hint_min_x = w.size_hint_min_x
+    state.size_hint_min_y = w.size_hint_min_y
+    state.size_hint_max_x = w.size_hint_max_x
+    state.size_hint_max_y = w.size_hint_max_y
+    state.pos_hint = _copy_pos_hint(w.pos_hint)
     if ignore_parent:
         return state
-    parent = w.parent
-    state['parent'] = parent
+    state.parent = parent = w.parent
     if parent is not None:
-        state['index'] = parent.children.index(w)
+        state.index = parent.children.index(w)
     return state
 
 
 def restore_widget_state(widget, state: dict, *, ignore_parent=False):
+    '''
+    ``state`` can be either the return value of :func:`save_widget_state` or a dictionary that has the same keys.
+    '''
     w = widget.__self__
-    setattr_ = setattr
-    for name in _shallow_copyable_property_names:
-        setattr_(w, name, state[name])
-    w.pos_hint = deepcopy(state['pos_hint'])
-    if ignore_parent or 'parent' not in state:
-        return
-    if w.parent is not None:
+    restores_parent = (not ignore_parent) and 'parent' in state
+
+    # Detach the widget from the current parent beforehand so that the parent doesn't react to each property change.
+    if restores_parent and w.parent is not None:
         w.parent.remove_widget(w)
+
+    if type(state) is WidgetState:
+        s = state
+    else:
+        s = WidgetState()
+        for name in _shallow_copyable_property_names:
+            setattr(s, name, state[name])
+        s.pos_hint = state['pos_hint']
+    w.pos = (s.x, s.y, )
+    w.size = (s.width, s.height, )
+    w.size_hint = (s.size_hint_x, s.size_hint_y, )
+    w.size_hint_min = (s.size_hint_min_x, s.size_hint_min_y, )
+    w.size_hint_max = (s.size_hint_max_x, s.size_hint_max_y, )
+    w.pos_hint = _copy_pos_hint(s.pos_hint)
+    if not restores_parent:
+        return
     parent = state['parent']
     if parent is None:
         return
@@ -0,0 +1,212 @@
+'''
+A synthetic touch driver for testing and benchmarking drags without a real window or real waiting.
+
+.. code-block::
+
+    from kivy_garden.draggable.testing import TouchDriver
+
+    with TouchDriver() as driver:
+        driver.window.add_widget(root_widget)
+        driver.advance()
+        driver.drag([(100, 100), (150, 100), (200, 100)])
+
+Touches go through ``EventLoop.post_dispatch_input()``, thus they are dispatched in the same way as the ones from
+the input providers, including the dispatching of grabbed touches. The global ``Clock`` is switched to a virtual time
+while the driver is active, so ``drag_timeout``, ``asynckivy.sleep()`` and ``Clock`` events advance only when the
+driver advances the time, and immediately.
+'''
+
+__all__ = ('TouchDriver', 'VirtualWindow', 'DriverTouch', 'linear_path', )
+
+from typing import Iterable, Sequence, Tuple
+
+from kivy.base import EventLoop
+from kivy.clock import Clock
+from kivy.input.motionevent import MotionEvent
+from kivy.uix.floatlayout import FloatLayout
+
+
+class VirtualWindow(FloatLayout):
+    '''
+    A widget that acts as a root window. Like :class:`kivy.core.window.Window`, it's the parent of itself, lays out
+    its children according to their ``size_hint`` and ``pos_hint``, and dispatches touches to them.
+    '''
+
+    rotation = 0
+    softinput_mode = ''
+    keyboard_height = 0
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('size', (800, 600))
+        super().__init__(**kwargs)
+        self.parent = self
+
+    def get_root_window(self):
+        return self
+
+    def get_parent_window(self):
+        return self
+
+    def to_widget(self, x, y, relative=False):
+        return (x, y)
+
+    def to_window(self, x, y, initial=True, relative=False):
+        return (x, y)
+
+    def transform_motion_event_2d(self, me, widget=None):
+        me.scale_for_screen(*self.size)
+        if widget is not None:
+            parent = widget.parent
+            if parent:
+                me.apply_transform_2d(parent.to_widget)
+            else:
+                me.apply_transform_2d(widget.to_widget)
+                me.apply_transform_2d(widget.to_parent)
+
+    def on_motion(self, etype, me):
+        if not me.is_touch:
+            return
+        self.transform_motion_event_2d(me)
+        if etype == 'begin':
+            self.dispatch('on_touch_down', me)
+        elif etype == 'update':
+            self.dispatch('on_touch_move', me)
+        elif etype == 'end':
+            self.dispatch('on_touch_up', me)
+
+
+class DriverTouch(MotionEvent):
+    '''A touch created by :class:`TouchDriver`. Its timestamps are in the virtual time.'''
+
+    def __init__(self, driver, touch_id, x, y):
+        self._driver = driver
+        super().__init__('TouchDriver', touch_id, driver._to_args(x, y), is_touch=True, type_id='touch')
+        self.time_start = self.time_update = driver.time
+
+    def depack(self, args):
+        self.sx = args['x']
+        self.sy = args['y']
+        self.profile = ['pos']
+        super().depack(args)
+
+
+class TouchDriver:
+    '''
+    Drives touches and the virtual time. Use this as a context manager, or call :meth:`close` when you are done,
+    otherwise the global ``Clock`` keeps running on the virtual time.
+
+    :param fps: The number of frames per virtual second. :meth:`advance` runs a frame every ``1 / fps`` seconds.
+    :param window: The window to dispatch touches to. A new :class:`VirtualWindow` is created if not given.
+    '''
+
+    def __init__(self, *, fps=60., window=None):
+        self.frame_duration = 1. / fps
+        self.window = VirtualWindow() if window is None else window
+        self._next_touch_id = 0
+        self._time = 0.
+        self._closed = False
+
+        # switch the Clock to the virtual time
+        self._orig_max_fps = Clock._max_fps
+        self._time = Clock._last_tick
+        Clock.time = self._get_time
+        Clock._max_fps = 0
+
+        # dispatch touches only to our window
+        self._orig_event_listeners = EventLoop.event_listeners
+        EventLoop.event_listeners = [self.window]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        del Clock.time
+        Clock._max_fps = self._orig_max_fps
+        EventLoop.event_listeners = self._orig_event_listeners
+
+    def _get_time(self):
+        return self._time
+
+    @property
+    def time(self) -> float:
+        '''The current virtual time in seconds.'''
+        return self._time
+
+    def _to_args(self, x, y):
+        w, h = self.window.size
+        return {'x': x / max(w - 1., 1.), 'y': y / max(h - 1., 1.)}
+
+    # -----------------------------------------------------------------------
+    # time
+    # -----------------------------------------------------------------------
+
+    def step(self):
+        '''Advances the virtual time by one frame, and runs the frame.'''
+        self._time += self.frame_duration
+        Clock.tick()
+        Clock.tick_draw()
+
+    def advance(self, duration=0.):
+        '''Advances the virtual time by the given seconds, running the frames in between. At least one frame runs.'''
+        n = max(1, round(duration / self.frame_duration))
+        step = self.step
+        for __ in range(n):
+            step()
+
+    # -----------------------------------------------------------------------
+    # touches
+    # -----------------------------------------------------------------------
+
+    def touch_down(self, x, y) -> DriverTouch:
+        '''Puts a new finger down at the given window coordinates.'''
+        self._next_touch_id += 1
+        touch = DriverTouch(self, self._next_touch_id, x, y)
+        EventLoop.post_dispatch_input('begin', touch)
+        return touch
+
+    def touch_move(self, touch: DriverTouch, x, y):
+        touch.move(self._to_args(x, y))
+        touch.time_update = self._time
+        EventLoop.post_dispatch_input('update', touch)
+
+    def touch_up(self, touch: DriverTouch, x=None, y=None):
+        '''Lifts the finger up. If a position is given, the finger is lifted up there without being moved to it.'''
+        if x is not None:
+            touch.move(self._to_args(x, y))
+        touch.time_update = touch.time_end = self._time
+        EventLoop.post_dispatch_input('end', touch)
+
+    def drag(self, path: Sequence[Tuple[float, float]], *, interval=None, hold=0.):
+        '''
+        Performs a whole touch sequence: puts a finger down at the first point of the ``path``, holds it for ``hold``
+        seconds, moves it through the rest of the points with ``interval`` seconds between each of them (one frame by
+        default), and then lifts it up at the last point. The frames after the touch-up are not run, call
+        :meth:`advance` if you need them.
+        '''
+        self.drag_simultaneously([path], interval=interval, hold=hold)
+
+    def drag_simultaneously(self, paths: Iterable[Sequence[Tuple[float, float]]], *, interval=None, hold=0.):
+        '''Same as :meth:`drag` except this one moves multiple fingers at the same time.'''
+        paths = list(paths)
+        interval = self.frame_duration if interval is None else interval
+        touches = [self.touch_down(*path[0]) for path in paths]
+        self.advance(hold)
+        for i in range(1, max(len(p) for p in paths)):
+            for touch, path in zip(touches, paths):
+                if i < len(path):
+                    self.touch_move(touch, *path[i])
+            self.advance(interval)
+        for touch in touches:
+            self.touch_up(touch)
+
+
+def linear_path(start, end, n_steps) -> list:
+    '''Returns a list of ``n_steps + 1`` points evenly placed from ``start`` to ``end``.'''
+    (x0, y0), (x1, y1) = start, end
+    return [(x0 + (x1 - x0) * i / n_steps, y0 + (y1 - y0) * i / n_steps) for i in range(n_steps + 1)]
@@ -0,0 +1,286 @@
+'''
+Recording touches into a compact binary trace, and replaying it offline.
+
+.. code-block::
+
+    # in the app
+    from kivy_garden.draggable.trace import TouchRecorder
+
+    recorder = TouchRecorder()
+    recorder.start()
+    ...
+    recorder.stop()
+    recorder.save('session.kxtrace')
+
+    # offline
+    from kivy_garden.draggable.testing import TouchDriver
+    from kivy_garden.draggable.trace import load_trace, replay_trace
+
+    with load_trace('session.kxtrace') as trace, TouchDriver(window=VirtualWindow(size=trace.window_size)) as driver:
+        driver.window.add_widget(build_the_same_widget_tree())
+        frame_times = replay_trace(trace, driver)
+
+File format
+-----------
+
+All the values are little-endian.
+
+* A 32 bytes header: the magic ``b'KXTR'``, the version (uint16), a reserved field (uint16), the number of events
+  ``n`` (uint64), and the window size at the time of recording (float32 x 2).
+* The events, stored column by column so that each column can be used as an array without copying:
+  ``times`` (float64 x n, seconds), ``xs`` and ``ys`` (float32 x n, normalized to the window, like
+  ``MotionEvent.sx`` and ``MotionEvent.sy``), ``touch_ids`` (uint32 x n) and ``etypes`` (uint8 x n, one of
+  :data:`BEGIN`, :data:`UPDATE` and :data:`END`).
+
+Each event takes 21 bytes. A trace is memory-mapped when loaded, so traces with millions of events don't need to be
+read into memory.
+'''
+
+__all__ = (
+    'BEGIN', 'UPDATE', 'END', 'TouchTrace', 'TouchRecorder', 'load_trace', 'save_trace', 'replay_trace',
+)
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from time import perf_counter
+from typing import List
+
+BEGIN = 0
+UPDATE = 1
+END = 2
+
+_MAGIC = b'KXTR'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHQff8x')
+_ETYPE_CODES = {'begin': BEGIN, 'update': UPDATE, 'end': END, }
+_COLUMNS = (('times', 'd'), ('xs', 'f'), ('ys', 'f'), ('touch_ids', 'I'), ('etypes', 'B'), )
+'''(column name, typecode). The order of the columns in a file.'''
+_EVENT_SIZE = sum(array(typecode).itemsize for __, typecode in _COLUMNS)
+
+_IS_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+class TouchTrace:
+    '''
+    A sequence of touch events. Each column, :attr:`times`, :attr:`xs`, :attr:`ys`, :attr:`touch_ids` and
+    :attr:`etypes`, is an ``array.array`` or a ``memoryview`` of a memory-mapped file.
+
+    A trace loaded from a file holds the file open until :meth:`close` is called. It can be used as a context manager.
+    '''
+
+    __slots__ = ('times', 'xs', 'ys', 'touch_ids', 'etypes', 'window_size', '_mmap', )
+
+    def __init__(self, times, xs, ys, touch_ids, etypes, *, window_size=(0., 0., ), _mmap=None):
+        if not (len(times) == len(xs) == len(ys) == len(touch_ids) == len(etypes)):
+            raise ValueError("All the columns must have the same length")
+        self.times = times
+        self.xs = xs
+        self.ys = ys
+        self.touch_ids = touch_ids
+        self.etypes = etypes
+        self.window_size = tuple(window_size)
+        self._mmap = _mmap
+
+    def __len__(self):
+        return len(self.times)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        mm = self._mmap
+        if mm is None:
+            return
+        self._mmap = None
+        for name, typecode in _COLUMNS:
+            getattr(self, name).release()
+            setattr(self, name, array(typecode))
+        mm.close()
+
+    @property
+    def duration(self) -> float:
+        '''The time from the first event to the last one.'''
+        times = self.times
+        return times[-1] - times[0] if len(times) else 0.
+
+    @property
+    def n_touches(self) -> int:
+        '''The number of touches in the trace.'''
+        return self.etypes.tobytes().count(BEGIN)
+
+
+class TouchRecorder:
+    '''
+    Records the touches dispatched by ``EventLoop`` into the memory, 21 bytes per event. Only the touches (not the
+    hover events or keyboard events) are recorded.
+
+    :param max_events: Once this many events are recorded, the recorder stops by itself. None means unlimited.
+    '''
+
+    def __init__(self, *, max_events=None):
+        self.max_events = max_events
+        self._columns = tuple(array(typecode) for __, typecode in _COLUMNS)
+        self._window_size = (0., 0., )
+        self._event_loop = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self._event_loop is not None
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def start(self):
+        if self._event_loop is not None:
+            return
+        from kivy.base import EventLoop
+        window = EventLoop.window
+        if window is not None:
+            self._window_size = tuple(map(float, window.size))
+        EventLoop.add_event_listener(self)
+        self._event_loop = EventLoop
+
+    def stop(self):
+        event_loop = self._event_loop
+        if event_loop is None:
+            return
+        self._event_loop = None
+        event_loop.remove_event_listener(self)
+
+    def clear(self):
+        for column in self._columns:
+            del column[:]
+
+    def dispatch(self, event_type, etype, me):
+        '''(internal) Called by ``EventLoop`` as an event listener.'''
+        if event_type != 'on_motion' or not me.is_touch:
+            return
+        code = _ETYPE_CODES.get(etype)
+        if code is None:
+            return
+        times, xs, ys, touch_ids, etypes = self._columns
+        times.append(me.time_update)
+        xs.append(me.sx)
+        ys.append(me.sy)
+        touch_ids.append(me.uid & 0xFFFFFFFF)
+        etypes.append(code)
+        max_events = self.max_events
+        if max_events is not None and len(times) >= max_events:
+            self.stop()
+
+    @property
+    def trace(self) -> TouchTrace:
+        '''A :class:`TouchTrace` sharing the memory with the recorder. Copy it if you keep recording.'''
+        return TouchTrace(*self._columns, window_size=self._window_size)
+
+    def save(self, path):
+        save_trace(self.trace, path)
+
+
+def save_trace(trace: TouchTrace, path):
+    '''Writes a trace to a file.'''
+    n = len(trace)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, 0, n, *trace.window_size))
+        for name, typecode in _COLUMNS:
+            column = getattr(trace, name)
+            if not isinstance(column, array) or column.typecode != typecode or not _IS_LITTLE_ENDIAN:
+                column = array(typecode, column)
+            if not _IS_LITTLE_ENDIAN:
+                column.byteswap()
+            column.tofile(f)
+
+
+def load_trace(path, *, use_mmap=True) -> TouchTrace:
+    '''
+    Reads a trace from a file. If ``use_mmap`` is True, the file is memory-mapped instead of being read, and the
+    columns of the returned trace are ``memoryview`` objects.
+    '''
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path!r} is not a touch trace")
+        magic, version, __, n, w, h = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError(f"{path!r} is not a touch trace")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported trace version: {version}")
+        if os.fstat(f.fileno()).st_size < _HEADER.size + _EVENT_SIZE * n:
+            raise ValueError(f"{path!r} is truncated")
+        if use_mmap and _IS_LITTLE_ENDIAN and n:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            columns = []
+            offset = _HEADER.size
+            with memoryview(mm) as view:
+                for __, typecode in _COLUMNS:
+                    end = offset + array(typecode).itemsize * n
+                    columns.append(view[offset:end].cast(typecode))
+                    offset = end
+            return TouchTrace(*columns, window_size=(w, h, ), _mmap=mm)
+        columns = []
+        for __, typecode in _COLUMNS:
+            column = array(typecode)
+            column.fromfile(f, n)
+            if not _IS_LITTLE_ENDIAN:
+                column.byteswap()
+            columns.append(column)
+        return TouchTrace(*columns, window_size=(w, h, ))
+
+
+def replay_trace(trace: TouchTrace, driver) -> List[float]:
+    '''
+    Replays a trace on a :class:`kivy_garden.draggable.testing.TouchDriver`, keeping the time intervals between the
+    events in the driver's virtual time. The positions are scaled to the driver's window.
+
+    Returns the real time each frame took, including the dispatching of the events delivered in it, in seconds.
+    Touches that are still down at the end of the trace are left as they are.
+    '''
+    frame_times = []
+    n = len(trace)
+    if not n:
+        return frame_times
+    w, h = driver.window.size
+    w -= 1.
+    h -= 1.
+    touches = {}
+    times = trace.times
+    start = times[0]
+    frame_duration = driver.frame_duration
+    # The frame boundaries are computed relative to the start of the trace, with a tolerance, so that an event
+    # recorded right at a boundary always lands in the same frame regardless of the absolute time.
+    n_frames = 1
+    step = driver.step
+    append = frame_times.append
+
+    t = perf_counter()
+    for time, x, y, touch_id, etype in zip(times, trace.xs, trace.ys, trace.touch_ids, trace.etypes):
+        elapsed = time - start + 1e-9
+        while elapsed >= n_frames * frame_duration:
+            step()
+            n_frames += 1
+            t2 = perf_counter()
+            append(t2 - t)
+            t = t2
+        x *= w
+        y *= h
+        if etype == BEGIN:
+            touches[touch_id] = driver.touch_down(x, y)
+        else:
+            touch = touches.get(touch_id)
+            if touch is None:
+                # The trace started in the middle of this touch.
+                continue
+            if etype == END:
+                driver.touch_up(touch, x, y)
+                del touches[touch_id]
+            else:
+                driver.touch_move(touch, x, y)
+    step()
+    append(perf_counter() - t)
+    return frame_times
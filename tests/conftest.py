@@ -0,0 +1,55 @@
+import pytest
+
+
+@pytest.fixture()
+def driver():
+    from kivy_garden.draggable.testing import TouchDriver
+    with TouchDriver() as driver:
+        yield driver
+
+
+@pytest.fixture(scope='module')
+def classes():
+    '''``(Item, Reorderable)``. The test modules that need other classes override this.'''
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    return (Item, Reorderable, )
+
+
+def build_columns(driver, classes, *texts_list, **item_kwargs):
+    '''
+    Vertical reorderables side by side, filling the window, one for each of the ``texts_list``. Each of them has the
+    items labeled with the texts, from top to bottom.
+    '''
+    from kivy.uix.boxlayout import BoxLayout
+    Item, Reorderable = classes[0], classes[-1]
+    item_kwargs = {'drag_cls': 'test', 'drag_timeout': 0, **item_kwargs}
+    root = BoxLayout()
+    columns = []
+    for texts in texts_list:
+        r = Reorderable(drag_classes=['test'], orientation='vertical')
+        for text in texts:
+            r.add_widget(Item(text=text, **item_kwargs), index=0)
+        root.add_widget(r)
+        columns.append(r)
+    driver.window.add_widget(root)
+    driver.advance()
+    return columns
+
+
+def texts(layout) -> list:
+    '''The texts of the children of the layout from top to bottom. None for the ones without text, such as spacers.'''
+    return [getattr(c, 'text', None) for c in reversed(layout.children)]
+
+
+def walk_window(window):
+    '''Iterates over the widgets on the window, excluding the window itself.'''
+    for c in window.children:
+        yield from c.walk(restrict=True)
@@ -0,0 +1,145 @@
+import pytest
+
+SCROLL_TIMEOUT = .3
+'''How long a touch needs to stay still before a ScrollView passes it to its children'''
+
+
+def _build(driver, classes, *, drag_classes=('test', ), n=40, **kwargs):
+    '''A vertical ScrollView of 400x300 holding a reorderable of 'n' items of 50px height.'''
+    from kivy.uix.scrollview import ScrollView
+    Draggable, Reorderable = classes
+    sv = ScrollView(size_hint=(None, None), size=(400, 300), pos=(0, 0), do_scroll_x=False)
+    r = Reorderable(drag_classes=list(drag_classes), orientation='vertical', size_hint_y=None, height=50 * n)
+    kwargs = {'drag_autoscroll_margin': 40, 'drag_autoscroll_speed': 400, **kwargs}
+    for i in range(n):
+        r.add_widget(Draggable(text=str(i), drag_cls='test', drag_timeout=0, size_hint_y=None, height=50, **kwargs))
+    sv.add_widget(r)
+    driver.window.add_widget(sv)
+    driver.advance()
+    return (sv, r, )
+
+
+def _start_drag(driver, r, to_pos):
+    '''Drags the topmost item to the given position, and keeps the finger there.'''
+    from kivy_garden.draggable.testing import linear_path
+    item = r.children[-1]
+    x, y = item.to_window(*item.center)
+    touch = driver.touch_down(x, y)
+    driver.advance(SCROLL_TIMEOUT)
+    for x, y in linear_path((x, y), to_pos, 5)[1:]:
+        driver.touch_move(touch, x, y)
+        driver.advance()
+    return (item, touch, )
+
+
+@pytest.mark.parametrize('fps', (20, 60, 240, ))
+def test_speed_does_not_depend_on_the_frame_rate(classes, fps):
+    from kivy_garden.draggable.testing import TouchDriver
+    with TouchDriver(fps=fps) as driver:
+        sv, r = _build(driver, classes)
+        item, touch = _start_drag(driver, r, (200, 10))
+        scroll_y = sv.scroll_y
+        assert scroll_y < 1.
+        driver.advance(1.)
+        # depth: (40 - 10) / 40 = .75, speed: 400 * .75 = 300px/s, scrollable distance: 2000 - 300 = 1700px
+        assert scroll_y - sv.scroll_y == pytest.approx(300 / 1700, rel=.05)
+        driver.touch_up(touch)
+        driver.advance(1.)
+
+
+@pytest.mark.parametrize('to_pos, should_scroll_down', [
+    ((200, 290), False, ),
+    ((200, 150), False, ),
+    ((200, 30), True, ),
+    ((500, 10), False, ),
+])
+def test_edge_band(classes, to_pos, should_scroll_down):
+    from kivy_garden.draggable.testing import TouchDriver
+    with TouchDriver() as driver:
+        sv, r = _build(driver, classes)
+        item, touch = _start_drag(driver, r, to_pos)
+        driver.advance(.5)
+        assert (sv.scroll_y < 1.) is should_scroll_down
+        driver.touch_up(touch)
+        driver.advance(1.)
+
+
+def test_the_spacer_follows_the_content(classes):
+    from kivy_garden.draggable.testing import TouchDriver
+    with TouchDriver() as driver:
+        sv, r = _build(driver, classes)
+        item, touch = _start_drag(driver, r, (200, 10))
+        spacer = r._active_spacers[0]
+        indices = set()
+        for __ in range(10):
+            driver.advance(.2)
+            indices.add(r.children.index(spacer))
+            x1, y1 = spacer.to_window(*spacer.pos)
+            x2, y2 = spacer.to_window(spacer.right, spacer.top)
+            assert y1 <= 10 <= y2
+        assert len(indices) > 5
+        driver.touch_up(touch)
+        driver.advance(1.)
+        assert item.parent is r
+        assert r.children.index(item) == min(indices)
+
+
+@pytest.mark.parametrize('kwargs', [{'drag_autoscroll_margin': 0}, {'drag_autoscroll_speed': 0}])
+def test_disabled(classes, kwargs):
+    from kivy_garden.draggable.testing import TouchDriver
+    with TouchDriver() as driver:
+        sv, r = _build(driver, classes, **kwargs)
+        item, touch = _start_drag(driver, r, (200, 10))
+        driver.advance(.5)
+        assert sv.scroll_y == 1.
+        driver.touch_up(touch)
+        driver.advance(1.)
+
+
+def test_scrollview_without_an_accepting_droppable(classes):
+    from kivy.uix.scrollview import ScrollView
+    from kivy_garden.draggable.testing import TouchDriver
+    from kivy_garden.draggable import _autoscroll
+    with TouchDriver() as driver:
+        sv, r = _build(driver, classes)
+        Draggable, Reorderable = classes
+        sv2 = ScrollView(size_hint=(None, None), size=(300, 300), pos=(450, 0))
+        r2 = Reorderable(drag_classes=['other'], orientation='vertical', size_hint_y=None, height=2000)
+        sv2.add_widget(r2)
+        driver.window.add_widget(sv2)
+        driver.advance()
+        item, touch = _start_drag(driver, r, (600, 10))
+        driver.advance(.5)
+        assert sv2.scroll_y == 1.
+        assert _autoscroll._clock_event is not None
+        driver.touch_up(touch)
+        driver.advance(1.)
+        assert _autoscroll._clock_event is None
+
+
+def test_no_droppable_inside_a_scrollview(driver, classes):
+    from kivy.uix.scrollview import ScrollView
+    from kivy_garden.draggable import _autoscroll
+    Draggable, Reorderable = classes
+    r = Reorderable(drag_classes=['test'], orientation='vertical', size_hint=(.5, 1))
+    for i in range(5):
+        r.add_widget(Draggable(text=str(i), drag_cls='test', drag_timeout=0, drag_autoscroll_margin=40))
+    driver.window.add_widget(r)
+    driver.advance()
+    item, touch = _start_drag(driver, r, (200, 10))
+    assert _autoscroll._clock_event is not None
+    assert not _autoscroll._any_paths
+
+    # A ScrollView appears in the middle of the drag.
+    sv = ScrollView(size_hint=(.5, 1), pos_hint={'right': 1}, do_scroll_x=False)
+    r2 = Reorderable(drag_classes=['test'], orientation='vertical', size_hint_y=None, height=2000)
+    sv.add_widget(r2)
+    driver.window.add_widget(sv)
+    driver.advance()
+    assert _autoscroll._any_paths
+    driver.touch_move(touch, 600, 10)
+    driver.advance(.5)
+    assert sv.scroll_y < 1.
+    driver.touch_up(touch)
+    driver.advance(1.)
+    assert _autoscroll._paths == {}
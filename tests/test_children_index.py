@@ -0,0 +1,79 @@
+import pytest
+
+
+def _create_layout(cls_name, n, **kwargs):
+    from kivy.factory import Factory as F
+    layout = F.get(cls_name)(size=(1000, 1000), **kwargs)
+    for __ in range(n):
+        layout.add_widget(F.Widget(size_hint=(None, None), size=(40, 40)))
+    layout.do_layout()
+    return layout
+
+
+def _brute_force_widget_at(layout, x, y):
+    for index, c in enumerate(layout.children):
+        if c.collide_point(x, y):
+            return (c, index)
+    return (None, None)
+
+
+POINTS = [(x, y) for x in range(-20, 1020, 7) for y in range(-20, 1020, 13)]
+
+
+@pytest.mark.parametrize('orientation', ('horizontal', 'vertical', ))
+@pytest.mark.parametrize('spacing', (0, 10, ))
+def test_box_layout(orientation, spacing):
+    from kivy_garden.draggable._children_index import ChildrenIndex
+    layout = _create_layout('BoxLayout', 20, orientation=orientation, spacing=spacing, padding=15)
+    index = ChildrenIndex(layout)
+    assert index._axis is not None
+    for x, y in POINTS:
+        assert index.widget_at(x, y) == _brute_force_widget_at(layout, x, y)
+
+
+@pytest.mark.parametrize('cls_name', ('StackLayout', 'GridLayout', ))
+def test_grid_index(cls_name):
+    from kivy_garden.draggable._children_index import ChildrenIndex
+    layout = _create_layout(cls_name, 100, spacing=10, padding=15, **({'cols': 7} if cls_name == 'GridLayout' else {}))
+    index = ChildrenIndex(layout)
+    assert index._axis is None
+    for x, y in POINTS:
+        assert index.widget_at(x, y) == _brute_force_widget_at(layout, x, y)
+
+
+@pytest.mark.parametrize('cls_name', ('BoxLayout', 'StackLayout', ))
+def test_nearest_to(cls_name):
+    from kivy_garden.draggable._children_index import ChildrenIndex, _distance_sq
+    layout = _create_layout(cls_name, 20, spacing=10, padding=15)
+    index = ChildrenIndex(layout)
+    for x, y in POINTS:
+        widget, i = index.nearest_to(x, y)
+        assert layout.children[i] is widget
+        assert _distance_sq(widget, x, y) == min(_distance_sq(c, x, y) for c in layout.children)
+
+
+def test_no_children():
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy_garden.draggable._children_index import ChildrenIndex
+    index = ChildrenIndex(BoxLayout())
+    assert index.widget_at(0, 0) == (None, None)
+    assert index.nearest_to(0, 0) == (None, None)
+
+
+def test_reorderable_invalidates_the_index():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    layout = Reorderable(size=(100, 100))
+    assert layout.get_widget_under_drag(50, 50) == (None, None)
+    child = F.Widget()
+    layout.add_widget(child)
+    layout.do_layout()
+    assert layout.get_widget_under_drag(50, 50) == (child, 0)
+    layout.size = (10, 10)
+    layout.do_layout()
+    assert layout.get_widget_under_drag(50, 50) == (None, None)
+    assert layout.get_nearest_widget_to_drag(50, 50) == (child, 0)
@@ -0,0 +1,41 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Draggable(F.KXDraggableBehavior, F.Widget):
+        def on_drag_end(self, touch, ctx):
+            self.last_ctx = ctx
+
+    return (Draggable, )
+
+
+@pytest.mark.parametrize('n', [1, 5])
+def test_moves_within_a_frame(driver, classes, n):
+    '''``n`` moves within a single frame result in a single position update, and all of them are recorded in order.'''
+    Draggable, = classes
+    w = Draggable(drag_cls='test', drag_timeout=0, drag_coalesce_moves=True, size_hint=(None, None), size=(100, 100))
+    driver.window.add_widget(w)
+    driver.advance()
+    t = driver.touch_down(50, 50)
+    driver.advance()
+    driver.touch_move(t, 60, 50)
+    driver.advance()
+    assert w.is_being_dragged
+    positions = []
+    w.bind(pos=lambda __, pos: positions.append(tuple(pos)))
+    for i in range(1, n + 1):
+        driver.touch_move(t, 60 + i * 10, 50 + i)
+    assert positions == []
+    driver.step()
+    assert len(positions) == 1
+    assert positions[0] == pytest.approx((10 + n * 10, n))
+    driver.touch_up(t)
+    driver.advance(1)
+    history = w.last_ctx.touch_history
+    assert [(x, y) for __, x, y in history[-n:]] == [pytest.approx((60 + i * 10, 50 + i)) for i in range(1, n + 1)]
+    times = [time for time, __, __ in history]
+    assert times == sorted(times)
@@ -0,0 +1,104 @@
+import pytest
+
+from conftest import build_columns
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        n_visits = 0
+
+        async def _visit_drag(self, drag):
+            self.n_visits += 1
+            await super()._visit_drag(drag)
+
+    return (Item, Reorderable, )
+
+
+def _build(driver, classes, n_columns):
+    '''A kanban board of 'n_columns' reorderables, each of which has 5 items.'''
+    return build_columns(driver, classes, *([f'{c}-{i}' for i in range(5)] for c in range(n_columns)))
+
+
+@pytest.fixture()
+def lookups(monkeypatch):
+    from kivy_garden.draggable import _dispatcher
+    positions = []
+    original = _dispatcher.find_droppable
+
+    def find_droppable(drag_cls, x, y, **kwargs):
+        positions.append((x, y))
+        return original(drag_cls, x, y, **kwargs)
+    monkeypatch.setattr(_dispatcher, 'find_droppable', find_droppable)
+    return positions
+
+
+def test_one_lookup_per_frame(driver, classes, lookups):
+    columns = _build(driver, classes, 20)
+    item = columns[0].children[-1]
+    x, y = item.center
+    t = driver.touch_down(x, y)
+    driver.advance()
+    lookups.clear()
+    for i in range(1, 4):
+        driver.touch_move(t, x + i * 10, y)
+    driver.advance()
+    assert lookups == [(x + 30, y)]
+    driver.advance()
+    assert lookups == [(x + 30, y)]
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_only_the_target_follows_the_drag(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    columns = _build(driver, classes, 20)
+    item = columns[0].children[-1]
+    x, y = item.center
+    t = driver.touch_down(x, y)
+    for x, y in linear_path((x, y), (columns[-1].center_x, y), 40):
+        driver.touch_move(t, x, y)
+        driver.advance()
+        # The drag has grabbed the touch, but none of the reorderables has.
+        assert len(t.grab_list) == 1
+        hosts = [r for r in columns if r._active_spacers]
+        assert len(hosts) == 1
+        assert hosts[0].collide_point(x, y)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert item.parent is columns[-1]
+    assert all(r.n_visits == 1 for r in columns)
+
+
+def test_the_dispatcher_goes_away_after_drags(driver, classes):
+    from kivy_garden.draggable import _dispatcher
+    from kivy_garden.draggable.testing import linear_path
+    columns = _build(driver, classes, 2)
+    paths = [
+        linear_path(r.children[-1].center, (columns[1].center_x, 10), 10)
+        for r in columns
+    ]
+    driver.drag_simultaneously(paths)
+    assert driver.window not in _dispatcher._dispatchers
+    driver.advance(1)
+    assert [len(r.children) for r in columns] == [4, 6]
+    assert _dispatcher._dispatchers == {}
+
+
+def test_the_drop_position_is_looked_up_on_touch_up(driver, classes):
+    '''The touch-up arrived before the frame that would have routed the last move.'''
+    columns = _build(driver, classes, 2)
+    item = columns[0].children[-1]
+    t = driver.touch_down(*item.center)
+    driver.touch_move(t, columns[1].center_x, columns[1].top - 1)
+    driver.advance()
+    driver.touch_move(t, columns[1].center_x, columns[1].y + 1)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert columns[1].children[0] is item
@@ -0,0 +1,156 @@
+import pytest
+
+from conftest import texts
+
+
+def _build(driver, classes, n=10, **kwargs):
+    '''A vertical reorderable on the left half of the window, having ``n`` items.'''
+    Item, Reorderable = classes
+    r = Reorderable(drag_classes=['test'], orientation='vertical', size_hint=(.5, 1))
+    for i in range(n):
+        r.add_widget(Item(text=str(i), drag_cls='test', drag_timeout=0, **kwargs), index=0)
+    driver.window.add_widget(r)
+    driver.advance()
+    return r
+
+
+def test_many_drags_fail_at_once(driver, classes):
+    from kivy_garden.draggable import _animator
+    r = _build(driver, classes, drag_return_duration=.5)
+    items = r.children[:]
+    touches = [driver.touch_down(*c.center) for c in items]
+    driver.advance()
+    for t in touches:
+        driver.touch_move(t, t.x + 600, t.y)
+    driver.advance()
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(.2)
+    # A single Clock callback advances all of them.
+    assert len(_animator._flights) == len(items)
+    assert _animator._clock_event is not None
+    assert all(c.get_root_window() is driver.window and c.parent is not r for c in items)
+    assert all(c.drag_state == 'failed' for c in items)
+    driver.advance(.5)
+    assert not _animator._flights
+    assert _animator._clock_event is None
+    assert set(r.children) == set(items)
+
+
+def test_return_instantly(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r = _build(driver, classes, n=3, drag_return_duration=0)
+    item = r.children[-1]
+    driver.drag(linear_path(item.center, (600, 300), 5))
+    driver.advance()
+    driver.advance()
+    assert item.parent is r
+    assert item.drag_state is None
+
+
+@pytest.mark.parametrize('transition', ['out_quad', lambda p: p * p])
+def test_transition(driver, classes, transition):
+    r = _build(driver, classes, n=3, drag_return_duration=1, drag_anim_transition=transition)
+    item = r.children[-1]
+    x = item.x
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    driver.touch_move(t, t.x + 500, t.y)
+    driver.advance()
+    driver.touch_up(t)
+    driver.advance(.5)
+    progress = (x + 500 - item.x) / 500
+    if transition == 'out_quad':
+        assert progress == pytest.approx(.75, abs=.05)
+    else:
+        assert progress == pytest.approx(.25, abs=.05)
+    driver.advance(1)
+    assert item.parent is r
+
+
+@pytest.mark.parametrize('use_proxy', [False, True])
+def test_settle(driver, classes, use_proxy):
+    from kivy_garden.draggable.testing import linear_path
+    r = _build(driver, classes, n=5, drag_settle_duration=.5, drag_use_proxy=use_proxy)
+    item = r.children[-1]
+    driver.drag(linear_path(item.center, (item.center_x, 10), 10))
+    driver.advance(.1)
+    # The item is already in its place, invisible, and its snapshot is flying there.
+    assert texts(r) == ['1', '2', '3', '4', '0']
+    assert item.opacity == 0
+    assert item.drag_state == 'succeeded'
+    layer = item.get_root_window().children[0]
+    assert len([c for c in layer.children if c.opacity]) == 1
+    driver.advance(.5)
+    assert item.opacity == 1
+    assert item.drag_state is None
+    assert len(layer.children) == 0
+
+
+def test_settle_group(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    Item, Reorderable = classes
+
+    class GroupItem(Item):
+        def get_drag_group(self, touch):
+            return [c for c in reversed(self.parent.children) if c.text in ('1', '2')]
+
+    r = _build(driver, classes, n=0)
+    for i in range(5):
+        r.add_widget(GroupItem(text=str(i), drag_cls='test', drag_timeout=0, drag_settle_duration=.5), index=0)
+    driver.advance()
+    item = r.children[-1]
+    driver.drag(linear_path(item.center, (item.center_x, 10), 10))
+    driver.advance(.1)
+    assert texts(r) == ['3', '4', '0', '1', '2']
+    assert [c.opacity for c in reversed(r.children)] == [1, 1, 0, 0, 0]
+    driver.advance(.5)
+    assert all(c.opacity == 1 for c in r.children)
+
+
+def test_a_new_flight_replaces_the_old_one(driver):
+    import asynckivy as ak
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable._animator import fly
+    w = Widget(pos=(0, 0))
+    task1 = ak.start(fly(w, pos=(100, 0), duration=1))
+    driver.advance(.5)
+    task2 = ak.start(fly(w, pos=(0, 100), duration=1))
+    assert task1.finished
+    assert not task2.finished
+    assert w.pos == pytest.approx((50, 0), abs=2)
+    driver.advance(1.)
+    # The frame durations may add up to slightly less than a second.
+    driver.step()
+    assert task2.finished
+    assert w.pos == [0, 100]
+
+
+@pytest.mark.parametrize('use_proxy', [False, True])
+@pytest.mark.parametrize('how', ['drag_cancel', 'cancel_drags', 'transfer_widgets'])
+def test_cancel_while_settling(driver, classes, use_proxy, how):
+    '''Cancelling a drag that has already succeeded doesn't undo the drop.'''
+    from kivy_garden.draggable import cancel_drags
+    from kivy_garden.draggable.testing import linear_path
+    r = _build(driver, classes, n=5, drag_settle_duration=.5, drag_use_proxy=use_proxy)
+    item = r.children[-1]
+    events = []
+    for name in ('on_drag_succeed', 'on_drag_fail', 'on_drag_cancel', 'on_drag_end'):
+        item.fbind(name, lambda *args, name=name: events.append(name))
+    driver.drag(linear_path(item.center, (item.center_x, 10), 10))
+    driver.advance(.1)
+    assert item.drag_state == 'succeeded'
+    if how == 'drag_cancel':
+        item.drag_cancel()
+    elif how == 'cancel_drags':
+        cancel_drags()
+    else:
+        r.transfer_widgets([item])
+    assert events == ['on_drag_succeed', 'on_drag_end']
+    assert item.drag_state is None
+    assert texts(r) == ['1', '2', '3', '4', '0']
+    assert item.opacity == 1
+    layer = item.get_root_window().children[0]
+    assert len(layer.children) == 0
+    driver.advance(1.)
+    assert texts(r) == ['1', '2', '3', '4', '0']
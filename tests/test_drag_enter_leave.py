@@ -0,0 +1,154 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Recorder:
+        events = None
+
+        def on_drag_enter(self, touch, ctx, draggable):
+            self.events.append(('enter', self.name, draggable.text, self.n_drags_inside, ))
+
+        def on_drag_leave(self, touch, ctx, draggable):
+            self.events.append(('leave', self.name, draggable.text, self.n_drags_inside, ))
+
+    class Droppable(Recorder, F.KXDroppableBehavior, F.Widget):
+        pass
+
+    class Reorderable(Recorder, F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    return (Item, Droppable, Reorderable, )
+
+
+def _build(driver, classes, droppable_cls_name='Droppable'):
+    '''Three droppables of 'a', 'a' and 'b' side by side at the top, and the items at the bottom.'''
+    from kivy.uix.boxlayout import BoxLayout
+    Item, Droppable, Reorderable = classes
+    cls = Droppable if droppable_cls_name == 'Droppable' else Reorderable
+    events = []
+    root = BoxLayout(orientation='vertical')
+    top = BoxLayout()
+    droppables = {}
+    for name, drag_classes in (('A', ['a']), ('B', ['a']), ('C', ['b'])):
+        droppables[name] = d = cls(drag_classes=drag_classes)
+        d.name = name
+        d.events = events
+        top.add_widget(d)
+    bottom = BoxLayout()
+    items = {}
+    for text, drag_cls in (('a1', 'a'), ('a2', 'a'), ('b1', 'b')):
+        items[text] = item = Item(text=text, drag_cls=drag_cls, drag_timeout=0)
+        bottom.add_widget(item)
+    root.add_widget(top)
+    root.add_widget(bottom)
+    driver.window.add_widget(root)
+    driver.advance()
+    return (droppables, items, events, )
+
+
+def _move(driver, touch, pos):
+    driver.touch_move(touch, *pos)
+    driver.advance()
+
+
+@pytest.mark.parametrize('droppable_cls_name', ('Droppable', 'Reorderable', ))
+def test_enter_and_leave(driver, classes, droppable_cls_name):
+    droppables, items, events = _build(driver, classes, droppable_cls_name)
+    A, B, C = droppables.values()
+    a1 = items['a1']
+    t = driver.touch_down(*a1.center)
+    driver.advance()
+    assert events == []
+    _move(driver, t, A.center)
+    assert events == [('enter', 'A', 'a1', 1)]
+    _move(driver, t, (A.center_x + 10, A.center_y))
+    assert events == [('enter', 'A', 'a1', 1)]
+    _move(driver, t, B.center)
+    assert events[1:] == [('leave', 'A', 'a1', 0), ('enter', 'B', 'a1', 1)]
+    _move(driver, t, C.center)
+    assert events[3:] == [('leave', 'B', 'a1', 0)]
+    assert C.n_drags_inside == 0
+    _move(driver, t, (10, 10))
+    assert events[4:] == []
+    driver.touch_up(t)
+    driver.advance(1)
+    assert events[4:] == []
+
+
+def test_leave_fires_when_the_drag_ends_over_it(driver, classes):
+    droppables, items, events = _build(driver, classes)
+    A = droppables['A']
+    a1 = items['a1']
+    a1.bind(
+        on_drag_succeed=lambda *args: events.append('succeed'),
+        on_drag_end=lambda *args: events.append('end'),
+    )
+    t = driver.touch_down(*a1.center)
+    driver.advance()
+    _move(driver, t, A.center)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert events == [('enter', 'A', 'a1', 1), 'succeed', ('leave', 'A', 'a1', 0), 'end']
+
+
+def test_leave_fires_when_the_drag_gets_cancelled(driver, classes):
+    droppables, items, events = _build(driver, classes)
+    A = droppables['A']
+    a1 = items['a1']
+    t = driver.touch_down(*a1.center)
+    driver.advance()
+    _move(driver, t, A.center)
+    a1.drag_cancel()
+    assert events == [('enter', 'A', 'a1', 1), ('leave', 'A', 'a1', 0)]
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_multiple_drags(driver, classes):
+    droppables, items, events = _build(driver, classes)
+    A = droppables['A']
+    t1 = driver.touch_down(*items['a1'].center)
+    t2 = driver.touch_down(*items['a2'].center)
+    driver.advance()
+    driver.touch_move(t1, A.x + 10, A.center_y)
+    driver.touch_move(t2, A.right - 10, A.center_y)
+    driver.advance()
+    assert A.n_drags_inside == 2
+    driver.touch_move(t1, 10, 10)
+    driver.advance()
+    assert A.n_drags_inside == 1
+    driver.touch_up(t1)
+    driver.touch_up(t2)
+    driver.advance(1)
+    assert A.n_drags_inside == 0
+    assert [e[:3] for e in events] == [
+        ('enter', 'A', 'a1'), ('enter', 'A', 'a2'), ('leave', 'A', 'a1'), ('leave', 'A', 'a2'),
+    ]
+
+
+def test_only_the_topmost_one_gets_the_events(driver, classes):
+    Item, Droppable, Reorderable = classes
+    droppables, items, events = _build(driver, classes)
+    A = droppables['A']
+    inner = Droppable(drag_classes=['a'], size_hint=(None, None), size=(20, 20), pos=A.pos)
+    inner.name = 'inner'
+    inner.events = events
+    A.add_widget(inner)
+    driver.advance()
+    t = driver.touch_down(*items['a1'].center)
+    driver.advance()
+    _move(driver, t, A.center)
+    _move(driver, t, inner.center)
+    _move(driver, t, A.center)
+    assert [e[:2] for e in events] == [
+        ('enter', 'A'), ('leave', 'A'), ('enter', 'inner'), ('leave', 'inner'), ('enter', 'A'),
+    ]
+    driver.touch_up(t)
+    driver.advance(1)
@@ -0,0 +1,114 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        def on_drag_end(self, touch, ctx):
+            self.last_ctx = ctx
+
+    class Droppable(F.KXDroppableBehavior, F.Widget):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    return (Item, Droppable, Reorderable, )
+
+
+def _build(driver, classes, **kwargs):
+    '''An item at the left of the window, and a droppable occupying the right quarter of it.'''
+    Item, Droppable, Reorderable = classes
+    droppable = Droppable(drag_classes=['test'], size_hint=(None, None), size=(200, 600), pos=(600, 0))
+    item = Item(drag_cls='test', drag_timeout=0, size_hint=(None, None), size=(100, 100), pos=(0, 250), **kwargs)
+    driver.window.add_widget(droppable)
+    driver.window.add_widget(item)
+    driver.advance()
+    return (item, droppable, )
+
+
+def test_velocity(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    item, __ = _build(driver, classes, drag_velocity_samples=3)
+    t = driver.touch_down(50, 300)
+    driver.advance()
+    for x, y in linear_path((50, 300), (250, 300), 20)[1:]:
+        driver.touch_move(t, x, y)
+        driver.advance()
+    driver.touch_move(t, 260, 300)
+    driver.touch_up(t)
+    driver.advance(1)
+    ctx = item.last_ctx
+    # the last two moves and the release, which was at the same time as the last move
+    assert len(ctx.velocity_samples) == 3
+    assert ctx.velocity_samples[-1][1:] == (260, 300)
+    vx, vy = ctx.velocity
+    assert vx == pytest.approx(10 * 60, rel=.05)
+    assert vy == pytest.approx(0, abs=1)
+    assert ctx.fling_pos is None
+
+
+def test_velocity_is_not_tracked_by_default(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    item, __ = _build(driver, classes)
+    driver.drag(linear_path((50, 300), (250, 300), 20))
+    driver.advance(1)
+    ctx = item.last_ctx
+    assert ctx.velocity_samples is None
+    assert ctx.velocity == (0, 0)
+
+
+@pytest.mark.parametrize('fling_time, expected', [(0, 'failed'), (.3, 'succeeded')])
+def test_fling_to_a_droppable(driver, classes, fling_time, expected):
+    from kivy_garden.draggable.testing import linear_path
+    item, droppable = _build(driver, classes, drag_fling_time=fling_time)
+    states = []
+    item.bind(drag_state=lambda __, v: states.append(v))
+    # 30 pixels per frame, which is 1800 pixels per second, released far from the droppable.
+    driver.drag(linear_path((50, 300), (350, 300), 10))
+    driver.advance(1)
+    assert expected in states
+    if expected == 'succeeded':
+        assert item.parent is droppable
+        x, y = item.last_ctx.fling_pos
+        assert 600 <= x <= 800
+        assert y == pytest.approx(300)
+    else:
+        assert item.parent is driver.window
+
+
+def test_slow_release_is_not_a_throw(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    item, __ = _build(driver, classes, drag_fling_time=.3)
+    t = driver.touch_down(50, 300)
+    driver.advance()
+    for x, y in linear_path((50, 300), (350, 300), 10)[1:]:
+        driver.touch_move(t, x, y)
+        driver.advance()
+    # The finger stops before being lifted.
+    driver.advance(.3)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert item.last_ctx.fling_pos is None
+    assert item.parent is driver.window
+
+
+@pytest.mark.parametrize('spacer_min_dwell', [0, 1])
+def test_fling_within_a_reorderable(driver, classes, spacer_min_dwell):
+    '''A throw past the end of a reorderable picks its last slot, regardless of the placement policy.'''
+    from kivy_garden.draggable.testing import linear_path
+    Item, Droppable, Reorderable = classes
+    r = Reorderable(
+        drag_classes=['test'], orientation='vertical', size_hint=(.5, 1), spacer_min_dwell=spacer_min_dwell)
+    for i in range(10):
+        r.add_widget(Item(text=str(i), drag_cls='test', drag_timeout=0, drag_fling_time=.5), index=0)
+    driver.window.add_widget(r)
+    driver.advance()
+    item = r.children[-1]
+    x, y = item.center
+    driver.drag(linear_path((x, y), (x, y - 150), 5))
+    driver.advance(1)
+    assert [c.text for c in reversed(r.children)] == [str(i) for i in range(1, 10)] + ['0']
@@ -0,0 +1,119 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def Item():
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable import KXDraggableBehavior
+
+    class Recorder(Widget):
+        '''Records the touch events it receives as a normal widget, in its parent's coordinates.'''
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.events = []
+
+        def on_touch_down(self, touch):
+            if self.collide_point(*touch.pos):
+                self.events.append(('down', *touch.pos))
+                touch.grab(self)
+                return True
+
+        def on_touch_up(self, touch):
+            if touch.grab_current is self:
+                self.events.append(('up', *touch.pos))
+                touch.ungrab(self)
+                return True
+
+    class Item(KXDraggableBehavior, Recorder):
+        pass
+
+    return Item
+
+
+def _build(driver, Item, n=1):
+    '''A row of items of 100x100, inside a RelativeLayout placed at (100, 100).'''
+    from kivy.uix.relativelayout import RelativeLayout
+    root = RelativeLayout(size_hint=(None, None), size=(100 * n, 100), pos=(100, 100))
+    items = []
+    for i in range(n):
+        item = Item(
+            drag_cls='test', drag_timeout=500, drag_distance=10,
+            size_hint=(None, None), size=(100, 100), pos=(100 * i, 0))
+        root.add_widget(item)
+        items.append(item)
+    driver.window.add_widget(root)
+    driver.advance()
+    return items
+
+
+def test_held(driver, Item):
+    item, = _build(driver, Item)
+    events = []
+    item.bind(on_drag_start=lambda *args: events.append('start'))
+    t = driver.touch_down(150, 150)
+    driver.advance(.4)
+    driver.touch_move(t, 155, 150)
+    driver.advance()
+    assert events == []
+    driver.advance(.2)
+    assert events == ['start']
+    assert item.events == []
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_released(driver, Item):
+    item, = _build(driver, Item)
+    t = driver.touch_down(150, 150)
+    driver.advance(.1)
+    driver.touch_up(t)
+    driver.advance(.5)
+    assert item.events == [('down', 50, 50), ('up', 50, 50)]
+    assert not item.is_being_dragged
+
+
+def test_moved(driver, Item):
+    item, = _build(driver, Item)
+    t = driver.touch_down(150, 150)
+    driver.advance(.1)
+    driver.touch_move(t, 170, 150)
+    driver.advance()
+    assert item.events == [('down', 70, 50)]
+    driver.advance(1)
+    assert not item.is_being_dragged
+    driver.touch_up(t)
+    driver.advance()
+    assert item.events == [('down', 70, 50), ('up', 70, 50)]
+
+
+def test_moved_and_released_in_the_same_frame(driver, Item):
+    item, = _build(driver, Item)
+    t = driver.touch_down(150, 150)
+    driver.advance(.1)
+    driver.touch_move(t, 170, 150)
+    driver.touch_up(t)
+    driver.advance(.5)
+    assert [e[0] for e in item.events] == ['down', 'up']
+
+
+def test_swipe(driver, Item):
+    '''Many touches are classified by a single Clock callback, without any task.'''
+    from kivy_garden.draggable import _gesture
+    items = _build(driver, Item, n=8)
+    touches = []
+    for i in range(8):
+        touches.append(driver.touch_down(150 + 100 * i, 150))
+        driver.advance()
+    assert len(_gesture._pending) == 8
+    assert _gesture._clock_event is not None
+    for t in touches:
+        driver.touch_move(t, t.x + 50, t.y)
+    driver.advance()
+    assert not _gesture._pending
+    assert _gesture._clock_event is None
+    assert all(len(item.events) == 1 for item in items)
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance()
+    assert all(len(item.events) == 2 for item in items)
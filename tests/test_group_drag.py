@@ -0,0 +1,180 @@
+import pytest
+
+from conftest import build_columns, texts
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        selection = None
+
+        def get_drag_group(self, touch):
+            selection = self.selection
+            return [] if selection is None else selection
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        n_layouts = 0
+
+        def do_layout(self, *args, **kwargs):
+            self.n_layouts += 1
+            super().do_layout(*args, **kwargs)
+
+    return (Item, Reorderable, )
+
+
+def _build(driver, classes, n):
+    return build_columns(driver, classes, [str(i) for i in range(n)], ['x'])
+
+
+def _item(layout, text):
+    for c in layout.children:
+        if c.text == text:
+            return c
+
+
+def test_transfer(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes, 50)
+    lead = _item(r1, '10')
+    group = [c for c in reversed(r1.children) if c is not lead]
+    lead.selection = group
+    contexts = []
+    lead.bind(on_drag_start=lambda w, t, ctx: contexts.append(ctx))
+    x, y = lead.center
+    t = driver.touch_down(x, y)
+    driver.touch_move(t, x + 400, r2.y + 10)
+    driver.advance()
+    ctx, = contexts
+    assert ctx.group == tuple(group)
+    assert ctx.proxy is not None and ctx.proxy.get_root_window() is driver.window
+    assert all(w.opacity == 0 and w.is_being_dragged for w in group)
+    assert len(r1.children) == 50
+    r2.n_layouts = 0
+    driver.touch_up(t)
+    driver.advance()
+    n_layouts = r2.n_layouts
+    driver.advance(1)
+    assert r1.children == []
+    # dropped on the lower half of the 'x'
+    assert texts(r2) == ['x', '10', *(str(i) for i in range(50) if i != 10)]
+    # All of them were added in the same frame. (Kivy may lay out twice in a frame as the sizes of the children change,
+    # but that doesn't depend on the number of the children added.)
+    assert r2.n_layouts == n_layouts <= 2
+    assert all(w.opacity == 1 and not w.is_being_dragged for w in (lead, *group))
+    assert ctx.proxy.parent is None
+
+
+@pytest.mark.parametrize('to_top, expected', [
+    (False, ['1', '2', '4', '0', '3', ]),
+    (True, ['0', '3', '1', '2', '4', ]),
+])
+def test_reorder_in_the_same_reorderable(driver, classes, to_top, expected):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes, 5)
+    lead = _item(r1, '0')
+    lead.selection = [_item(r1, '3')]
+    to_pos = (lead.center_x, r1.top - 1 if to_top else r1.y + 1)
+    driver.drag(linear_path(lead.center, to_pos, 10))
+    driver.advance(1)
+    assert texts(r1) == expected
+
+
+def test_ongoing_drags(driver, classes):
+    from kivy_garden.draggable import ongoing_drags, cancel_drags
+    r1, r2 = _build(driver, classes, 5)
+    lead = _item(r1, '0')
+    group = [_item(r1, '2'), _item(r1, '4')]
+    lead.selection = group
+    t = driver.touch_down(*lead.center)
+    driver.touch_move(t, lead.center_x, 1000)
+    driver.advance()
+    assert ongoing_drags(window=driver.window) == [lead, *group]
+    cancel_drags(window=driver.window)
+    driver.advance()
+    assert ongoing_drags(window=driver.window) == []
+    assert not any(w.is_being_dragged for w in (lead, *group))
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+@pytest.mark.parametrize('cancel', (False, True, ))
+def test_fail_or_cancel(driver, classes, cancel):
+    r1, r2 = _build(driver, classes, 5)
+    lead = _item(r1, '0')
+    group = [_item(r1, '2'), _item(r1, '4')]
+    lead.selection = group
+    t = driver.touch_down(*lead.center)
+    driver.touch_move(t, lead.center_x, 1000)
+    driver.advance()
+    if cancel:
+        group[1].drag_cancel()
+        driver.advance()
+        assert not lead.is_being_dragged
+    driver.touch_up(t)
+    driver.advance(1)
+    assert texts(r1) == ['0', '1', '2', '3', '4']
+    assert all(w.opacity == 1 and not w.is_being_dragged for w in (lead, *group))
+
+
+def test_members_that_cannot_be_dragged_are_left_out(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes, 4)
+    lead = _item(r1, '0')
+    disabled = _item(r1, '1')
+    disabled.drag_enabled = False
+    lead.selection = [lead, disabled, _item(r1, '2'), _item(r1, '2')]
+    contexts = []
+    lead.bind(on_drag_start=lambda w, t, ctx: contexts.append(ctx))
+    driver.drag(linear_path(lead.center, (r2.center_x, r2.y + 10), 10))
+    driver.advance(1)
+    assert contexts[0].group == (_item(r2, '2'), )
+    assert texts(r1) == ['1', '3']
+    assert texts(r2) == ['x', '0', '2']
+
+
+def test_transfer_to_a_recycleview(driver, classes):
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivy_garden.draggable import KXRecycleReorderableBehavior
+    from kivy_garden.draggable.testing import linear_path
+    Item, Reorderable = classes
+
+    class RV(KXRecycleReorderableBehavior, RecycleView):
+        def widget_to_datum(self, widget):
+            return {'text': widget.text}
+
+    root = BoxLayout()
+    r1 = Reorderable(drag_classes=['test'], orientation='vertical')
+    for i in range(4):
+        r1.add_widget(Item(text=str(i), drag_cls='test', drag_timeout=0), index=0)
+    rv = RV(drag_classes=['test'])
+    lm = RecycleBoxLayout(
+        orientation='vertical', default_size=(None, 50), default_size_hint=(1, None), size_hint_y=None)
+    lm.bind(minimum_height=lm.setter('height'))
+    rv.add_widget(lm)
+    rv.viewclass = 'Label'
+    rv.data = [{'text': f'b{i}'} for i in range(100)]
+    root.add_widget(r1)
+    root.add_widget(rv)
+    driver.window.add_widget(root)
+    driver.advance()
+    lead = _item(r1, '1')
+    lead.selection = [_item(r1, '3'), _item(r1, '0')]
+    n_data_changes = 0
+
+    def on_data(*args):
+        nonlocal n_data_changes
+        n_data_changes += 1
+    driver.drag(linear_path(lead.center, (600, 520), 10))
+    rv.bind(data=on_data)
+    driver.advance(1)
+    rv_texts = [d['text'] for d in rv.data]
+    idx = rv_texts.index('1')
+    assert rv_texts[idx - 1:idx + 4] == [f'b{idx - 1}', '1', '3', '0', f'b{idx}']
+    assert len(rv_texts) == 103
+    assert texts(r1) == ['2']
+    assert n_data_changes == 1
@@ -4,7 +4,9 @@ import pytest
 def test_flower():
     from kivy_garden.draggable import (
         DragContext,
-        KXDraggableBehavior, KXDroppableBehavior, KXReorderableBehavior,
+        KXDraggableBehavior, KXDroppableBehavior, KXReorderableBehavior, KXRecycleReorderableBehavior,
         restore_widget_state, save_widget_state,
-        restore_widget_location, save_widget_location, ongoing_drags,
+        restore_widget_location, save_widget_location, ongoing_drags, cancel_drags,
+        DragStats, DragMetrics, drag_metrics, ProxyTextureCache, proxy_texture_cache,
+        SpacerPool, spacer_pool, fly,
     )
@@ -0,0 +1,89 @@
+import pytest
+
+from conftest import build_columns, texts
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        n_foreign_moves = 0
+        '''how many times this received an ``on_touch_move`` of a touch it hasn't grabbed'''
+
+        def on_touch_move(self, touch):
+            if touch.grab_current is None:
+                self.n_foreign_moves += 1
+            return super().on_touch_move(touch)
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    return (Item, Reorderable, )
+
+
+def _build(driver, classes, n):
+    '''Two vertical reorderables side by side. The left one has ``n`` items, and the right one is empty.'''
+    return build_columns(driver, classes, [str(i) for i in range(n)], [])
+
+
+@pytest.mark.parametrize('use_proxy', [False, True])
+def test_movers_share_a_layer(driver, classes, use_proxy):
+    left, right = _build(driver, classes, 10)
+    items = left.children[:]
+    for item in items:
+        item.drag_use_proxy = use_proxy
+    n_window_children = len(driver.window.children)
+    touches = [driver.touch_down(*item.center) for item in items]
+    driver.advance()
+    for t in touches:
+        driver.touch_move(t, t.x + 10, t.y)
+    driver.advance()
+    assert len(driver.window.children) == n_window_children + 1
+    layer = driver.window.children[0]
+    assert len(layer.children) == len(items)
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert len(layer.children) == 0
+    assert sorted(texts(left)) == sorted(item.text for item in items)
+
+
+def test_moves_dont_visit_the_other_drags(driver, classes):
+    left, right = _build(driver, classes, 10)
+    items = left.children[:]
+    touches = [driver.touch_down(*item.center) for item in items]
+    driver.advance()
+    for i in range(1, 11):
+        for t in touches:
+            driver.touch_move(t, t.ox + right.x * i / 10, t.oy)
+        driver.advance()
+    # Each of them receives its own moves through the grab, and nobody else's.
+    assert all(item.n_foreign_moves == 0 for item in items)
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert sorted(texts(right)) == sorted(item.text for item in items)
+    assert left.children == []
+
+
+def test_the_layer_stays_on_top(driver, classes):
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable.testing import linear_path
+    left, right = _build(driver, classes, 2)
+    item = left.children[-1]
+    driver.drag(linear_path(item.center, (item.center_x + 10, item.center_y), 2))
+    driver.advance(1)
+    layer = driver.window.children[0]
+    overlay = Widget()
+    driver.window.add_widget(overlay)
+    assert driver.window.children[0] is overlay
+
+    item = left.children[-1]
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    assert driver.window.children[0] is layer
+    assert item.parent is layer
+    driver.touch_up(t)
+    driver.advance(1)
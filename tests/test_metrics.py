@@ -0,0 +1,84 @@
+import pytest
+
+from conftest import build_columns
+
+
+def test_aggregation():
+    from kivy_garden.draggable import DragMetrics, DragStats
+    metrics = DragMetrics()
+    received = []
+    metrics.bind(on_drag_stats=lambda __, stats: received.append(stats))
+    s1 = DragStats(drag_cls='A', result='succeeded', n_moves=3, move_time=.5, drop_latency=.1)
+    s2 = DragStats(drag_cls='B', result='cancelled', n_moves=2, n_spacer_moves=4, n_layouts=1)
+    metrics._add(s1)
+    metrics._add(s2)
+    assert received == [s1, s2]
+    assert metrics.n_drags == 2
+    totals = metrics.totals
+    assert totals.n_moves == 5
+    assert totals.move_time == .5
+    assert totals.n_spacer_moves == 4
+    assert totals.n_layouts == 1
+    assert totals.drop_latency == .1
+    assert totals.drag_cls is None
+    assert totals.result is None
+    metrics.reset()
+    assert metrics.n_drags == 0
+    assert metrics.totals.n_moves == 0
+
+
+def test_timed_and_counted():
+    from kivy_garden.draggable._metrics import DragStats, timed, counted
+    stats = DragStats()
+    f = counted(timed(lambda x: x * 2, stats, 'hit_test_time'), stats, 'n_spacer_moves')
+    assert f(2) == 4
+    assert f(3) == 6
+    assert stats.n_spacer_moves == 2
+    assert stats.hit_test_time > 0
+
+
+@pytest.fixture()
+def metrics():
+    from kivy_garden.draggable import drag_metrics
+    drag_metrics.reset()
+    drag_metrics.enabled = True
+    received = []
+
+    def on_drag_stats(__, stats):
+        received.append(stats)
+    drag_metrics.bind(on_drag_stats=on_drag_stats)
+    yield received
+    drag_metrics.enabled = False
+    drag_metrics.unbind(on_drag_stats=on_drag_stats)
+    drag_metrics.reset()
+
+
+@pytest.mark.parametrize('coalesce', (False, True, ))
+def test_a_drag_fills_the_stats(driver, classes, metrics, coalesce):
+    from kivy_garden.draggable.testing import linear_path
+    left, right = build_columns(driver, classes, ['0', '1', '2'], ['a'])
+    item = left.children[-1]
+    item.drag_coalesce_moves = coalesce
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    n_moves = 0
+    for x, y in linear_path(item.center, right.center, 10)[1:]:
+        driver.touch_move(t, x, y)
+        n_moves += 1
+        if coalesce:
+            # two events per frame
+            driver.touch_move(t, x, y + 1)
+            n_moves += 1
+        driver.advance()
+    driver.touch_up(t)
+    driver.advance(1)
+    assert item.parent is right
+    stats, = metrics
+    assert stats.drag_cls == 'test'
+    assert stats.result == 'succeeded'
+    assert stats.n_moves == n_moves
+    assert stats.move_time > 0
+    assert stats.hit_test_time > 0
+    assert stats.n_spacer_moves > 0
+    assert stats.n_layouts > 0
+    assert stats.drop_latency >= 0
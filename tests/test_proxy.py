@@ -0,0 +1,161 @@
+import pytest
+
+from conftest import walk_window
+
+
+@pytest.fixture()
+def cache():
+    from kivy_garden.draggable import proxy_texture_cache
+    proxy_texture_cache.clear()
+    yield proxy_texture_cache
+    proxy_texture_cache.clear()
+    proxy_texture_cache.max_entries = 32
+
+
+def _build(driver, classes, n=3):
+    from kivy.uix.boxlayout import BoxLayout
+    Draggable, Reorderable = classes
+    root = BoxLayout()
+    r1 = Reorderable(drag_classes=['test'], orientation='vertical')
+    r2 = Reorderable(drag_classes=['test'], orientation='vertical')
+    for i in range(n):
+        r1.add_widget(Draggable(text=str(i), drag_cls='test', drag_timeout=0, drag_use_proxy=True))
+    root.add_widget(r1)
+    root.add_widget(r2)
+    driver.window.add_widget(root)
+    driver.advance()
+    return (r1, r2, )
+
+
+def test_the_original_stays_during_a_drag(driver, cache, classes):
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    pos = tuple(w.pos)
+    size = tuple(w.size)
+    contexts = []
+    w.bind(on_drag_start=lambda w, t, ctx: contexts.append(ctx))
+    t = driver.touch_down(*w.center)
+    driver.touch_move(t, w.center_x + 100, w.center_y)
+    driver.advance()
+    ctx, = contexts
+    proxy = ctx.proxy
+    assert proxy.get_root_window() is driver.window
+    assert tuple(proxy.size) == size
+    assert proxy.x == pytest.approx(pos[0] + 100)
+    assert w.parent is r1
+    assert w.opacity == 0
+    driver.touch_up(t)
+    driver.advance(1)
+    assert proxy.parent is None
+    assert w.opacity == 1
+
+
+def test_drag_succeed(driver, cache, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    driver.drag(linear_path(w.center, r2.center, 10))
+    driver.advance(1)
+    assert w.parent is r2
+    assert len(r1.children) == 2
+    assert w.opacity == 1
+    assert [c for c in walk_window(driver.window) if c.__class__.__name__ == '_DragProxy'] == []
+
+
+@pytest.mark.parametrize('dy, expected', [
+    (0, ['0', '1', '2', '3']),
+    (-200, ['1', '0', '2', '3']),
+    (-500, ['1', '2', '3', '0']),
+])
+def test_reorder_in_the_same_reorderable(driver, cache, classes, dy, expected):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes, n=4)
+    w = r1.children[-1]
+    x, y = w.center
+    driver.drag(linear_path((x, y), (x, y + dy), 10))
+    driver.advance(1)
+    assert [c.text for c in reversed(r1.children)] == expected
+
+
+@pytest.mark.parametrize('cancel', (False, True, ))
+def test_drag_fail_or_cancel(driver, cache, classes, cancel):
+    from kivy_garden.draggable import cancel_drags
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    pos = tuple(w.pos)
+    n_layouts = 0
+
+    def on_children(*args):
+        nonlocal n_layouts
+        n_layouts += 1
+    r1.bind(children=on_children)
+    t = driver.touch_down(*w.center)
+    driver.touch_move(t, w.center_x, 1000)
+    driver.advance()
+    if cancel:
+        cancel_drags(window=driver.window)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert w.parent is r1
+    assert r1.children.index(w) == 1
+    assert tuple(w.pos) == pos
+    assert w.opacity == 1
+    assert n_layouts == 0
+    assert not w.is_being_dragged
+
+
+def test_textures_are_reused(driver, cache, classes):
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    textures = []
+    w.bind(on_drag_start=lambda w, t, ctx: textures.append(ctx.proxy.texture))
+
+    def drag():
+        t = driver.touch_down(*w.center)
+        driver.touch_move(t, w.center_x, 1000)
+        driver.advance()
+        driver.touch_up(t)
+        driver.advance(1)
+
+    drag()
+    drag()
+    assert len(cache) == 1
+    assert textures[0] is textures[1]
+    cache.discard(w)
+    assert len(cache) == 0
+    drag()
+    assert textures[2] is not textures[1]
+    assert tuple(textures[2].size) == (int(w.width), int(w.height))
+
+
+def test_lru_eviction(cache):
+    from kivy.uix.widget import Widget
+    cache.max_entries = 2
+    w1, w2, w3 = (Widget(size=(10, 10)) for __ in range(3))
+    t1 = cache.get(w1)
+    cache.get(w2)
+    assert cache.get(w1) is t1
+    cache.get(w3)  # evicts w2
+    assert len(cache) == 2
+    assert cache.get(w1) is t1
+    w1.size = (20, 20)
+    assert cache.get(w1) is not t1
+    cache.max_entries = 0
+    assert len(cache) == 0
+    assert cache.get(w3) is not cache.get(w3)
+    with pytest.raises(ValueError):
+        cache.max_entries = -1
+
+
+def test_dead_widgets_are_evicted_first(cache):
+    import gc
+    from kivy.uix.widget import Widget
+    cache.max_entries = 2
+    w1 = Widget(size=(10, 10))
+    cache.get(w1)
+    cache.get(Widget(size=(10, 10)))
+    gc.collect()
+    w3 = Widget(size=(10, 10))
+    cache.get(w3)
+    assert cache.get(w1) is cache.get(w1)
+    assert len(cache) == 2
@@ -0,0 +1,220 @@
+import pytest
+
+SCROLL_TIMEOUT = .3
+'''How long a touch needs to stay still before a ScrollView passes it to its children'''
+
+
+@pytest.fixture(scope='module')
+def RV():
+    from kivy.factory import Factory as F
+    from kivy.uix.recycleview import RecycleView
+    from kivy_garden.draggable import KXRecycleReorderableBehavior, KXDraggableBehavior
+
+    class Row(KXDraggableBehavior, F.Label):
+        pass
+    F.register('TestRecycleReorderable_Row', cls=Row)
+
+    class RV(KXRecycleReorderableBehavior, RecycleView):
+        pass
+    return RV
+
+
+def _create_rv(RV, n, **kwargs):
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    rv = RV(drag_classes=['row'], **kwargs)
+    lm = RecycleBoxLayout(
+        orientation='vertical', default_size=(None, 50), default_size_hint=(1, None), size_hint_y=None)
+    lm.bind(minimum_height=lm.setter('height'))
+    rv.add_widget(lm)
+    rv.viewclass = 'TestRecycleReorderable_Row'
+    rv.data = [{'text': str(i), 'drag_cls': 'row', 'drag_timeout': 0} for i in range(n)]
+    return rv
+
+
+def _view_of(rv, text):
+    for c in rv.layout_manager.children:
+        if getattr(c, 'text', None) == text:
+            return c
+
+
+def _texts(rv):
+    return [d.get('text') for d in rv.data]
+
+
+def _drag(driver, rv, text, dx, dy):
+    from kivy_garden.draggable.testing import linear_path
+    view = _view_of(rv, text)
+    x, y = view.to_window(*view.center)
+    driver.drag(linear_path((x, y), (x + dx, y + dy), 10), hold=SCROLL_TIMEOUT)
+    driver.advance(.5)
+    return view
+
+
+@pytest.mark.parametrize('dy, expected', [
+    (0, ['0', '1', '2', '3', '4']),
+    (-60, ['1', '0', '2', '3', '4']),
+    (-130, ['1', '2', '3', '0', '4']),
+])
+def test_reorder(driver, RV, dy, expected):
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    driver.window.add_widget(rv)
+    driver.advance()
+    n_views = len(rv.layout_manager.children)
+    assert n_views < 20
+    _drag(driver, rv, '0', 0, dy)
+    assert _texts(rv)[:5] == expected
+    assert len(rv.data) == 1000
+    assert len(rv.layout_manager.children) == n_views
+
+
+def test_the_gap_follows_the_drag(driver, RV):
+    from kivy_garden.draggable.testing import linear_path
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    driver.window.add_widget(rv)
+    driver.advance()
+    view = _view_of(rv, '0')
+    x, y = view.to_window(*view.center)
+    t = driver.touch_down(x, y)
+    driver.advance(SCROLL_TIMEOUT)
+    for x, y in linear_path((x, y), (x, y - 130), 10):
+        driver.touch_move(t, x, y)
+        driver.advance()
+    assert _texts(rv)[:5] == ['1', '2', '3', None, '4']
+    assert 'KXRecycleSpacer' in [c.__class__.__name__ for c in rv.layout_manager.children]
+    driver.touch_move(t, 700, y)
+    driver.advance()
+    assert _texts(rv)[:5] == ['1', '2', '3', '4', '5']
+    driver.touch_up(t)
+    driver.advance(.5)
+    assert _texts(rv)[:5] == ['0', '1', '2', '3', '4']
+
+
+def test_fail(driver, RV):
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    driver.window.add_widget(rv)
+    driver.advance()
+    view = _drag(driver, rv, '1', 500, 0)
+    assert _texts(rv)[:5] == ['0', '1', '2', '3', '4']
+    assert len(rv.data) == 1000
+    assert view.parent is None or view.parent is rv.layout_manager
+
+
+def test_cancel(driver, RV):
+    from kivy_garden.draggable import cancel_drags
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    driver.window.add_widget(rv)
+    driver.advance()
+    view = _view_of(rv, '1')
+    x, y = view.to_window(*view.center)
+    t = driver.touch_down(x, y)
+    driver.advance(SCROLL_TIMEOUT)
+    driver.touch_move(t, x, y - 100)
+    driver.advance()
+    assert None in _texts(rv)[:5]
+    cancel_drags(window=driver.window)
+    driver.advance()
+    assert _texts(rv)[:5] == ['0', '1', '2', '3', '4']
+    driver.touch_up(t)
+
+
+def test_transfer_between_recycleviews(driver, RV):
+    from kivy.uix.boxlayout import BoxLayout
+    root = BoxLayout()
+    rv1 = _create_rv(RV, 1000)
+    rv2 = _create_rv(RV, 1000)
+    rv2.data = [{'text': f'b{i}', 'drag_cls': 'row', 'drag_timeout': 0} for i in range(1000)]
+    root.add_widget(rv1)
+    root.add_widget(rv2)
+    driver.window.add_widget(root)
+    driver.advance()
+    _drag(driver, rv1, '0', 400, -60)
+    assert _texts(rv1)[:3] == ['1', '2', '3']
+    assert _texts(rv2)[:3] == ['b0', '0', 'b1']
+    assert len(rv1.data) == 999
+    assert len(rv2.data) == 1001
+
+
+def test_transfer_to_a_regular_reorderable(driver, RV):
+    from kivy.factory import Factory as F
+    from kivy.uix.boxlayout import BoxLayout
+    import kivy_garden.draggable
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    root = BoxLayout()
+    rv = _create_rv(RV, 1000)
+    reorderable = Reorderable(drag_classes=['row'])
+    root.add_widget(rv)
+    root.add_widget(reorderable)
+    driver.window.add_widget(root)
+    driver.advance()
+    view = _drag(driver, rv, '0', 400, 0)
+    assert _texts(rv)[:3] == ['1', '2', '3']
+    assert reorderable.children == [view]
+
+
+def test_widget_to_datum(driver, RV):
+    from kivy.factory import Factory as F
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy_garden.draggable.testing import linear_path
+    import kivy_garden.draggable
+
+    class MyRV(RV):
+        def widget_to_datum(self, widget):
+            return {'text': widget.text, 'drag_cls': 'row', 'drag_timeout': 0}
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    root = BoxLayout()
+    rv = _create_rv(MyRV, 1000)
+    layout = BoxLayout()
+    item = Item(text='new', drag_cls='row', drag_timeout=0)
+    layout.add_widget(item)
+    root.add_widget(layout)
+    root.add_widget(rv)
+    driver.window.add_widget(root)
+    driver.advance()
+    x, y = item.to_window(*item.center)
+    driver.drag(linear_path((x, y), (600, 520), 10))
+    driver.advance(.5)
+    assert _texts(rv)[:3] == ['0', 'new', '1']
+    assert len(rv.data) == 1001
+
+
+def test_autoscroll(driver, RV):
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    driver.window.add_widget(rv)
+    driver.advance()
+    view = _view_of(rv, '0')
+    x, y = view.to_window(*view.center)
+    t = driver.touch_down(x, y)
+    driver.advance(SCROLL_TIMEOUT)
+    driver.touch_move(t, x, 5)
+    driver.advance(2.)
+    assert rv.scroll_y < 1.
+    gap_idx = _texts(rv).index(None)
+    assert gap_idx > 20
+    driver.touch_up(t)
+    driver.advance(.5)
+    assert _texts(rv)[gap_idx] == '0'
+    assert len(rv.data) == 1000
+
+
+@pytest.mark.parametrize('dx, dy, expected', [
+    (500, 0, ['0', '1', '2', '3', '4']),
+    (0, -130, ['1', '2', '3', '0', '4']),
+])
+def test_proxy(driver, RV, dx, dy, expected):
+    rv = _create_rv(RV, 1000, size_hint=(.5, 1))
+    for datum in rv.data:
+        datum['drag_use_proxy'] = True
+    driver.window.add_widget(rv)
+    driver.advance()
+    n_views = len(rv.layout_manager.children)
+    _drag(driver, rv, '0', dx, dy)
+    assert _texts(rv)[:5] == expected
+    assert len(rv.data) == 1000
+    assert len(rv.layout_manager.children) == n_views
+    assert all(c.opacity == 1 for c in rv.layout_manager.children)
@@ -0,0 +1,223 @@
+import pytest
+
+
+@pytest.fixture()
+def window():
+    from kivy.core.window import Window
+    children = Window.children[:]
+    yield Window
+    for c in Window.children[:]:
+        if c not in children:
+            Window.remove_widget(c)
+
+
+@pytest.fixture()
+def Droppable():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Droppable(F.KXDroppableBehavior, F.Widget):
+        pass
+    return Droppable
+
+
+def test_registration(Droppable):
+    from kivy_garden.draggable._registry import iter_droppables
+    d = Droppable(drag_classes=['A', 'B'])
+    assert d in list(iter_droppables('A'))
+    assert d in list(iter_droppables('B'))
+    d.drag_classes = ['B', 'C']
+    assert d not in list(iter_droppables('A'))
+    assert d in list(iter_droppables('B'))
+    assert d in list(iter_droppables('C'))
+    d.drag_classes = []
+    assert d not in list(iter_droppables('B'))
+    assert d not in list(iter_droppables('C'))
+
+
+def test_not_on_a_window(Droppable):
+    from kivy_garden.draggable._registry import find_droppable, get_window_bounds
+    d = Droppable(drag_classes=['A'], pos=(0, 0), size=(100, 100))
+    assert get_window_bounds(d) is None
+    assert find_droppable('A', 50, 50) is None
+
+
+def test_bounds_get_invalidated(window, Droppable):
+    from kivy.uix.relativelayout import RelativeLayout
+    from kivy_garden.draggable._registry import get_window_bounds
+    rl = RelativeLayout(pos=(100, 100), size=(200, 200), size_hint=(None, None))
+    d = Droppable(drag_classes=['A'], pos=(10, 10), size=(20, 20), size_hint=(None, None))
+    rl.add_widget(d)
+    assert get_window_bounds(d) is None
+    window.add_widget(rl)
+    assert get_window_bounds(d) == (110, 110, 130, 130)
+    rl.pos = (0, 0)
+    assert get_window_bounds(d) == (10, 10, 30, 30)
+    d.width = 40
+    assert get_window_bounds(d) == (10, 10, 50, 30)
+    window.remove_widget(rl)
+    assert get_window_bounds(d) is None
+
+
+def test_clipped_by_stencil(window, Droppable):
+    from kivy.uix.stencilview import StencilView
+    from kivy_garden.draggable._registry import get_window_bounds, find_droppable
+    sv = StencilView(pos=(0, 0), size=(100, 100), size_hint=(None, None))
+    d = Droppable(drag_classes=['A'], pos=(50, 50), size=(100, 100), size_hint=(None, None))
+    sv.add_widget(d)
+    window.add_widget(sv)
+    assert get_window_bounds(d) == (50, 50, 100, 100)
+    assert find_droppable('A', 120, 120) is None
+    assert find_droppable('A', 70, 70) is d
+
+
+def test_topmost_one_wins(window, Droppable):
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable._registry import find_droppable
+    root = Widget()
+    lower = Droppable(drag_classes=['A'], pos=(0, 0), size=(100, 100))
+    upper = Droppable(drag_classes=['A'], pos=(50, 50), size=(100, 100))
+    inner = Droppable(drag_classes=['A'], pos=(0, 0), size=(10, 10))
+    root.add_widget(lower)
+    root.add_widget(upper)
+    lower.add_widget(inner)
+    window.add_widget(root)
+    assert find_droppable('A', 70, 70) is upper
+    assert find_droppable('A', 20, 20) is lower
+    assert find_droppable('A', 5, 5) is inner
+    assert find_droppable('A', 5, 5, excluding=lower) is None
+    assert find_droppable('B', 70, 70) is None
+
+
+def test_other_windows_are_ignored(window, Droppable):
+    from kivy_garden.draggable._registry import find_droppable
+    from kivy_garden.draggable.testing import VirtualWindow
+    d = Droppable(drag_classes=['A'], pos=(0, 0), size=(100, 100))
+    other_window = VirtualWindow()
+    other_window.add_widget(d)
+    assert find_droppable('A', 50, 50) is d
+    assert find_droppable('A', 50, 50, window=other_window) is d
+    assert find_droppable('A', 50, 50, window=window) is None
+
+
+def test_window_to_parent(window, Droppable):
+    from kivy.uix.relativelayout import RelativeLayout
+    from kivy.uix.scatter import Scatter
+    from kivy.uix.scrollview import ScrollView
+    from kivy_garden.draggable._registry import window_to_parent, window_to_local
+
+    class CountingRelativeLayout(RelativeLayout):
+        n_calls = 0
+
+        def to_widget(self, *args, **kwargs):
+            self.n_calls += 1
+            return super().to_widget(*args, **kwargs)
+
+    scatter = Scatter(pos=(100, 50), rotation=30, scale=2, size_hint=(None, None), do_collide_after_children=False)
+    sv = ScrollView(size=(200, 200), size_hint=(None, None), pos=(10, 10))
+    rl = CountingRelativeLayout(size=(200, 400), size_hint=(1, None), pos=(0, 0))
+    d = Droppable(drag_classes=['A'], pos=(5, 5), size=(20, 20), size_hint=(None, None))
+    rl.add_widget(d)
+    sv.add_widget(rl)
+    scatter.add_widget(sv)
+    window.add_widget(scatter)
+    sv.update_from_scroll()
+
+    def expected(x, y):
+        return rl.to_widget(x, y)
+
+    for pos in ((0, 0), (123, 45), (300, 200)):
+        assert window_to_parent(d, *pos) == pytest.approx(expected(*pos))
+        assert window_to_local(d, *pos) == pytest.approx(d.to_widget(*pos))
+    n_calls = rl.n_calls
+    for __ in range(10):
+        window_to_parent(d, 10, 10)
+    assert rl.n_calls == n_calls
+
+    # The ancestors moving, scrolling, and transforming invalidate the cache.
+    sv.x = 30
+    sv.update_from_scroll()
+    assert window_to_parent(d, 50, 60) == pytest.approx(expected(50, 60))
+    # The ScrollView moves its content after 'scroll_y' has changed, in the next frame.
+    sv.scroll_y = 0.
+    window_to_parent(d, 50, 60)
+    sv.update_from_scroll()
+    assert window_to_parent(d, 50, 60) == pytest.approx(expected(50, 60))
+    scatter.rotation = 90
+    assert window_to_parent(d, 50, 60) == pytest.approx(expected(50, 60))
+
+
+def test_scroll_path(window, Droppable):
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.scrollview import ScrollView
+    from kivy_garden.draggable._registry import get_scroll_path, tree_version
+    sv = ScrollView()
+    box = BoxLayout(size_hint_y=None, height=1000)
+    d = Droppable(drag_classes=['A'])
+    box.add_widget(d)
+    assert get_scroll_path(d) is None
+    version = tree_version()
+    sv.add_widget(box)
+    window.add_widget(sv)
+    assert tree_version() != version
+    w, ancestors, scrollviews = get_scroll_path(d)
+    assert w is window
+    assert ancestors >= {d, box, sv}
+    assert scrollviews == [sv]
+    # cached
+    version = tree_version()
+    sv.scroll_y = 0
+    assert get_scroll_path(d)[1] is ancestors
+    assert tree_version() == version
+    sv.remove_widget(box)
+    assert tree_version() != version
+    window.add_widget(box)
+    assert get_scroll_path(d) is None
+
+
+def test_index(window, Droppable):
+    from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.scrollview import ScrollView
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable._registry import find_droppable, _indexes
+    sv = ScrollView(pos=(0, 0), size=(400, 400), size_hint=(None, None), do_scroll_x=False)
+    grid = GridLayout(cols=10, size=(400, 800), size_hint=(None, None))
+    ds = [Droppable(drag_classes=['A']) for __ in range(200)]
+    for d in ds:
+        grid.add_widget(d)
+    sv.add_widget(grid)
+    large = Droppable(drag_classes=['A'], pos=(0, 0), size=(800, 800), size_hint=(None, None))
+    root = Widget()
+    root.add_widget(large)
+    root.add_widget(sv)
+    window.add_widget(root)
+    grid.do_layout()
+    sv.update_from_scroll()
+    # 40x40 each, and the top row is visible
+    assert find_droppable('A', 5, 395) is ds[0]
+    assert find_droppable('A', 45, 395) is ds[1]
+    assert find_droppable('A', 500, 500) is large
+    index = _indexes['A']
+    assert len(index.candidates(5, 395)) < 10
+    # cached
+    assert find_droppable('A', 45, 355) is ds[11]
+    assert _indexes['A'] is index
+
+    # scrolled to the bottom
+    sv.scroll_y = 0
+    sv.update_from_scroll()
+    assert find_droppable('A', 5, 395) is ds[100]
+    assert _indexes['A'] is not index
+
+    # moved
+    index = _indexes['A']
+    sv.x = 400
+    sv.update_from_scroll()
+    assert find_droppable('A', 5, 395) is large
+    assert find_droppable('A', 405, 395) is ds[100]
+    assert _indexes['A'] is not index
+
+    # removed
+    root.remove_widget(sv)
+    assert 'A' not in _indexes
+    assert find_droppable('A', 405, 395) is large
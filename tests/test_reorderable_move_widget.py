@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.fixture()
+def reorderable():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    r = Reorderable()
+    for i in range(5):
+        r.add_widget(F.Widget())
+    return r
+
+
+def _expected_result(reorderable, widget, index):
+    from kivy.uix.widget import Widget
+    clone = Widget()
+    for c in reversed(reorderable.children):
+        clone.add_widget(Widget())
+    i = reorderable.children.index(widget)
+    w = clone.children[i]
+    clone.remove_widget(w)
+    clone.add_widget(w, index=index)
+    canvas_order = [clone.canvas.indexof(c.canvas) for c in clone.children]
+    moved_to = clone.children.index(w)
+    return moved_to, canvas_order
+
+
+@pytest.mark.parametrize('old_index', range(5))
+@pytest.mark.parametrize('new_index', range(7))
+def test_same_result_as_remove_and_add(reorderable, old_index, new_index):
+    widget = reorderable.children[old_index]
+    moved_to, canvas_order = _expected_result(reorderable, widget, new_index)
+    others = [c for c in reorderable.children if c is not widget]
+    reorderable.move_widget(widget, new_index)
+    assert reorderable.children.index(widget) == moved_to
+    assert [c for c in reorderable.children if c is not widget] == others
+    assert [reorderable.canvas.indexof(c.canvas) for c in reorderable.children] == canvas_order
+
+
+def test_children_fires_only_once(reorderable):
+    from unittest.mock import Mock
+    callback = Mock()
+    reorderable.bind(children=callback)
+    reorderable.move_widget(reorderable.children[0], 3)
+    assert callback.call_count == 1
+    reorderable.move_widget(reorderable.children[3], 3)
+    assert callback.call_count == 1
@@ -0,0 +1,172 @@
+import pytest
+
+from conftest import texts
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        n_layouts = 0
+
+        def do_layout(self, *args, **kwargs):
+            self.n_layouts += 1
+            return super().do_layout(*args, **kwargs)
+
+    return (Item, Reorderable, )
+
+
+def _build(driver, classes, n=5, **kwargs):
+    '''A vertical reorderable of 400x500 at the bottom-left corner, having items of 100px height.'''
+    Item, Reorderable = classes
+    r = Reorderable(
+        drag_classes=['test'], orientation='vertical', size_hint=(None, None), size=(400, 500), pos=(0, 0),
+        **kwargs)
+    for i in range(n):
+        r.add_widget(Item(text=str(i), drag_cls='test', drag_timeout=0), index=0)
+    driver.window.add_widget(r)
+    driver.advance()
+    return r
+
+
+def _offset(widget):
+    from kivy.graphics import Translate
+    translates = [
+        i for g in widget.canvas.before.children for i in getattr(g, 'children', ()) if isinstance(i, Translate)]
+    if not translates:
+        return None
+    assert len(translates) == 1
+    return tuple(translates[0].xy)
+
+
+def _start_dragging(driver, r):
+    '''
+    Starts dragging the topmost item, and waits for the other items to settle. The spacer ends up at the top.
+    '''
+    t = driver.touch_down(200, 450)
+    driver.advance()
+    driver.touch_move(t, 200, 440)
+    driver.advance(.5)
+    assert texts(r) == [None, '1', '2', '3', '4']
+    assert all(_offset(c) is None for c in r.children)
+    return t
+
+
+def test_siblings_slide(driver, classes):
+    r = _build(driver, classes, spacer_anim_duration=.2)
+    items = {c.text: c for c in r.children if hasattr(c, 'text')}
+    t = _start_dragging(driver, r)
+
+    # The spacer moves below the '2'. The '1' and '2' move up by 100px at once, but are drawn where they were.
+    driver.touch_move(t, 200, 240)
+    driver.advance()
+    two = items['2']
+    assert texts(r) == ['1', '2', None, '3', '4']
+    assert two.y == 300
+    assert _offset(two) == pytest.approx((0, -100))
+    assert _offset(items['1']) == pytest.approx((0, -100))
+    assert _offset(items['3']) is None
+
+    # and slides to the new position.
+    driver.advance(.1)
+    assert -100 < _offset(two)[1] < 0
+    driver.advance(.2)
+    assert _offset(two) is None
+
+    # The children close the gap when the drag leaves.
+    driver.touch_move(t, 600, 240)
+    driver.advance()
+    assert _offset(items['3']) is not None
+    driver.advance(.3)
+    assert all(_offset(c) is None for c in r.children)
+    driver.touch_up(t)
+    driver.advance(1)
+    assert all(_offset(c) is None for c in r.children)
+
+
+def test_retarget_while_sliding(driver, classes):
+    '''A child pushed back while sliding slides back from around where it is drawn.'''
+    r = _build(driver, classes, spacer_anim_duration=.2)
+    two = [c for c in r.children if getattr(c, 'text', None) == '2'][0]
+    t = _start_dragging(driver, r)
+    driver.touch_move(t, 200, 240)
+    driver.advance()
+    driver.advance(.1)
+    drawn_y = two.y + _offset(two)[1]
+    driver.touch_move(t, 200, 340)
+    driver.advance()
+    assert two.y == 200
+    # It's drawn a bit closer to the position it was heading to than before, as the animation has progressed in this
+    # frame, and slides back from there.
+    assert drawn_y <= two.y + _offset(two)[1] < 300
+    driver.touch_up(t)
+    driver.advance(1)
+    assert texts(r) == ['1', '0', '2', '3', '4']
+    assert all(_offset(c) is None for c in r.children)
+
+
+@pytest.mark.parametrize('duration', [0, .2])
+def test_drop(driver, classes, duration):
+    from kivy_garden.draggable.testing import linear_path
+    r = _build(driver, classes, spacer_anim_duration=duration)
+    driver.drag(linear_path((200, 450), (200, 250), 10))
+    driver.advance(1)
+    assert texts(r) == ['1', '2', '0', '3', '4']
+    assert all(_offset(c) is None for c in r.children)
+
+
+def test_no_extra_layouts(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    n_layouts = []
+    for duration in (0, .2):
+        r = _build(driver, classes, n=50, spacer_anim_duration=duration)
+        r.n_layouts = 0
+        driver.drag(linear_path((200, 495), (200, 5), 30))
+        driver.advance(1)
+        n_layouts.append(r.n_layouts)
+        driver.window.remove_widget(r)
+    assert n_layouts[0] == n_layouts[1]
+
+
+def test_canvas_changes_while_sliding(driver, classes):
+    '''The instructions added to the canvas of a sliding child are drawn with the translation as well.'''
+    from kivy.graphics import Color, PushMatrix, PopMatrix
+    r = _build(driver, classes, spacer_anim_duration=.2)
+    items = {c.text: c for c in r.children if hasattr(c, 'text')}
+    t = _start_dragging(driver, r)
+    driver.touch_move(t, 200, 240)
+    driver.advance()
+    two = items['2']
+    assert _offset(two) is not None
+    before = Color()
+    after = Color()
+    two.canvas.before.insert(0, before)
+    two.canvas.after.add(after)
+    driver.advance()
+    assert _offset(two) is not None
+    instructions = [*_flatten(two.canvas.before), *_flatten(two.canvas.after)]
+    i_push = instructions.index(next(i for i in instructions if isinstance(i, PushMatrix)))
+    i_pop = instructions.index(next(i for i in instructions if isinstance(i, PopMatrix)))
+    assert i_push < instructions.index(before) < instructions.index(after) < i_pop
+    driver.advance(.3)
+    assert _offset(two) is None
+    assert not any(isinstance(i, (PushMatrix, PopMatrix)) for i in _flatten(two.canvas.before))
+    assert not any(isinstance(i, (PushMatrix, PopMatrix)) for i in _flatten(two.canvas.after))
+    assert before in two.canvas.before.children
+    assert after in two.canvas.after.children
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def _flatten(group):
+    for i in group.children:
+        children = getattr(i, 'children', None)
+        if children is None:
+            yield i
+        else:
+            yield from _flatten(i)
@@ -0,0 +1,129 @@
+import pytest
+
+from conftest import texts
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        n_spacer_moves = 0
+
+        def _move_widget(self, *args, **kwargs):
+            self.n_spacer_moves += 1
+            return super()._move_widget(*args, **kwargs)
+
+    return (Item, Reorderable, )
+
+
+def _build(driver, classes, **kwargs):
+    '''
+    A vertical reorderable of 400x500 at the bottom-left corner. From the top, it has two items of 50px height, a
+    large one of 200px height and four items of 50px height.
+    '''
+    Item, Reorderable = classes
+    r = Reorderable(
+        drag_classes=['test'], orientation='vertical', size_hint=(None, None), size=(400, 500), pos=(0, 0),
+        **kwargs)
+    for i, h in enumerate((50, 50, 200, 50, 50, 50, 50)):
+        r.add_widget(Item(
+            text=str(i), drag_cls='test', drag_timeout=0, size_hint_y=None, height=h), index=0)
+    driver.window.add_widget(r)
+    driver.advance()
+    return r
+
+
+def _wiggle(driver, r, y):
+    '''Drags the topmost item down to the given y, and wiggles it there for a while.'''
+    item = r.children[-1]
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    for y_ in range(int(item.center_y), y, -10):
+        driver.touch_move(t, 200, y_)
+        driver.advance()
+    r.n_spacer_moves = 0
+    for i in range(20):
+        driver.touch_move(t, 200, y + (i % 2) * 2)
+        driver.advance()
+    return t
+
+
+def test_under_thrashes(driver, classes):
+    r = _build(driver, classes)
+    t = _wiggle(driver, r, 330)
+    assert r.n_spacer_moves >= 10
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_midpoint_doesnt_thrash(driver, classes):
+    r = _build(driver, classes, spacer_placement='midpoint')
+    t = _wiggle(driver, r, 330)
+    assert r.n_spacer_moves == 0
+    driver.touch_up(t)
+    driver.advance(1)
+    assert texts(r) == ['1', '0', '2', '3', '4', '5', '6']
+
+
+@pytest.mark.parametrize('to_y, expected', [
+    (310, ['1', None, '2', '3', '4', '5', '6']),  # hasn't crossed the midpoint (300) of the large one
+    (290, ['1', '2', None, '3', '4', '5', '6']),
+])
+def test_midpoint(driver, classes, to_y, expected):
+    from kivy_garden.draggable.testing import linear_path
+    r = _build(driver, classes, spacer_placement='midpoint')
+    item = r.children[-1]
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    for x, y in linear_path(item.center, (200, to_y), 20)[1:]:
+        driver.touch_move(t, x, y)
+        driver.advance()
+    assert texts(r) == expected
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_min_travel(driver, classes):
+    r = _build(driver, classes, spacer_min_travel=20)
+    item = r.children[-1]
+    t = driver.touch_down(*item.center)  # (200, 475)
+    driver.advance()
+    assert texts(r)[:2] == ['1', None]
+    r.n_spacer_moves = 0
+    driver.touch_move(t, 200, 490)  # over the '1', but has traveled only 15px since the spacer was placed
+    driver.advance()
+    assert r.n_spacer_moves == 0
+    assert texts(r)[:2] == ['1', None]
+    driver.touch_move(t, 200, 499)
+    driver.advance()
+    assert r.n_spacer_moves == 1
+    assert texts(r)[:2] == [None, '1']
+    driver.touch_up(t)
+    driver.advance(1)
+
+
+def test_min_dwell(driver, classes):
+    r = _build(driver, classes, spacer_min_dwell=.2)
+    item = r.children[-1]
+    t = driver.touch_down(*item.center)
+    driver.advance()
+    assert texts(r)[:2] == ['1', None]
+    driver.touch_move(t, 200, 480)
+    driver.advance(.1)
+    assert texts(r)[:2] == ['1', None]
+    driver.advance(.15)
+    assert texts(r)[:2] == [None, '1']
+    # A destination that doesn't last long enough is ignored.
+    driver.touch_move(t, 200, 420)
+    driver.advance(.1)
+    driver.touch_move(t, 200, 470)
+    driver.advance(.3)
+    assert texts(r)[:2] == [None, '1']
+    driver.touch_up(t)
+    driver.advance(1)
+    assert texts(r)[:2] == ['0', '1']
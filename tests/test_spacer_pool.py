@@ -0,0 +1,98 @@
+import pytest
+
+from conftest import build_columns
+
+
+@pytest.fixture()
+def pool():
+    from kivy_garden.draggable import spacer_pool
+    from kivy_garden.draggable._utils import _create_spacer
+    created = []
+
+    def factory():
+        spacer = _create_spacer()
+        created.append(spacer)
+        return spacer
+
+    spacer_pool.factory = factory
+    spacer_pool.created = created
+    yield spacer_pool
+    spacer_pool.factory = _create_spacer
+    spacer_pool.max_idle = 8
+    del spacer_pool.created
+
+
+def _build(driver, classes, n):
+    '''Two vertical reorderables side by side. The left one has ``n`` items, and the right one is empty.'''
+    return build_columns(driver, classes, [str(i) for i in range(n)], [])
+
+
+def _drag_all(driver, items, dest):
+    touches = [driver.touch_down(*item.center) for item in items]
+    driver.advance()
+    for t in touches:
+        driver.touch_move(t, dest.center_x, t.y)
+    driver.advance()
+    return touches
+
+
+def test_no_spacer_until_the_first_drag(driver, classes, pool):
+    Item, Reorderable = classes
+    rs = [Reorderable(drag_classes=['test']) for __ in range(500)]
+    driver.advance()
+    assert all(r.spacer_widgets == [] for r in rs)
+    assert pool.created == []
+
+
+def test_many_drags_over_a_reorderable(driver, classes, pool):
+    left, right = _build(driver, classes, 5)
+    items = left.children[:]
+    touches = _drag_all(driver, items, right)
+    assert len(right._active_spacers) == 5
+    assert len(pool.created) == 5
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert sorted(c.text for c in right.children) == sorted(item.text for item in items)
+    assert len(pool) == 5
+
+    # The spacers get reused.
+    touches = _drag_all(driver, items, left)
+    assert len(left._active_spacers) == 5
+    assert len(pool.created) == 5
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert len(left.children) == 5
+
+
+def test_max_idle(driver, classes, pool):
+    pool.max_idle = 2
+    left, right = _build(driver, classes, 5)
+    touches = _drag_all(driver, left.children[:], right)
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert len(pool) == 2
+    pool.max_idle = 1
+    assert len(pool) == 1
+    with pytest.raises(ValueError):
+        pool.max_idle = -1
+
+
+def test_own_spacers_come_first(driver, classes, pool):
+    from kivy.uix.widget import Widget
+    left, right = _build(driver, classes, 3)
+    own = Widget()
+    right.spacer_widgets = [own]
+    touches = _drag_all(driver, left.children[:], right)
+    assert own in right._active_spacers
+    assert len(right._active_spacers) == 3
+    # The left one has lent three of them to the drags, and has given them back.
+    assert len(pool.created) == 3
+    for t in touches:
+        driver.touch_up(t)
+    driver.advance(1)
+    assert own.parent is None
+    assert len(pool) == 3
+    assert right._inactive_spacers == [own]
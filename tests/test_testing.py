@@ -0,0 +1,125 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Draggable(F.KXDraggableBehavior, F.Widget):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        pass
+
+    return (Draggable, Reorderable, )
+
+
+def _build(driver, classes, n=3):
+    from kivy.uix.boxlayout import BoxLayout
+    Draggable, Reorderable = classes
+    root = BoxLayout()
+    r1 = Reorderable(drag_classes=['test'], orientation='vertical')
+    r2 = Reorderable(drag_classes=['test'], orientation='vertical')
+    for i in range(n):
+        r1.add_widget(Draggable(drag_cls='test', drag_timeout=0))
+    root.add_widget(r1)
+    root.add_widget(r2)
+    driver.window.add_widget(root)
+    driver.advance()
+    return (r1, r2, )
+
+
+def test_virtual_time(driver):
+    from kivy.clock import Clock
+    called = []
+    t = driver.time
+    Clock.schedule_once(lambda dt: called.append(driver.time), 10)
+    driver.advance(9.9)
+    assert not called
+    driver.advance(.1)
+    assert called == [pytest.approx(t + 10)]
+
+
+def test_close_restores_the_clock():
+    from time import perf_counter
+    from kivy.clock import Clock
+    from kivy_garden.draggable.testing import TouchDriver
+    driver = TouchDriver()
+    driver.advance(1000)
+    assert Clock.time() == driver.time
+    driver.close()
+    driver.close()
+    assert abs(Clock.time() - perf_counter()) < 100
+
+
+@pytest.mark.parametrize('coalesce', (False, True, ))
+def test_drag_succeed(driver, classes, coalesce):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    w.drag_coalesce_moves = coalesce
+    events = []
+    w.bind(on_drag_succeed=lambda *args: events.append('succeed'), on_drag_fail=lambda *args: events.append('fail'))
+    driver.drag(linear_path(w.center, r2.center, 10))
+    driver.advance(1)
+    assert events == ['succeed']
+    assert w.parent is r2
+    assert len(r1.children) == 2
+
+
+def test_drag_fail(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    pos = tuple(w.pos)
+    driver.drag(linear_path(w.center, (w.center_x, w.center_y + 1000), 10))
+    assert w.is_being_dragged
+    driver.advance(1)
+    assert not w.is_being_dragged
+    assert w.parent is r1
+    assert r1.children.index(w) == 1
+    assert tuple(w.pos) == pos
+
+
+@pytest.mark.parametrize('hold, expects_a_drag', [(.5, False), (1., True)])
+def test_drag_timeout(driver, classes, hold, expects_a_drag):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    w.drag_timeout = 800
+    events = []
+    w.bind(on_drag_start=lambda *args: events.append('start'))
+    driver.drag(linear_path(w.center, r2.center, 10), hold=hold)
+    driver.advance(1)
+    assert events == (['start'] if expects_a_drag else [])
+
+
+def test_ongoing_drags(driver, classes):
+    from kivy_garden.draggable import ongoing_drags, cancel_drags
+    r1, r2 = _build(driver, classes)
+    w = r1.children[1]
+    t = driver.touch_down(*w.center)
+    driver.touch_move(t, *r2.center)
+    driver.advance()
+    assert ongoing_drags(window=driver.window) == [w]
+    assert ongoing_drags(window=driver.window, droppable=r2) == [w]
+    assert ongoing_drags(window=driver.window, droppable=r1) == []
+    cancel_drags(window=driver.window)
+    assert ongoing_drags(window=driver.window) == []
+    driver.touch_up(t)
+    driver.advance()
+    assert w.parent is r1
+
+
+def test_simultaneous_drags(driver, classes):
+    from kivy_garden.draggable.testing import linear_path
+    r1, r2 = _build(driver, classes)
+    w1, w2 = r1.children[:2]
+    driver.drag_simultaneously([
+        linear_path(w1.center, r2.center, 10),
+        linear_path(w2.center, (r2.center_x, r2.center_y + 10), 10),
+    ])
+    driver.advance(1)
+    assert w1.parent is r2
+    assert w2.parent is r2
@@ -0,0 +1,103 @@
+import pytest
+
+
+def _create_trace():
+    from array import array
+    from kivy_garden.draggable.trace import TouchTrace, BEGIN, UPDATE, END
+    return TouchTrace(
+        array('d', [10., 10.1, 10.2, 10.2, 10.3, 10.4]),
+        array('f', [.25, .5, .75, .1, .1, .1]),
+        array('f', [.5, .5, .5, .9, .9, .9]),
+        array('I', [1, 1, 1, 2, 2, 2]),
+        array('B', [BEGIN, UPDATE, END, BEGIN, UPDATE, END]),
+        window_size=(801, 601),
+    )
+
+
+@pytest.mark.parametrize('use_mmap', (True, False, ))
+def test_save_and_load(tmp_path, use_mmap):
+    from kivy_garden.draggable.trace import save_trace, load_trace
+    trace = _create_trace()
+    path = tmp_path / 'a.kxtrace'
+    save_trace(trace, path)
+    assert path.stat().st_size == 32 + 21 * len(trace)
+    with load_trace(path, use_mmap=use_mmap) as loaded:
+        assert len(loaded) == 6
+        assert loaded.window_size == (801, 601)
+        assert loaded.n_touches == 2
+        assert loaded.duration == pytest.approx(.4)
+        for name in ('times', 'xs', 'ys', 'touch_ids', 'etypes', ):
+            assert list(getattr(loaded, name)) == list(getattr(trace, name))
+        if use_mmap:
+            assert isinstance(loaded.times, memoryview)
+    if use_mmap:
+        assert len(loaded) == 0
+
+
+def test_load_invalid_file(tmp_path):
+    from kivy_garden.draggable.trace import save_trace, load_trace
+    path = tmp_path / 'a.kxtrace'
+    path.write_bytes(b'not a trace' * 10)
+    with pytest.raises(ValueError):
+        load_trace(path)
+    save_trace(_create_trace(), path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        load_trace(path)
+    with pytest.raises(ValueError):
+        load_trace(path, use_mmap=False)
+
+
+def test_record():
+    from kivy.base import EventLoop
+    from kivy.tests.common import UnitTestTouch
+    from kivy_garden.draggable.trace import TouchRecorder, BEGIN, UPDATE, END
+    recorder = TouchRecorder()
+    recorder.start()
+    try:
+        touch = UnitTestTouch(100, 100)
+        EventLoop.post_dispatch_input('begin', touch)
+        touch.move({'x': .5, 'y': .5})
+        EventLoop.post_dispatch_input('update', touch)
+        EventLoop.post_dispatch_input('end', touch)
+    finally:
+        recorder.stop()
+    trace = recorder.trace
+    assert list(trace.etypes) == [BEGIN, UPDATE, END]
+    assert list(trace.xs)[1:] == [.5, .5]
+    assert len(set(trace.touch_ids)) == 1
+    assert not recorder.is_recording
+    assert recorder not in EventLoop.event_listeners
+
+
+def test_replay():
+    from kivy.factory import Factory as F
+    from kivy_garden.draggable.testing import TouchDriver, VirtualWindow
+    from kivy_garden.draggable.trace import replay_trace
+    received = []
+
+    class Receiver(F.Widget):
+        def on_touch_down(self, touch):
+            received.append(('down', touch.uid, touch.x, touch.y))
+
+        def on_touch_move(self, touch):
+            received.append(('move', touch.uid, touch.x, touch.y))
+
+        def on_touch_up(self, touch):
+            received.append(('up', touch.uid, touch.x, touch.y))
+
+    with TouchDriver(window=VirtualWindow(size=(801, 601)), fps=10) as driver:
+        driver.window.add_widget(Receiver())
+        frame_times = replay_trace(_create_trace(), driver)
+    assert len(frame_times) == 5
+    uid1 = received[0][1]
+    uid2 = received[3][1]
+    assert uid1 != uid2
+    assert received == [
+        ('down', uid1, 200, 300),
+        ('move', uid1, 400, 300),
+        ('up', uid1, 600, 300),
+        ('down', uid2, pytest.approx(80), pytest.approx(540)),
+        ('move', uid2, pytest.approx(80), pytest.approx(540)),
+        ('up', uid2, pytest.approx(80), pytest.approx(540)),
+    ]
@@ -0,0 +1,99 @@
+import pytest
+
+from conftest import build_columns, texts, walk_window
+
+
+@pytest.fixture(scope='module')
+def classes():
+    from kivy.factory import Factory as F
+    import kivy_garden.draggable
+
+    class Item(F.KXDraggableBehavior, F.Label):
+        pass
+
+    class Reorderable(F.KXReorderableBehavior, F.BoxLayout):
+        n_layouts = 0
+
+        def do_layout(self, *args, **kwargs):
+            self.n_layouts += 1
+            super().do_layout(*args, **kwargs)
+
+    return (Item, Reorderable, )
+
+
+def _items(layout, texts):
+    d = {c.text: c for c in layout.children}
+    return [d[t] for t in texts]
+
+
+def test_transfer(driver, classes):
+    r1, r2, r3 = build_columns(driver, classes, [str(i) for i in range(50)], ['a', 'b'], ['x', 'y'])
+    widgets = _items(r1, [str(i) for i in range(0, 50, 2)]) + _items(r2, ['b'])
+    for r in (r1, r2, r3):
+        r.n_layouts = 0
+    assert r3.transfer_widgets(widgets, index=1) is None
+    assert texts(r3) == ['x', *(str(i) for i in range(0, 50, 2)), 'b', 'y']
+    assert texts(r1) == [str(i) for i in range(1, 50, 2)]
+    assert texts(r2) == ['a']
+    driver.advance()
+    n_layouts = [r.n_layouts for r in (r1, r2, r3)]
+    driver.advance(1)
+    assert [r.n_layouts for r in (r1, r2, r3)] == n_layouts
+    assert all(0 < n <= 2 for n in n_layouts)
+
+
+@pytest.mark.parametrize('index, expected', [
+    (0, ['0', '4', '1', '2', '3']),
+    (2, ['0', '1', '2', '3', '4']),
+    (5, ['1', '2', '3', '0', '4']),
+])
+def test_within_the_same_reorderable(driver, classes, index, expected):
+    '''The ``index`` counts the children, which the layout shows in the reverse order.'''
+    r1, = build_columns(driver, classes, ['0', '1', '2', '3', '4'])
+    r1.transfer_widgets(_items(r1, ['1', '2', '3']), index=index)
+    assert texts(r1) == expected
+
+
+def test_widgets_being_dragged(driver, classes):
+    r1, r2 = build_columns(driver, classes, ['0', '1'], [])
+    w, = _items(r1, ['0'])
+    t = driver.touch_down(*w.center)
+    driver.touch_move(t, w.center_x + 10, w.center_y)
+    driver.advance()
+    assert w.is_being_dragged
+    r2.transfer_widgets([w])
+    assert not w.is_being_dragged
+    assert w.parent is r2
+    driver.touch_up(t)
+    driver.advance(1)
+    assert w.parent is r2
+
+
+def test_animation(driver, classes):
+    from kivy_garden.draggable._proxy import _DragProxy
+    r1, r2 = build_columns(driver, classes, ['0', '1'], ['a'])
+    widgets = _items(r1, ['0', '1'])
+    old_positions = [tuple(w.to_window(*w.pos)) for w in widgets]
+    task = r2.transfer_widgets(widgets, anim_duration=.5)
+    proxies = [c for c in walk_window(driver.window) if isinstance(c, _DragProxy)]
+    assert len(proxies) == 2
+    assert sorted(tuple(p.pos) for p in proxies) == sorted(old_positions)
+    assert all(w.parent is r2 and w.opacity == 0 for w in widgets)
+    driver.advance(.2)
+    assert not task.finished
+    driver.advance(.5)
+    assert task.finished
+    assert all(p.parent is None for p in proxies)
+    assert all(w.opacity == 1 for w in widgets)
+    assert sorted(tuple(p.pos) for p in proxies) == sorted(tuple(w.to_window(*w.pos)) for w in widgets)
+
+
+def test_cancel_animation(driver, classes):
+    from kivy_garden.draggable._proxy import _DragProxy
+    r1, r2 = build_columns(driver, classes, ['0', '1'], ['a'])
+    widgets = _items(r1, ['0', '1'])
+    task = r2.transfer_widgets(widgets, anim_duration=.5)
+    driver.advance(.2)
+    task.cancel()
+    assert not any(isinstance(c, _DragProxy) for c in walk_window(driver.window))
+    assert all(w.opacity == 1 for w in widgets)
@@ -96,3 +96,25 @@ def test_parent_is_not_none(state_factory, ignore_parent, has_parent):
     else:
         assert w.parent is prev_parent
         assert prev_parent.children.index(w) == 0
+
+
+def test_restore_from_save_widget_state():
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable import save_widget_state, restore_widget_state
+    parent = Widget()
+    w = Widget(pos=(1, 2), size=(3, 4), size_hint=(.5, None), pos_hint={'center': [.5, .5]})
+    parent.add_widget(w)
+    parent.add_widget(Widget())
+    state = save_widget_state(w)
+    parent.remove_widget(w)
+    w.pos = w.size = (0, 0)
+    w.size_hint = (1, 1)
+    w.pos_hint = {}
+    restore_widget_state(w, state)
+    assert w.parent is parent
+    assert parent.children.index(w) == 1
+    assert w.pos == [1, 2]
+    assert w.size == [3, 4]
+    assert w.size_hint == [.5, None]
+    assert w.pos_hint == {'center': [.5, .5]}
+    assert w.pos_hint is not state['pos_hint']
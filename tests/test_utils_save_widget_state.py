@@ -50,3 +50,34 @@ def test_pos_hint_is_deepcopied(ignore_parent):
     state['pos_hint']['center'][0] = 0
     state['pos_hint']['x'] = 0
     assert w.pos_hint == {'center': [.5, .5, ], }
+
+
+def test_behaves_like_a_dict():
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable import save_widget_state
+    state = save_widget_state(Widget())
+    assert 'index' not in state
+    assert state.get('index', 'default') == 'default'
+    with pytest.raises(KeyError):
+        state['index']
+    state['index'] = 3
+    state['extra'] = 'value'
+    assert state['index'] == 3
+    assert state['extra'] == 'value'
+    assert len(state) == len(dict(state)) == 14
+    del state['extra']
+    del state['parent']
+    assert 'extra' not in state
+    assert 'parent' not in state
+    with pytest.raises(KeyError):
+        del state['parent']
+
+
+@pytest.mark.parametrize('pos_hint', ({'x': .1, 'top': 1}, {'center': (.5, .5)}, {'center': [.5, {}]}))
+def test_pos_hint_of_various_shapes(pos_hint):
+    from kivy.uix.widget import Widget
+    from kivy_garden.draggable import save_widget_state
+    w = Widget(pos_hint=pos_hint)
+    state = save_widget_state(w)
+    assert state['pos_hint'] == pos_hint
+    assert state['pos_hint'] is not w.pos_hint